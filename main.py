@@ -33,6 +33,11 @@ async def startup_tasks():
         logger.info("Auto-registering platforms...")
         auto_register_platforms()
         
+        # 预加载jieba词典，避免首个请求承担词典加载延迟
+        logger.info("Warming up jieba dictionary...")
+        import jieba
+        await asyncio.to_thread(jieba.initialize)
+        
         logger.info("Startup tasks completed successfully")
         
     except Exception as e:
@@ -49,6 +54,11 @@ async def startup_event():
 async def shutdown_event():
     """应用关闭事件"""
     logger.info("Shutting down Web3 TGE Monitor API...")
+    
+    # 知乎适配器被加载过时关闭其共享的HTTP客户端
+    zhihu_adapter = sys.modules.get("crawler.platforms.mediacrawler_zhihu_adapter")
+    if zhihu_adapter is not None:
+        await zhihu_adapter.close_shared_http_client()
 
 if __name__ == "__main__":
     import uvicorn
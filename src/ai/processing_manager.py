@@ -328,8 +328,9 @@ AI处理流程管理器
             session = await get_db_session()
             async with session:
                 # 统计已处理和未处理的内容
-                total_projects = await TGEProjectCRUD.count_all(session)
-                processed_projects = await TGEProjectCRUD.count_processed(session)
+                stats = await TGEProjectCRUD.get_statistics(session)
+                total_projects = stats['total_projects']
+                processed_projects = stats['processed_projects']
                 unprocessed_projects = total_projects - processed_projects
                 
                 return {
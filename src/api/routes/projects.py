@@ -15,7 +15,7 @@ from ..models import (
     success_response, error_response, paginated_response
 )
 from ...database.database import get_db_session
-from ...database.crud import TGEProjectCRUD
+from ...database.crud import TGEProjectCRUD, SUMMARY_COLUMNS
 from ..dependencies import get_db
 
 logger = structlog.get_logger()
@@ -84,7 +84,8 @@ async def get_projects(
             size=size,
             filters=filters,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            columns=SUMMARY_COLUMNS
         )
 
         # 转换为响应模型
@@ -268,7 +269,8 @@ async def search_projects(
             query=query,
             page=page,
             size=size,
-            filters=filters
+            filters=filters,
+            columns=SUMMARY_COLUMNS
         )
 
         # 转换为响应模型
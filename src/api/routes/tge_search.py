@@ -16,7 +16,7 @@ from ..models import ApiResponse, success_response, error_response
 from ..dependencies import get_db
 from ...crawler.crawler_manager import CrawlerManager
 from ...crawler.platform_factory import PlatformFactory
-from ...crawler.models import Platform
+from ...crawler.models import Platform, RawContent
 from ...ai.ai_client import AIClient
 from ...database.crud import TGEProjectCRUD
 from ...database.models import TGEProject
@@ -87,11 +87,11 @@ async def search_tge_projects(
                    platforms=request.platforms)
         
         # 1. 执行多平台爬取
-        all_crawled_content = []
         crawl_stats = {}
         detailed_errors = {}  # 收集详细错误信息
         
-        for platform_name in request.platforms:
+        async def crawl_platform(platform_name: str) -> List[RawContent]:
+            """爬取单个平台，失败时记录统计和错误信息并返回空列表"""
             try:
                 logger.info(f"Starting crawl for platform: {platform_name}")
                 
@@ -101,20 +101,20 @@ async def search_tge_projects(
                 except ValueError:
                     logger.warning(f"Unknown platform: {platform_name}")
                     crawl_stats[platform_name] = {"status": "unknown_platform", "count": 0}
-                    continue
+                    return []
                 
                 # 创建平台爬虫实例
                 platform_crawler = await PlatformFactory.create_platform(platform_enum)
                 if not platform_crawler:
                     logger.warning(f"Platform not available: {platform_name}")
                     crawl_stats[platform_name] = {"status": "unavailable", "count": 0}
-                    continue
+                    return []
                 
                 # 检查平台是否可用
                 if not await platform_crawler.is_available():
                     logger.warning(f"Platform not available: {platform_name}")
                     crawl_stats[platform_name] = {"status": "unavailable", "count": 0}
-                    continue
+                    return []
                 
                 # 执行爬取
                 crawled_content = await platform_crawler.crawl(
@@ -122,7 +122,6 @@ async def search_tge_projects(
                     max_count=request.max_count
                 )
                 
-                all_crawled_content.extend(crawled_content)
                 crawl_stats[platform_name] = {
                     "status": "success", 
                     "count": len(crawled_content)
@@ -130,6 +129,7 @@ async def search_tge_projects(
                 
                 logger.info(f"Crawl completed for {platform_name}",
                            count=len(crawled_content))
+                return crawled_content
                 
             except Exception as e:
                 import traceback
@@ -170,7 +170,14 @@ async def search_tge_projects(
                 logger.error(f"Crawl failed for platform {platform_name}", 
                            error=str(e), error_type=type(e).__name__)
                 crawl_stats[platform_name] = {"status": "error", "count": 0, "error": str(e)}
-                continue
+                return []
+        
+        # 各平台爬取互不依赖，并发执行：MediaCrawler工作目录锁只在切换目录、导入模块和启动浏览器时持有，
+        # 各平台的页面访问、登录和搜索请求相互重叠；结果按请求中的平台顺序合并
+        platform_contents = await asyncio.gather(*(
+            crawl_platform(platform_name) for platform_name in request.platforms
+        ))
+        all_crawled_content = [content for contents in platform_contents for content in contents]
         
         # 移除内容检查，让底层异常直接传播
         # if not all_crawled_content:
@@ -476,10 +483,9 @@ async def realtime_search(
                 timeout=120  # 实时搜索使用较短超时
             )
             
-            # 复用现有的爬取逻辑
-            all_crawled_content = []
-            
-            for platform_name in platform_list:
+            # 复用现有的爬取逻辑，各平台并发执行
+            async def crawl_platform(platform_name: str) -> List[RawContent]:
+                """实时爬取单个平台，失败或缓存已足够时返回空列表"""
                 try:
                     # 检查该平台是否已有足够的缓存结果
                     platform_cached_count = len([
@@ -489,7 +495,7 @@ async def realtime_search(
                     
                     if platform_cached_count >= remaining_count // len(platform_list):
                         crawl_stats[platform_name] = {"status": "skipped_cache_sufficient", "count": 0}
-                        continue
+                        return []
                     
                     # 转换平台名称为枚举
                     try:
@@ -497,20 +503,20 @@ async def realtime_search(
                     except ValueError:
                         logger.warning(f"Unknown platform: {platform_name}")
                         crawl_stats[platform_name] = {"status": "unknown_platform", "count": 0}
-                        continue
+                        return []
                     
                     # 创建平台爬虫实例
                     platform_crawler = await PlatformFactory.create_platform(platform_enum)
                     if not platform_crawler:
                         logger.warning(f"Platform not available: {platform_name}")
                         crawl_stats[platform_name] = {"status": "unavailable", "count": 0}
-                        continue
+                        return []
                     
                     # 检查平台是否可用
                     if not await platform_crawler.is_available():
                         logger.warning(f"Platform not available: {platform_name}")
                         crawl_stats[platform_name] = {"status": "unavailable", "count": 0}
-                        continue
+                        return []
                     
                     # 执行爬取
                     crawled_content = await platform_crawler.crawl(
@@ -518,7 +524,6 @@ async def realtime_search(
                         max_count=remaining_count // len(platform_list) + 1
                     )
                     
-                    all_crawled_content.extend(crawled_content)
                     crawl_stats[platform_name] = {
                         "status": "success", 
                         "count": len(crawled_content)
@@ -526,6 +531,7 @@ async def realtime_search(
                     
                     logger.info(f"Realtime crawl completed for {platform_name}",
                                count=len(crawled_content))
+                    return crawled_content
                     
                 except Exception as e:
                     import traceback
@@ -541,7 +547,12 @@ async def realtime_search(
                     logger.error(f"Realtime crawl failed for platform {platform_name}", 
                                error=str(e), error_type=type(e).__name__)
                     crawl_stats[platform_name] = {"status": "error", "count": 0, "error": str(e)}
-                    continue
+                    return []
+            
+            platform_contents = await asyncio.gather(*(
+                crawl_platform(platform_name) for platform_name in platform_list
+            ))
+            all_crawled_content = [content for contents in platform_contents for content in contents]
             
             # 快速AI分析新爬取的内容
             if all_crawled_content:
@@ -18,6 +18,8 @@ class Settings(BaseSettings):
     mysql_user: str = "root"
     mysql_password: str = "123456"
     mysql_db: str = "web3_tge_monitor"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
     
     # AI API配置
     ai_api_base_url: str = "api.gpt.ge"
@@ -37,6 +39,7 @@ class Settings(BaseSettings):
     redis_port: int = 6379
     redis_password: str = ""
     redis_db: int = 0
+    stats_cache_ttl: int = 30  # 统计结果缓存秒数，0表示禁用
     
     # MediaCrawler配置
     mediacrawler_path: str = "./external/MediaCrawler"
@@ -2,14 +2,77 @@
 爬虫平台基类
 定义统一的接口规范
 """
+import asyncio
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import Iterable, List, Dict, Any, Optional, Set
 import structlog
 
 from .models import RawContent, CrawlTask, CrawlResult, Platform
 
 logger = structlog.get_logger()
 
+# MediaCrawler依赖相对路径和全局config模块，工作目录是进程级共享状态；
+# 各平台并发爬取时用此锁串行化切换目录的区间。按持有锁的任务判断重入：
+# 锁内创建的子任务是不同的任务，必须等待锁释放，不能借用父任务的持有状态
+_workdir_lock = asyncio.Lock()
+_workdir_owner: Optional[asyncio.Task] = None
+_workdir_depth = 0
+
+
+async def acquire_mediacrawler_workdir() -> str:
+    """
+    获取MediaCrawler工作目录锁，同一任务内可重入
+    
+    Returns:
+        当前工作目录，需原样传给 release_mediacrawler_workdir 以便恢复
+    """
+    global _workdir_owner, _workdir_depth
+    
+    task = asyncio.current_task()
+    if _workdir_owner is not task:
+        await _workdir_lock.acquire()
+        _workdir_owner = task
+    _workdir_depth += 1
+    return os.getcwd()
+
+
+def release_mediacrawler_workdir(original_cwd: str) -> None:
+    """恢复工作目录，持有任务的最外层调用时释放工作目录锁"""
+    global _workdir_owner, _workdir_depth
+    
+    _workdir_depth -= 1
+    try:
+        os.chdir(original_cwd)
+    finally:
+        if _workdir_depth == 0:
+            _workdir_owner = None
+            _workdir_lock.release()
+
+
+# 已确认存在的MediaCrawler文件；安装目录在运行期间不会被删除，只缓存存在的结果，
+# 缺失的文件在后续检查中仍会重新探测
+_existing_mediacrawler_files: Set[str] = set()
+
+
+def find_missing_mediacrawler_file(required_files: Iterable[Path]) -> Optional[Path]:
+    """
+    检查MediaCrawler必需文件
+    
+    Returns:
+        第一个不存在的文件，全部存在时返回None
+    """
+    for required_file in required_files:
+        key = str(required_file)
+        if key in _existing_mediacrawler_files:
+            continue
+        if not required_file.exists():
+            return required_file
+        _existing_mediacrawler_files.add(key)
+    return None
+
 
 class AbstractPlatform(ABC):
     """抽象平台基类"""
@@ -120,6 +183,28 @@ class AbstractPlatform(ABC):
         """
         raise NotImplementedError("Subclasses must implement transform_to_raw_content")
     
+    def _restore_mediacrawler_keywords(self, config_file_path: Optional[str], original_keywords: Optional[str]) -> None:
+        """
+        恢复爬取前临时修改的MediaCrawler关键词配置
+        
+        配置文件由各平台共享，需在持有工作目录锁时调用
+        """
+        try:
+            if original_keywords is not None and config_file_path and os.path.exists(config_file_path):
+                with open(config_file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                
+                # 恢复原始关键词
+                pattern = r'KEYWORDS\s*=\s*"([^"]*)"'
+                restored_content = re.sub(pattern, f'KEYWORDS = "{original_keywords}"', content)
+                
+                with open(config_file_path, 'w', encoding='utf-8') as f:
+                    f.write(restored_content)
+                
+                self.logger.info("Restored original MediaCrawler keywords", keywords=original_keywords)
+        except Exception as e:
+            self.logger.warning("Failed to restore original keywords", error=str(e))
+    
     def get_rate_limit_config(self) -> Dict[str, Any]:
         """获取速率限制配置"""
         return self.config.get('rate_limit', {
@@ -168,12 +168,14 @@ class CrawlerManager:
         """
         processed = []
         
-        for content in contents:
-            # 去重检查
-            content_text = f"{content.title} {content.content}"
-            content_hash = deduplication_service.generate_content_hash(content_text)
-            
-            if deduplication_service.is_duplicate_by_hash(content_hash):
+        # 批量去重检查
+        content_texts = [f"{content.title} {content.content}" for content in contents]
+        duplicate_mask = deduplication_service.is_duplicate_by_hash_many(
+            [deduplication_service.generate_content_hash(text) for text in content_texts]
+        )
+        
+        for content, content_text, is_duplicate in zip(contents, content_texts, duplicate_mask):
+            if is_duplicate:
                 logger.debug("Duplicate content skipped", content_id=content.content_id)
                 continue
             
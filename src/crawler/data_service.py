@@ -10,7 +10,7 @@ import structlog
 from ..database.database import get_db_session
 from ..database.crud import TGEProjectCRUD, CrawlerLogCRUD
 from ..utils.deduplication import deduplication_service
-from ..utils.text_processing import process_raw_content
+from ..utils.text_processing import process_raw_content, process_raw_content_many
 from .models import RawContent, CrawlResult, Platform
 
 logger = structlog.get_logger()
@@ -40,18 +40,18 @@ class CrawlDataService:
         start_time = datetime.utcnow()
         
         try:
-            # 处理每个内容项
-            for content in result.contents:
+            # 批量执行CPU密集的文本处理，避免逐条阻塞事件循环
+            processed_batch = await process_raw_content_many(
+                [f"{content.title} {content.content}" for content in result.contents]
+            )
+            
+            # 构建每个内容项的数据库记录
+            projects_data = []
+            for content, processed_data in zip(result.contents, processed_batch):
                 stats['total_processed'] += 1
                 
                 try:
-                    # 处理单个内容项
-                    success = await self._process_single_content(content)
-                    if success:
-                        stats['successfully_saved'] += 1
-                    else:
-                        stats['duplicates_skipped'] += 1
-                        
+                    projects_data.append(self._build_project_data(content, processed_data))
                 except Exception as e:
                     stats['errors'] += 1
                     logger.error("Failed to process content",
@@ -59,6 +59,21 @@ class CrawlDataService:
                                platform=content.platform.value,
                                error=str(e))
             
+            # 整批写入数据库，只提交一次；已存在及批内重复的内容hash会被跳过
+            if projects_data:
+                try:
+                    session = await get_db_session()
+                    async with session:
+                        inserted = await TGEProjectCRUD.create_many(session, projects_data)
+                    stats['successfully_saved'] = inserted
+                    stats['duplicates_skipped'] = len(projects_data) - inserted
+                except Exception as e:
+                    stats['errors'] += len(projects_data)
+                    logger.error("Failed to save contents",
+                               task_id=result.task_id,
+                               count=len(projects_data),
+                               error=str(e))
+            
             # 记录爬虫运行日志
             await self._log_crawl_execution(result, stats)
             
@@ -78,86 +93,57 @@ class CrawlDataService:
                         error=str(e))
             raise
     
-    async def _process_single_content(self, content: RawContent) -> bool:
+    def _build_project_data(self, content: RawContent,
+                            processed_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        处理单个内容项
+        构建单个内容项的数据库记录
         
         Args:
             content: 原始内容
+            processed_data: 已完成的文本处理结果，未提供时就地处理
             
         Returns:
-            是否成功保存（False表示重复跳过）
+            TGE项目记录数据
         """
-        try:
-            # 1. 文本处理和信息提取
-            full_text = f"{content.title} {content.content}"
+        # 1. 文本处理和信息提取
+        full_text = f"{content.title} {content.content}"
+        if processed_data is None:
             processed_data = process_raw_content(full_text, extract_info=True)
+        
+        # 2. 生成内容hash用于去重
+        content_hash = deduplication_service.generate_content_hash(full_text)
+        
+        # 3. 提取项目信息
+        tge_info = processed_data.get('tge_info', {})
+        project_name = (
+            tge_info.get('project_name') or 
+            self._extract_project_name_from_title(content.title) or
+            f"{content.platform.value}_{content.content_id}"
+        )
+        
+        # 4. 构建数据库记录
+        return {
+            'project_name': project_name,
+            'content_hash': content_hash,
+            'raw_content': full_text,
+            'source_platform': content.platform.value,
+            'source_url': content.source_url,
+            'source_user_id': content.author_id,
+            'source_username': content.author_name,
             
-            # 2. 生成内容hash用于去重
-            content_hash = deduplication_service.generate_content_hash(full_text)
-            
-            # 3. 检查是否重复
-            session = await get_db_session()
-            async with session:
-                existing = await TGEProjectCRUD.get_by_content_hash(session, content_hash)
-                if existing:
-                    logger.debug("Duplicate content skipped",
-                               content_id=content.content_id,
-                               existing_id=existing.id)
-                    return False
-            
-            # 4. 提取项目信息
-            tge_info = processed_data.get('tge_info', {})
-            project_name = (
-                tge_info.get('project_name') or 
-                self._extract_project_name_from_title(content.title) or
-                f"{content.platform.value}_{content.content_id}"
-            )
+            # TGE相关信息
+            'token_name': tge_info.get('project_name'),
+            'token_symbol': tge_info.get('token_symbol'),
+            'tge_date': tge_info.get('tge_date'),
+            'project_category': self._classify_project_category(processed_data),
             
-            # 5. 构建数据库记录
-            project_data = {
-                'project_name': project_name,
-                'content_hash': content_hash,
-                'raw_content': full_text,
-                'source_platform': content.platform.value,
-                'source_url': content.source_url,
-                'source_user_id': content.author_id,
-                'source_username': content.author_name,
-                
-                # TGE相关信息
-                'token_name': tge_info.get('project_name'),
-                'token_symbol': tge_info.get('token_symbol'),
-                'tge_date': tge_info.get('tge_date'),
-                'project_category': self._classify_project_category(processed_data),
-                
-                # 统计信息
-                'engagement_score': self._calculate_engagement_score(content),
-                'keyword_matches': self._get_keyword_matches(full_text),
-                
-                'is_processed': False,  # 等待AI处理
-                'is_valid': True
-            }
+            # 统计信息
+            'engagement_score': self._calculate_engagement_score(content),
+            'keyword_matches': self._get_keyword_matches(full_text),
             
-            # 6. 保存到数据库
-            session = await get_db_session()
-            async with session:
-                project = await TGEProjectCRUD.create(session, project_data)
-                if project:
-                    logger.info("Content saved to database",
-                               content_id=content.content_id,
-                               project_id=project.id,
-                               project_name=project.project_name)
-                    return True
-                else:
-                    logger.warning("Failed to save content - possible duplicate",
-                                 content_id=content.content_id)
-                    return False
-                    
-        except Exception as e:
-            logger.error("Error processing single content",
-                        content_id=content.content_id,
-                        error=str(e))
-            raise
+            'is_processed': False,  # 等待AI处理
+            'is_valid': True
+        }
     
     def _extract_project_name_from_title(self, title: str) -> Optional[str]:
         """从标题中提取项目名称"""
@@ -4,9 +4,24 @@
 """
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, field_validator
 from enum import Enum
 
+# 中文数量单位对应的倍数，按末尾字符查表
+_COUNT_UNIT_MULTIPLIERS = {'千': 1000, '万': 10000, '亿': 100000000}
+
+
+def parse_count_string(value: str) -> int:
+    """解析带中文单位或千分位的数量字符串（如'1.2万' -> 12000、'1,234' -> 1234），无法解析时返回0"""
+    value = value.strip().rstrip('+').replace(',', '')
+    multiplier = _COUNT_UNIT_MULTIPLIERS.get(value[-1:])
+    try:
+        if multiplier:
+            return int(float(value[:-1]) * multiplier)
+        return int(value) if value.isdigit() else 0
+    except ValueError:
+        return 0
+
 
 class ContentType(str, Enum):
     """内容类型枚举"""
@@ -95,7 +110,8 @@ class RawContent(BaseModel):
     source_keywords: List[str] = []
     crawl_batch_id: Optional[str] = None
     
-    @validator('publish_time', 'crawl_time', pre=True)
+    @field_validator('publish_time', 'crawl_time', mode='before')
+    @classmethod
     def parse_timestamp(cls, v):
         """解析时间戳"""
         if isinstance(v, int):
@@ -107,18 +123,12 @@ class RawContent(BaseModel):
                 return datetime.fromtimestamp(v)
         return v
     
-    @validator('like_count', 'comment_count', 'share_count', 'collect_count', pre=True)
+    @field_validator('like_count', 'comment_count', 'share_count', 'collect_count', mode='before')
+    @classmethod
     def parse_count(cls, v):
         """解析数量字段（处理中文数字如'1.2万'）"""
         if isinstance(v, str):
-            if '万' in v:
-                return int(float(v.replace('万', '')) * 10000)
-            elif '千' in v:
-                return int(float(v.replace('千', '')) * 1000)
-            elif v.isdigit():
-                return int(v)
-            else:
-                return 0
+            return parse_count_string(v)
         return v or 0
     
     def to_dict(self) -> Dict[str, Any]:
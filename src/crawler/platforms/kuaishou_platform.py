@@ -11,7 +11,11 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import structlog
 
-from ..base_platform import AbstractPlatform, PlatformError, PlatformUnavailableError
+from ..base_platform import (
+    AbstractPlatform, PlatformError, PlatformUnavailableError,
+    acquire_mediacrawler_workdir, release_mediacrawler_workdir,
+    find_missing_mediacrawler_file
+)
 from ..models import RawContent, Platform, ContentType
 
 logger = structlog.get_logger()
@@ -126,7 +130,7 @@ class KuaishouPlatform(AbstractPlatform):
     
     async def is_available(self) -> bool:
         """检查平台是否可用"""
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
         try:
             # 验证mediacrawler目录结构
             mediacrawler_path = Path(self.mediacrawler_path)
@@ -136,10 +140,10 @@ class KuaishouPlatform(AbstractPlatform):
                 mediacrawler_path / "base" / "base_crawler.py"
             ]
             
-            for required_file in required_files:
-                if not required_file.exists():
-                    self.logger.error("Required file not found", file=str(required_file))
-                    return False
+            missing_file = find_missing_mediacrawler_file(required_files)
+            if missing_file is not None:
+                self.logger.error("Required file not found", file=str(missing_file))
+                return False
             
             # 切换到mediacrawler目录以确保相对路径正确
             os.chdir(self.mediacrawler_path)
@@ -162,12 +166,12 @@ class KuaishouPlatform(AbstractPlatform):
             return False
         finally:
             # 恢复原工作目录
-            os.chdir(original_cwd)
+            release_mediacrawler_workdir(original_cwd)
     
     async def _get_kuaishou_client(self):
         """获取快手爬虫实例（延迟初始化）"""
         if self._kuaishou_client is None:
-            original_cwd = os.getcwd()
+            original_cwd = await acquire_mediacrawler_workdir()
             try:
                 # 切换到mediacrawler目录以确保相对路径正确
                 os.chdir(self.mediacrawler_path)
@@ -191,7 +195,7 @@ class KuaishouPlatform(AbstractPlatform):
                 raise PlatformError("kuaishou", f"Failed to initialize Kuaishou crawler: {str(e)}")
             finally:
                 # 恢复原工作目录
-                os.chdir(original_cwd)
+                release_mediacrawler_workdir(original_cwd)
         
         return self._kuaishou_client
     
@@ -212,7 +216,8 @@ class KuaishouPlatform(AbstractPlatform):
         Returns:
             爬取到的内容列表
         """
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         original_keywords = None
         config_file_path = None
         
@@ -257,6 +262,12 @@ class KuaishouPlatform(AbstractPlatform):
             except Exception as e:
                 self.logger.warning("Failed to update MediaCrawler keywords", error=str(e))
             
+            # 配置文件由各平台共享，恢复原始关键词后立即释放工作目录锁；
+            # 搜索只在导入模块、启动浏览器时再次短暂持有锁，网络请求和登录等待不占用锁
+            self._restore_mediacrawler_keywords(config_file_path, original_keywords)
+            release_mediacrawler_workdir(original_cwd)
+            workdir_locked = False
+            
             # 验证关键词
             validated_keywords = await self.validate_keywords(keywords)
             
@@ -300,36 +311,24 @@ class KuaishouPlatform(AbstractPlatform):
             else:
                 raise PlatformError("kuaishou", f"Crawl failed: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
-            
-            # 恢复原始关键词配置
-            try:
-                if original_keywords is not None and config_file_path and os.path.exists(config_file_path):
-                    with open(config_file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # 恢复原始关键词
-                    import re
-                    pattern = r'KEYWORDS\s*=\s*"([^"]*)"'
-                    restored_content = re.sub(pattern, f'KEYWORDS = "{original_keywords}"', content)
-                    
-                    with open(config_file_path, 'w', encoding='utf-8') as f:
-                        f.write(restored_content)
-                    
-                    self.logger.info("Restored original MediaCrawler keywords", keywords=original_keywords)
-            except Exception as e:
-                self.logger.warning("Failed to restore original keywords", error=str(e))
+            # 准备阶段出错时同样恢复原始关键词配置和工作目录
+            if workdir_locked:
+                self._restore_mediacrawler_keywords(config_file_path, original_keywords)
+                release_mediacrawler_workdir(original_cwd)
     
     async def _search_with_complete_mediacrawler(self, keywords: List[str], max_count: int) -> List[Dict[str, Any]]:
         """
         使用完整的MediaCrawler方式进行搜索，完全按照MediaCrawler的原生实现
         """
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         try:
             # 切换到mediacrawler目录
             os.chdir(self.mediacrawler_path)
             
+            # 准备阶段释放锁后config模块可能已被其他平台重新加载，导入前补齐缺失的配置
+            self._setup_mediacrawler_environment()
+            
             # 导入完整的MediaCrawler核心模块
             from media_platform.kuaishou.core import KuaishouCrawler
             from playwright.async_api import async_playwright
@@ -348,8 +347,10 @@ class KuaishouPlatform(AbstractPlatform):
                     chromium, None, kuaishou_crawler.user_agent, headless=config.HEADLESS
                 )
                 
-                # 添加初始化脚本
-                await kuaishou_crawler.browser_context.add_init_script(path="libs/stealth.min.js")
+                # 添加初始化脚本（使用绝对路径，不依赖工作目录）
+                await kuaishou_crawler.browser_context.add_init_script(
+                    path=os.path.join(self.mediacrawler_path, "libs", "stealth.min.js")
+                )
                 
                 # 创建页面
                 kuaishou_crawler.context_page = await kuaishou_crawler.browser_context.new_page()
@@ -358,6 +359,11 @@ class KuaishouPlatform(AbstractPlatform):
                 # 创建客户端
                 kuaishou_crawler.ks_client = await kuaishou_crawler.create_ks_client(None)
                 
+                # 客户端按工作目录加载GraphQL查询文件，创建完成后释放锁；
+                # 之后的登录和搜索请求不依赖工作目录，可与其他平台并发进行
+                release_mediacrawler_workdir(original_cwd)
+                workdir_locked = False
+                
                 # 检查登录状态
                 connection_test_passed = False
                 try:
@@ -488,8 +494,9 @@ class KuaishouPlatform(AbstractPlatform):
             self.logger.error("Complete MediaCrawler search failed", error=str(e))
             raise PlatformError("kuaishou", f"Complete MediaCrawler search failed: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
+            # 出错时锁可能尚未释放
+            if workdir_locked:
+                release_mediacrawler_workdir(original_cwd)
     
     async def transform_to_raw_content(self, kuaishou_data: Dict[str, Any]) -> RawContent:
         """
@@ -3,10 +3,12 @@ MediaCrawler知乎客户端适配器 - 完整集成版本
 使用Playwright浏览器自动化 + JS签名算法实现真正的MediaCrawler集成
 """
 import asyncio
+import importlib.util
 import sys
 import os
 import json
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import structlog
 
@@ -22,6 +24,100 @@ from crawler.platforms.zhihu_constants import (
 
 logger = structlog.get_logger()
 
+_ZHIHU_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
+
+# 签名请求的固定请求头，每次请求只需合并Cookie、XSRF和签名字段
+_SIGNED_HEADERS_BASE = {
+    "Accept": "*/*",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Host": "www.zhihu.com",
+    "Pragma": "no-cache",
+    "Referer": "https://www.zhihu.com/search?type=content",
+    "Sec-Ch-Ua": '"Not A;Brand";v="99", "Chromium";v="90", "Google Chrome";v="90"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+    "User-Agent": _ZHIHU_USER_AGENT,
+    "X-Api-Version": "3.0.91",
+    "X-App-Za": "OS=Web"
+}
+
+# 简化客户端搜索请求的固定请求头
+_SEARCH_HEADERS_BASE = {
+    "Accept": "*/*",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Host": "www.zhihu.com",
+    "User-Agent": _ZHIHU_USER_AGENT,
+    "X-Requested-With": "fetch"
+}
+
+# httpx的HTTP/2支持依赖可选的h2包
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 所有SimplifiedZhihuClient共享的HTTP客户端及其所属事件循环
+_shared_http_client = None
+_shared_http_client_loop = None
+
+
+@lru_cache(maxsize=None)
+def _compile_signature_js(js_path: str):
+    """读取并编译签名JS，同一路径在进程内只编译一次，供所有客户端共享"""
+    import execjs
+    
+    with open(js_path, 'r', encoding='utf-8') as f:
+        return execjs.compile(f.read())
+
+
+@lru_cache(maxsize=4)
+def _parse_cookie(cookie_string: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    解析 "k1=v1; k2=v2" 格式的Cookie字符串为 (名称, 值) 元组
+    
+    同一Cookie只解析一次；返回不可变元组以便安全缓存，需要字典时由调用方转换
+    """
+    return tuple(
+        (key.strip(), value.strip())
+        for key, value in (item.split('=', 1) for item in cookie_string.split(';') if '=' in item)
+    )
+
+
+@lru_cache(maxsize=4)
+def _extract_xsrf(cookie_string: str) -> str:
+    """从Cookie字符串中提取XSRF token"""
+    return dict(_parse_cookie(cookie_string)).get('_xsrf', "")
+
+
+def _get_shared_http_client():
+    """获取进程内共享的HTTP客户端，连接池跨客户端实例复用，事件循环变化时重建"""
+    global _shared_http_client, _shared_http_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if (_shared_http_client is None or _shared_http_client.is_closed
+            or _shared_http_client_loop is not loop):
+        import httpx
+        _shared_http_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+        _shared_http_client_loop = loop
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """关闭共享的HTTP客户端，应用关闭时调用"""
+    global _shared_http_client, _shared_http_client_loop
+    
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+    _shared_http_client_loop = None
+
 
 class MediaCrawlerZhihuAdapter:
     """MediaCrawler知乎客户端适配器 - 完整版本"""
@@ -146,17 +242,10 @@ class MediaCrawlerZhihuAdapter:
     
     def _parse_cookie_string(self, cookie_string: str) -> List[Dict[str, Any]]:
         """解析Cookie字符串为Playwright格式"""
-        cookies = []
-        for item in cookie_string.split(';'):
-            if '=' in item:
-                key, value = item.strip().split('=', 1)
-                cookies.append({
-                    'name': key,
-                    'value': value,
-                    'domain': '.zhihu.com',
-                    'path': '/'
-                })
-        return cookies
+        return [
+            {'name': key, 'value': value, 'domain': '.zhihu.com', 'path': '/'}
+            for key, value in dict(_parse_cookie(cookie_string)).items()
+        ]
     
     async def search_by_keyword(
         self, 
@@ -201,6 +290,8 @@ class MediaCrawlerZhihuAdapter:
                 await self._browser.close()
             if self._playwright:
                 await self._playwright.stop()
+            if isinstance(self._client, SimplifiedZhihuClient):
+                await self._client.close()
         except Exception as e:
             self.logger.warning(f"Error during cleanup: {e}")
 
@@ -219,13 +310,9 @@ class FullMediaCrawlerClient:
     def _init_signature_client(self):
         """初始化JS签名客户端"""
         try:
-            import execjs
-            
             zhihu_js_path = os.path.join(os.getcwd(), "libs", "zhihu.js")
             if os.path.exists(zhihu_js_path):
-                with open(zhihu_js_path, 'r', encoding='utf-8') as f:
-                    js_code = f.read()
-                self._signature_client = execjs.compile(js_code)
+                self._signature_client = _compile_signature_js(zhihu_js_path)
                 self.logger.info("JS signature client initialized")
             else:
                 self.logger.warning("zhihu.js not found, signature features disabled")
@@ -313,25 +400,7 @@ class FullMediaCrawlerClient:
     
     async def _generate_signed_headers(self, url: str) -> Dict[str, str]:
         """生成带签名的请求头"""
-        headers = {
-            "Accept": "*/*",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Cookie": self.cookie,
-            "Host": "www.zhihu.com",
-            "Pragma": "no-cache",
-            "Referer": "https://www.zhihu.com/search?type=content",
-            "Sec-Ch-Ua": '"Not A;Brand";v="99", "Chromium";v="90", "Google Chrome";v="90"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-origin",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
-            "X-Api-Version": "3.0.91",
-            "X-App-Za": "OS=Web"
-        }
+        headers = {**_SIGNED_HEADERS_BASE, "Cookie": self.cookie}
         
         # 添加XSRF token
         xsrf_token = self._extract_xsrf_token()
@@ -352,11 +421,7 @@ class FullMediaCrawlerClient:
     
     def _extract_xsrf_token(self) -> str:
         """从Cookie中提取XSRF token"""
-        if '_xsrf=' in self.cookie:
-            for part in self.cookie.split(';'):
-                if '_xsrf=' in part:
-                    return part.split('=')[1].strip()
-        return ""
+        return _extract_xsrf(self.cookie)
     
     def _convert_search_result(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """转换搜索结果到统一格式"""
@@ -414,6 +479,14 @@ class SimplifiedZhihuClient:
         self.cookie = cookie
         self.logger = logger
         self._base_url = ZHIHU_URL
+    
+    def _get_http_client(self):
+        """获取共享的HTTP客户端，多次请求及多个客户端实例复用连接"""
+        return _get_shared_http_client()
+    
+    async def close(self):
+        """释放客户端资源；共享HTTP客户端只在应用关闭时由 close_shared_http_client 统一关闭"""
+        pass
         
     async def search_content(
         self, 
@@ -423,7 +496,6 @@ class SimplifiedZhihuClient:
     ) -> List[Dict[str, Any]]:
         """搜索知乎内容 - 简化版本"""
         try:
-            import httpx
             import urllib.parse
             import random
             
@@ -446,14 +518,9 @@ class SimplifiedZhihuClient:
             
             # 构建请求头
             headers = {
-                "Accept": "*/*",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+                **_SEARCH_HEADERS_BASE,
                 "Cookie": self.cookie,
-                "Host": "www.zhihu.com",
-                "Referer": f"{self._base_url}/search?type=content&q={encoded_keyword}",
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
-                "X-Requested-With": "fetch"
+                "Referer": f"{self._base_url}/search?type=content&q={encoded_keyword}"
             }
             
             # 添加XSRF token
@@ -467,27 +534,26 @@ class SimplifiedZhihuClient:
             await asyncio.sleep(random.uniform(1, 3))
             
             # 发送请求
-            async with httpx.AsyncClient(timeout=30.0, verify=False) as client:
-                response = await client.get(url, params=params, headers=headers)
-                
-                if response.status_code == 200:
-                    try:
-                        result = response.json()
-                        data = result.get('data', [])
-                        
-                        converted_results = []
-                        for item in data:
-                            converted_item = self._convert_search_result(item)
-                            if converted_item:
-                                converted_results.append(converted_item)
-                        
-                        return converted_results
-                    except Exception as e:
-                        self.logger.error(f"Failed to parse response: {e}")
-                        return []
-                else:
-                    self.logger.warning(f"Request failed with status: {response.status_code}")
+            response = await self._get_http_client().get(url, params=params, headers=headers)
+            
+            if response.status_code == 200:
+                try:
+                    result = response.json()
+                    data = result.get('data', [])
+                    
+                    converted_results = []
+                    for item in data:
+                        converted_item = self._convert_search_result(item)
+                        if converted_item:
+                            converted_results.append(converted_item)
+                    
+                    return converted_results
+                except Exception as e:
+                    self.logger.error(f"Failed to parse response: {e}")
                     return []
+            else:
+                self.logger.warning(f"Request failed with status: {response.status_code}")
+                return []
                     
         except Exception as e:
             self.logger.error(f"Simplified search failed: {e}")
@@ -495,11 +561,7 @@ class SimplifiedZhihuClient:
     
     def _extract_xsrf_token(self) -> str:
         """从Cookie中提取XSRF token"""
-        if '_xsrf=' in self.cookie:
-            for part in self.cookie.split(';'):
-                if '_xsrf=' in part:
-                    return part.split('=')[1].strip()
-        return ""
+        return _extract_xsrf(self.cookie)
     
     def _convert_search_result(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """转换搜索结果"""
@@ -525,13 +587,11 @@ class SimplifiedZhihuClient:
     async def ping(self) -> bool:
         """检查连接状态"""
         try:
-            import httpx
-            
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self._base_url}/api/v4/me",
-                    headers={"Cookie": self.cookie}
-                )
-                return response.status_code in [200, 401, 403]
+            response = await self._get_http_client().get(
+                f"{self._base_url}/api/v4/me",
+                headers={"Cookie": self.cookie},
+                timeout=10.0
+            )
+            return response.status_code in [200, 401, 403]
         except Exception:
             return False
\ No newline at end of file
@@ -6,20 +6,61 @@ import os
 import sys
 import json
 import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 import structlog
 from datetime import datetime
 
+from ..base_platform import acquire_mediacrawler_workdir, release_mediacrawler_workdir
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # 加载.env文件
 from dotenv import load_dotenv
 load_dotenv()
 
+def _load_json_file(path: Path) -> Any:
+    """读取MediaCrawler输出的JSON文件，安装了orjson时直接解析原始字节"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _iter_json_items(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    逐条读取MediaCrawler输出的JSON数组
+    
+    安装了ijson时流式解析，调用方提前停止迭代即可不再读取文件剩余部分；
+    否则退回整体解析
+    """
+    if ijson is None:
+        yield from _load_json_file(path) or []
+        return
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+# 读取输出文件时视为数据损坏的异常
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+
 class MediaCrawlerZhihuIntegration:
     """MediaCrawler知乎集成层 - 基于验证的成功方案"""
     
     def __init__(self, mediacrawler_path: str, zhihu_cookie: str):
         self.mediacrawler_path = Path(mediacrawler_path)
+        # 绝对路径只解析一次，每次切换目录时直接复用
+        self.mediacrawler_abs_path = str(self.mediacrawler_path.resolve())
         self.zhihu_cookie = zhihu_cookie
         self.logger = structlog.get_logger(__name__)
         self.original_cwd = None
@@ -49,19 +90,23 @@ class MediaCrawlerZhihuIntegration:
         Returns:
             List[Dict]: 标准化的内容数据列表
         """
-        self.logger.info(f"Starting MediaCrawler zhihu search: keywords={keywords}, max_results={max_results}")
+        self.logger.info("Starting MediaCrawler zhihu search", keywords=keywords, max_results=max_results)
         
-        # 切换到MediaCrawler目录
-        self._switch_to_mediacrawler_dir()
+        # 完整的ZhihuCrawler运行全程依赖工作目录（签名脚本延迟加载、登录态目录、JSON结果按相对路径写入）
+        # 和运行时修改的全局config，读取结果也要取本次写入的最新文件，因此整个过程持有工作目录锁
+        original_cwd = await acquire_mediacrawler_workdir()
         
         try:
+            # 切换到MediaCrawler目录
+            self._switch_to_mediacrawler_dir()
+            
             # 执行MediaCrawler爬取
             await self._execute_mediacrawler(keywords, max_results)
             
             # 读取并转换数据
-            results = await self._load_and_convert_data()
+            results = await self._load_and_convert_data(max_results)
             
-            self.logger.info(f"MediaCrawler search completed: {len(results)} results")
+            self.logger.info("MediaCrawler search completed", result_count=len(results))
             return results[:max_results]  # 确保不超过限制
             
         except Exception as e:
@@ -70,13 +115,13 @@ class MediaCrawlerZhihuIntegration:
         finally:
             # 恢复原工作目录
             self._restore_original_dir()
+            release_mediacrawler_workdir(original_cwd)
     
     def _switch_to_mediacrawler_dir(self):
         """切换到MediaCrawler工作目录"""
         self.original_cwd = os.getcwd()
         
-        # 确保使用绝对路径
-        mediacrawler_abs_path = str(self.mediacrawler_path.resolve())
+        mediacrawler_abs_path = self.mediacrawler_abs_path
         self.logger.info(f"Switching from {self.original_cwd} to {mediacrawler_abs_path}")
         
         # 验证目录存在
@@ -106,9 +151,9 @@ class MediaCrawlerZhihuIntegration:
         for file_path in required_files:
             full_path = self.mediacrawler_path / file_path
             if not full_path.exists():
-                self.logger.warning(f"Required file missing: {full_path}")
+                self.logger.warning("Required file missing", path=str(full_path))
             else:
-                self.logger.debug(f"Required file exists: {full_path}")
+                self.logger.debug("Required file exists", path=str(full_path))
     
     def _restore_original_dir(self):
         """恢复原工作目录"""
@@ -164,8 +209,8 @@ class MediaCrawlerZhihuIntegration:
             self.logger.error(f"MediaCrawler execution failed: {e}")
             raise
     
-    async def _load_and_convert_data(self) -> List[Dict[str, Any]]:
-        """加载并转换MediaCrawler输出数据"""
+    async def _load_and_convert_data(self, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+        """加载并转换MediaCrawler输出数据，转换数量达到max_results后停止读取"""
         data_dir = self.mediacrawler_path / "data" / "zhihu" / "json"
         
         if not data_dir.exists():
@@ -183,24 +228,25 @@ class MediaCrawlerZhihuIntegration:
         self.logger.info(f"Loading data from: {latest_file}")
         
         try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
-            
-            if not raw_data:
-                self.logger.warning("MediaCrawler output file is empty")
-                return []
-            
             # 转换为标准格式
             converted_data = []
-            for item in raw_data:
+            item_count = 0
+            for item in _iter_json_items(latest_file):
+                item_count += 1
                 converted_item = self._convert_mediacrawler_item(item)
                 if converted_item:
                     converted_data.append(converted_item)
+                    if max_results is not None and len(converted_data) >= max_results:
+                        break
             
-            self.logger.info(f"Converted {len(converted_data)} items from MediaCrawler data")
+            if not item_count:
+                self.logger.warning("MediaCrawler output file is empty")
+                return []
+            
+            self.logger.info("Converted items from MediaCrawler data", item_count=len(converted_data))
             return converted_data
             
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+        except (*_JSON_ERRORS, FileNotFoundError) as e:
             self.logger.error(f"Failed to load MediaCrawler data: {e}")
             return []
     
@@ -237,13 +283,13 @@ class MediaCrawlerZhihuIntegration:
             
             # 验证必需字段
             if not converted['id'] or not converted['title']:
-                self.logger.warning(f"Skipping item with missing required fields: {item.get('content_id', 'unknown')}")
+                self.logger.warning("Skipping item with missing required fields", content_id=item.get('content_id', 'unknown'))
                 return None
             
             return converted
             
         except Exception as e:
-            self.logger.error(f"Failed to convert MediaCrawler item: {e}")
+            self.logger.error("Failed to convert MediaCrawler item", error=str(e))
             return None
     
     async def get_content_details(self, content_id: str) -> Optional[Dict[str, Any]]:
@@ -259,10 +305,7 @@ class MediaCrawlerZhihuIntegration:
             json_files = list(data_dir.glob("search_contents_*.json"))
             
             for json_file in sorted(json_files, key=lambda f: f.stat().st_mtime, reverse=True):
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                for item in data:
+                for item in _iter_json_items(json_file):
                     if item.get('content_id') == content_id:
                         return self._convert_mediacrawler_item(item)
             
@@ -273,7 +316,7 @@ class MediaCrawlerZhihuIntegration:
             self.logger.error(f"Failed to get content details: {e}")
             return None
     
-    def cleanup(self):
+    async def cleanup(self):
         """清理资源"""
         if self.original_cwd:
             os.chdir(self.original_cwd)
@@ -285,47 +328,53 @@ class MediaCrawlerZhihuIntegration:
         self.logger.debug("MediaCrawler integration cleaned up")
 
 
+@lru_cache(maxsize=8)
+def _resolve_mediacrawler_path(path: Optional[str]) -> str:
+    """
+    按MEDIACRAWLER_PATH的取值解析MediaCrawler路径
+    
+    结果按环境变量取值缓存，环境变量改变时自动重新解析；未找到路径时抛出的异常不会被缓存
+    """
+    logger = structlog.get_logger(__name__)
+    logger.debug(f"Environment MEDIACRAWLER_PATH: {path}")
+    
+    if path:
+        # 如果是相对路径，转换为绝对路径
+        if not os.path.isabs(path):
+            # 相对于项目根目录计算
+            project_root = Path(__file__).parent.parent.parent.parent
+            path = str(project_root / path)
+            logger.debug(f"Converted relative path to: {path}")
+        
+        if Path(path).exists():
+            logger.info(f"Using MediaCrawler path from environment: {path}")
+            return path
+        else:
+            logger.warning(f"Environment path does not exist: {path}")
+    
+    # 默认绝对路径
+    default_path = Path("/home/damian/MediaCrawler")
+    if default_path.exists():
+        logger.info(f"Using default MediaCrawler path: {default_path}")
+        return str(default_path)
+    
+    # 备用相对路径
+    backup_path = Path(__file__).parent.parent.parent.parent / "MediaCrawler"
+    if backup_path.exists():
+        logger.info(f"Using backup MediaCrawler path: {backup_path}")
+        return str(backup_path)
+    
+    logger.error(f"MediaCrawler path not found. Tried: {path}, {default_path}, {backup_path}")
+    raise ValueError(f"MediaCrawler path not found. Tried: {path}, {default_path}, {backup_path}")
+
+
 class MediaCrawlerConfig:
     """MediaCrawler配置管理"""
     
     @staticmethod
     def get_mediacrawler_path() -> str:
-        """获取MediaCrawler路径"""
-        import structlog
-        logger = structlog.get_logger(__name__)
-        
-        # 优先从环境变量获取
-        path = os.getenv('MEDIACRAWLER_PATH')
-        logger.debug(f"Environment MEDIACRAWLER_PATH: {path}")
-        
-        if path:
-            # 如果是相对路径，转换为绝对路径
-            if not os.path.isabs(path):
-                # 相对于项目根目录计算
-                project_root = Path(__file__).parent.parent.parent.parent
-                path = str(project_root / path)
-                logger.debug(f"Converted relative path to: {path}")
-            
-            if Path(path).exists():
-                logger.info(f"Using MediaCrawler path from environment: {path}")
-                return path
-            else:
-                logger.warning(f"Environment path does not exist: {path}")
-        
-        # 默认绝对路径
-        default_path = Path("/home/damian/MediaCrawler")
-        if default_path.exists():
-            logger.info(f"Using default MediaCrawler path: {default_path}")
-            return str(default_path)
-        
-        # 备用相对路径
-        backup_path = Path(__file__).parent.parent.parent.parent / "MediaCrawler"
-        if backup_path.exists():
-            logger.info(f"Using backup MediaCrawler path: {backup_path}")
-            return str(backup_path)
-        
-        logger.error(f"MediaCrawler path not found. Tried: {path}, {default_path}, {backup_path}")
-        raise ValueError(f"MediaCrawler path not found. Tried: {path}, {default_path}, {backup_path}")
+        """获取MediaCrawler路径，优先从环境变量获取"""
+        return _resolve_mediacrawler_path(os.getenv('MEDIACRAWLER_PATH'))
     
     @staticmethod
     def get_zhihu_cookie() -> str:
@@ -11,8 +11,12 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import structlog
 
-from ..base_platform import AbstractPlatform, PlatformError, PlatformUnavailableError
-from ..models import RawContent, Platform, ContentType
+from ..base_platform import (
+    AbstractPlatform, PlatformError, PlatformUnavailableError,
+    acquire_mediacrawler_workdir, release_mediacrawler_workdir,
+    find_missing_mediacrawler_file
+)
+from ..models import RawContent, Platform, ContentType, parse_count_string
 
 logger = structlog.get_logger()
 
@@ -113,7 +117,7 @@ class WeiboPlatform(AbstractPlatform):
     
     async def is_available(self) -> bool:
         """检查平台是否可用"""
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
         try:
             # 验证mediacrawler目录结构
             mediacrawler_path = Path(self.mediacrawler_path)
@@ -123,10 +127,10 @@ class WeiboPlatform(AbstractPlatform):
                 mediacrawler_path / "base" / "base_crawler.py"
             ]
             
-            for required_file in required_files:
-                if not required_file.exists():
-                    self.logger.error("Required file not found", file=str(required_file))
-                    return False
+            missing_file = find_missing_mediacrawler_file(required_files)
+            if missing_file is not None:
+                self.logger.error("Required file not found", file=str(missing_file))
+                return False
             
             # 切换到mediacrawler目录以确保相对路径正确
             os.chdir(self.mediacrawler_path)
@@ -149,12 +153,12 @@ class WeiboPlatform(AbstractPlatform):
             return False
         finally:
             # 恢复原工作目录
-            os.chdir(original_cwd)
+            release_mediacrawler_workdir(original_cwd)
     
     async def _get_weibo_client(self):
         """获取微博爬虫实例（延迟初始化）"""
         if self._weibo_client is None:
-            original_cwd = os.getcwd()
+            original_cwd = await acquire_mediacrawler_workdir()
             try:
                 # 切换到mediacrawler目录以确保相对路径正确
                 os.chdir(self.mediacrawler_path)
@@ -178,7 +182,7 @@ class WeiboPlatform(AbstractPlatform):
                 raise PlatformError("weibo", f"Failed to initialize Weibo crawler: {str(e)}")
             finally:
                 # 恢复原工作目录
-                os.chdir(original_cwd)
+                release_mediacrawler_workdir(original_cwd)
         
         return self._weibo_client
     
@@ -199,7 +203,8 @@ class WeiboPlatform(AbstractPlatform):
         Returns:
             爬取到的内容列表
         """
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         original_keywords = None
         config_file_path = None
         
@@ -244,6 +249,12 @@ class WeiboPlatform(AbstractPlatform):
             except Exception as e:
                 self.logger.warning("Failed to update MediaCrawler keywords", error=str(e))
             
+            # 配置文件由各平台共享，恢复原始关键词后立即释放工作目录锁；
+            # 搜索只在导入模块、启动浏览器时再次短暂持有锁，网络请求和登录等待不占用锁
+            self._restore_mediacrawler_keywords(config_file_path, original_keywords)
+            release_mediacrawler_workdir(original_cwd)
+            workdir_locked = False
+            
             # 验证关键词
             validated_keywords = await self.validate_keywords(keywords)
             
@@ -287,36 +298,24 @@ class WeiboPlatform(AbstractPlatform):
             else:
                 raise PlatformError("weibo", f"Crawl failed: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
-            
-            # 恢复原始关键词配置
-            try:
-                if original_keywords is not None and config_file_path and os.path.exists(config_file_path):
-                    with open(config_file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # 恢复原始关键词
-                    import re
-                    pattern = r'KEYWORDS\s*=\s*"([^"]*)"'
-                    restored_content = re.sub(pattern, f'KEYWORDS = "{original_keywords}"', content)
-                    
-                    with open(config_file_path, 'w', encoding='utf-8') as f:
-                        f.write(restored_content)
-                    
-                    self.logger.info("Restored original MediaCrawler keywords", keywords=original_keywords)
-            except Exception as e:
-                self.logger.warning("Failed to restore original keywords", error=str(e))
+            # 准备阶段出错时同样恢复原始关键词配置和工作目录
+            if workdir_locked:
+                self._restore_mediacrawler_keywords(config_file_path, original_keywords)
+                release_mediacrawler_workdir(original_cwd)
     
     async def _search_with_complete_mediacrawler(self, keywords: List[str], max_count: int) -> List[Dict[str, Any]]:
         """
         使用完整的MediaCrawler方式进行搜索，完全按照MediaCrawler的原生实现
         """
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         try:
             # 切换到mediacrawler目录
             os.chdir(self.mediacrawler_path)
             
+            # 准备阶段释放锁后config模块可能已被其他平台重新加载，导入前补齐缺失的配置
+            self._setup_mediacrawler_environment()
+            
             # 导入完整的MediaCrawler核心模块
             from media_platform.weibo.core import WeiboCrawler
             from playwright.async_api import async_playwright
@@ -335,8 +334,15 @@ class WeiboPlatform(AbstractPlatform):
                     chromium, None, weibo_crawler.mobile_user_agent, headless=config.HEADLESS
                 )
                 
-                # 添加初始化脚本
-                await weibo_crawler.browser_context.add_init_script(path="libs/stealth.min.js")
+                # 浏览器登录态目录按工作目录创建，启动完成后释放锁；
+                # 之后的页面访问、登录和搜索请求不依赖工作目录，可与其他平台并发进行
+                release_mediacrawler_workdir(original_cwd)
+                workdir_locked = False
+                
+                # 添加初始化脚本（使用绝对路径，不依赖工作目录）
+                await weibo_crawler.browser_context.add_init_script(
+                    path=os.path.join(self.mediacrawler_path, "libs", "stealth.min.js")
+                )
                 
                 # 创建页面
                 weibo_crawler.context_page = await weibo_crawler.browser_context.new_page()
@@ -443,8 +449,9 @@ class WeiboPlatform(AbstractPlatform):
             self.logger.error("Complete MediaCrawler search failed", error=str(e))
             raise PlatformError("weibo", f"Complete MediaCrawler search failed: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
+            # 出错时锁可能尚未释放
+            if workdir_locked:
+                release_mediacrawler_workdir(original_cwd)
     
     async def transform_to_raw_content(self, weibo_data: Dict[str, Any]) -> RawContent:
         """
@@ -579,23 +586,8 @@ class WeiboPlatform(AbstractPlatform):
             return count_value
             
         if isinstance(count_value, str):
-            count_str = count_value.strip()
-            
             # 处理中文数字
-            if '万' in count_str:
-                try:
-                    num = float(count_str.replace('万', ''))
-                    return int(num * 10000)
-                except ValueError:
-                    pass
-            elif '千' in count_str:
-                try:
-                    num = float(count_str.replace('千', ''))
-                    return int(num * 1000)
-                except ValueError:
-                    pass
-            elif count_str.isdigit():
-                return int(count_str)
+            return parse_count_string(count_value)
         
         return 0
     
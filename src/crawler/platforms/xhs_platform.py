@@ -11,8 +11,12 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import structlog
 
-from ..base_platform import AbstractPlatform, PlatformError, PlatformUnavailableError
-from ..models import RawContent, Platform, ContentType
+from ..base_platform import (
+    AbstractPlatform, PlatformError, PlatformUnavailableError,
+    acquire_mediacrawler_workdir, release_mediacrawler_workdir,
+    find_missing_mediacrawler_file
+)
+from ..models import RawContent, Platform, ContentType, parse_count_string
 
 logger = structlog.get_logger()
 
@@ -62,7 +66,7 @@ class XHSPlatform(AbstractPlatform):
     
     async def is_available(self) -> bool:
         """检查平台是否可用"""
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
         try:
             # 验证mediacrawler目录结构
             mediacrawler_path = Path(self.mediacrawler_path)
@@ -72,10 +76,10 @@ class XHSPlatform(AbstractPlatform):
                 mediacrawler_path / "base" / "base_crawler.py"
             ]
             
-            for required_file in required_files:
-                if not required_file.exists():
-                    self.logger.error("Required file not found", file=str(required_file))
-                    return False
+            missing_file = find_missing_mediacrawler_file(required_files)
+            if missing_file is not None:
+                self.logger.error("Required file not found", file=str(missing_file))
+                return False
             
             # 切换到mediacrawler目录以确保相对路径正确
             os.chdir(self.mediacrawler_path)
@@ -92,12 +96,12 @@ class XHSPlatform(AbstractPlatform):
             return False
         finally:
             # 恢复原工作目录
-            os.chdir(original_cwd)
+            release_mediacrawler_workdir(original_cwd)
     
     async def _get_xhs_client(self):
         """获取XHS爬虫实例（延迟初始化）"""
         if self._xhs_client is None:
-            original_cwd = os.getcwd()
+            original_cwd = await acquire_mediacrawler_workdir()
             try:
                 # 切换到mediacrawler目录以确保相对路径正确
                 os.chdir(self.mediacrawler_path)
@@ -115,7 +119,7 @@ class XHSPlatform(AbstractPlatform):
                 raise PlatformError("xhs", f"Failed to initialize XHS crawler: {str(e)}")
             finally:
                 # 恢复原工作目录
-                os.chdir(original_cwd)
+                release_mediacrawler_workdir(original_cwd)
         
         return self._xhs_client
     
@@ -136,7 +140,8 @@ class XHSPlatform(AbstractPlatform):
         Returns:
             爬取到的内容列表
         """
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         original_keywords = None
         config_file_path = None
         
@@ -180,12 +185,21 @@ class XHSPlatform(AbstractPlatform):
                     self.logger.info("Updated MediaCrawler keywords before import", 
                                    original=original_keywords, 
                                    new=new_keywords)
+                    
+                    # 恢复配置文件前重新导入配置模块，使修改后的关键词生效
+                    import config
                 else:
                     self.logger.warning("Could not find KEYWORDS pattern in config file")
                     
             except Exception as e:
                 self.logger.warning("Failed to update MediaCrawler keywords", error=str(e))
             
+            # 配置文件由各平台共享，恢复原始关键词后立即释放工作目录锁；
+            # 搜索只在导入模块、启动浏览器时再次短暂持有锁，网络请求和登录等待不占用锁
+            self._restore_mediacrawler_keywords(config_file_path, original_keywords)
+            release_mediacrawler_workdir(original_cwd)
+            workdir_locked = False
+            
             # 验证关键词
             validated_keywords = await self.validate_keywords(keywords)
             
@@ -200,15 +214,7 @@ class XHSPlatform(AbstractPlatform):
             raw_data = await self._search_with_complete_mediacrawler(validated_keywords, max_count)
             
             # 转换数据格式
-            raw_contents = []
-            for item in raw_data:
-                try:
-                    content = await self.transform_to_raw_content(item)
-                    raw_contents.append(content)
-                except Exception as e:
-                    self.logger.warning("Failed to transform content", 
-                                      content_id=item.get('note_id', 'unknown'),
-                                      error=str(e))
+            raw_contents = self.transform_to_raw_content_batch(raw_data)
             
             # 过滤内容
             filtered_contents = await self.filter_content(raw_contents)
@@ -232,32 +238,17 @@ class XHSPlatform(AbstractPlatform):
             else:
                 raise PlatformError("xhs", f"Crawl failed: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
-            
-            # 恢复原始关键词配置
-            try:
-                if original_keywords is not None and config_file_path and os.path.exists(config_file_path):
-                    with open(config_file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # 恢复原始关键词
-                    import re
-                    pattern = r'KEYWORDS\s*=\s*"([^"]*)"'
-                    restored_content = re.sub(pattern, f'KEYWORDS = "{original_keywords}"', content)
-                    
-                    with open(config_file_path, 'w', encoding='utf-8') as f:
-                        f.write(restored_content)
-                    
-                    self.logger.info("Restored original MediaCrawler keywords", keywords=original_keywords)
-            except Exception as e:
-                self.logger.warning("Failed to restore original keywords", error=str(e))
+            # 准备阶段出错时同样恢复原始关键词配置和工作目录
+            if workdir_locked:
+                self._restore_mediacrawler_keywords(config_file_path, original_keywords)
+                release_mediacrawler_workdir(original_cwd)
     
     async def _search_with_complete_mediacrawler(self, keywords: List[str], max_count: int) -> List[Dict[str, Any]]:
         """
         使用完整的MediaCrawler方式进行搜索，完全按照MediaCrawler的原生实现
         """
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         try:
             # 切换到mediacrawler目录
             os.chdir(self.mediacrawler_path)
@@ -280,8 +271,15 @@ class XHSPlatform(AbstractPlatform):
                     chromium, None, xhs_crawler.user_agent, headless=config.HEADLESS
                 )
                 
-                # 添加初始化脚本
-                await xhs_crawler.browser_context.add_init_script(path="libs/stealth.min.js")
+                # 浏览器登录态目录按工作目录创建，启动完成后释放锁；
+                # 之后的页面访问、登录和搜索请求不依赖工作目录，可与其他平台并发进行
+                release_mediacrawler_workdir(original_cwd)
+                workdir_locked = False
+                
+                # 添加初始化脚本（使用绝对路径，不依赖工作目录）
+                await xhs_crawler.browser_context.add_init_script(
+                    path=os.path.join(self.mediacrawler_path, "libs", "stealth.min.js")
+                )
                 await xhs_crawler.browser_context.add_cookies([
                     {
                         "name": "webId",
@@ -411,8 +409,9 @@ class XHSPlatform(AbstractPlatform):
             self.logger.error("Complete MediaCrawler search failed", error=str(e))
             raise PlatformError("xhs", f"Complete MediaCrawler search failed: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
+            # 出错时锁可能尚未释放
+            if workdir_locked:
+                release_mediacrawler_workdir(original_cwd)
     
     async def _search_notes_with_mediacrawler_style(
         self, 
@@ -431,7 +430,8 @@ class XHSPlatform(AbstractPlatform):
         Returns:
             原始数据列表
         """
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         try:
             # 切换到mediacrawler目录以确保相对路径正确
             os.chdir(self.mediacrawler_path)
@@ -440,6 +440,10 @@ class XHSPlatform(AbstractPlatform):
             from media_platform.xhs.field import SearchSortType
             from media_platform.xhs.help import get_search_id
             
+            # 模块导入完成后释放锁，搜索请求不依赖工作目录
+            release_mediacrawler_workdir(original_cwd)
+            workdir_locked = False
+            
             all_notes = []
             xhs_limit_count = 20  # XHS每页固定限制
             
@@ -526,12 +530,14 @@ class XHSPlatform(AbstractPlatform):
             self.logger.error("MediaCrawler style search failed", error=str(e))
             raise PlatformError("xhs", f"MediaCrawler style search failed: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
+            # 出错时锁可能尚未释放
+            if workdir_locked:
+                release_mediacrawler_workdir(original_cwd)
     
     async def _create_xhs_client_mediacrawler_style(self, crawler):
         """按照MediaCrawler方式创建XHS客户端"""
-        original_cwd = os.getcwd()
+        original_cwd = await acquire_mediacrawler_workdir()
+        workdir_locked = True
         try:
             # 切换到mediacrawler目录以确保相对路径正确
             os.chdir(self.mediacrawler_path)
@@ -551,6 +557,11 @@ class XHSPlatform(AbstractPlatform):
                     crawler.browser_context = await crawler.launch_browser(
                         chromium, None, crawler.user_agent, headless=config.HEADLESS
                     )
+                    
+                    # 浏览器登录态目录按工作目录创建，启动完成后释放锁，页面访问不占用锁
+                    release_mediacrawler_workdir(original_cwd)
+                    workdir_locked = False
+                    
                     crawler.context_page = await crawler.browser_context.new_page()
                     await crawler.context_page.goto("https://www.xiaohongshu.com")
             
@@ -579,8 +590,8 @@ class XHSPlatform(AbstractPlatform):
             self.logger.error("Failed to create MediaCrawler-style XHS client", error=str(e))
             raise PlatformError("xhs", f"Failed to create XHS client: {str(e)}")
         finally:
-            # 恢复原工作目录
-            os.chdir(original_cwd)
+            if workdir_locked:
+                release_mediacrawler_workdir(original_cwd)
     
     async def _perform_mediacrawler_login(self, crawler):
         """按照MediaCrawler方式执行登录"""
@@ -791,6 +802,32 @@ class XHSPlatform(AbstractPlatform):
         Returns:
             标准化的RawContent
         """
+        return self._build_raw_content(xhs_data)
+    
+    def transform_to_raw_content_batch(self, items: List[Dict[str, Any]]) -> List[RawContent]:
+        """
+        批量转换XHS数据，转换失败的条目记录警告后跳过
+        
+        转换过程不涉及IO，整批在一次同步循环中完成，不为每条数据创建协程
+        
+        Args:
+            items: XHS原始数据列表
+            
+        Returns:
+            转换成功的RawContent列表
+        """
+        raw_contents = []
+        for item in items:
+            try:
+                raw_contents.append(self._build_raw_content(item))
+            except Exception as e:
+                self.logger.warning("Failed to transform content", 
+                                  content_id=item.get('note_id', 'unknown'),
+                                  error=str(e))
+        return raw_contents
+    
+    def _build_raw_content(self, xhs_data: Dict[str, Any]) -> RawContent:
+        """将单条XHS数据转换为RawContent"""
         try:
             # 提取基础信息
             note_id = xhs_data.get('note_id', '')
@@ -907,12 +944,7 @@ class XHSPlatform(AbstractPlatform):
             
             if isinstance(count_value, str):
                 # 处理中文数字：1.2万 -> 12000
-                if '万' in count_value:
-                    return int(float(count_value.replace('万', '')) * 10000)
-                elif '千' in count_value:
-                    return int(float(count_value.replace('千', '')) * 1000)
-                elif count_value.isdigit():
-                    return int(count_value)
+                return parse_count_string(count_value)
             
             return 0
         except Exception:
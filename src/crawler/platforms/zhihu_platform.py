@@ -3,16 +3,74 @@
 基于实际验证的MediaCrawler成功方案重构
 """
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import structlog
 import re
 import html
+import sys
 
 from ..base_platform import AbstractPlatform, PlatformError
 from ..models import RawContent, Platform, ContentType
+from ...utils.deduplication import MinHashLSH
 
 logger = structlog.get_logger()
 
+# MediaCrawler内容类型 -> ContentType
+_CONTENT_TYPE_MAP = {
+    'answer': ContentType.ANSWER,
+    'article': ContentType.ARTICLE,
+    'pin': ContentType.PIN,
+    'question': ContentType.QUESTION,
+    'zvideo': ContentType.VIDEO
+}
+
+# 不超过该长度的重复字段值（关键词等）驻留为同一对象
+INTERN_MAX_LENGTH = 32
+
+# HTML标签与空白字符组成的连续片段
+_HTML_CLEAN_RE = re.compile(r'(?:<[^>]+>|\s)+')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# 关键词提取：连续中文或英文字母
+_KEYWORD_TOKEN_RE = re.compile(r'[\u4e00-\u9fa5]+|[a-zA-Z]+')
+
+
+def _replace_tag_or_whitespace(match: re.Match) -> str:
+    """标签直接移除；片段中含标签外的空白时折叠为单个空格"""
+    run = match.group()
+    if '<' not in run:
+        return ' '
+    return ' ' if _HTML_TAG_RE.sub('', run) else ''
+
+
+def _intern_short(value: Any) -> Any:
+    """驻留跨条目重复出现的短字符串，共享同一份内存"""
+    if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _no_keywords(source_keywords: Any) -> List[str]:
+    """不支持的关键词格式"""
+    return []
+
+
+# source_keywords类型 -> 列表格式转换函数
+_KEYWORD_NORMALIZERS = {
+    str: lambda source_keywords: [source_keywords] if source_keywords else [],
+    list: lambda source_keywords: source_keywords,
+}
+
+
+@lru_cache(maxsize=None)
+def _keyword_normalizer_for(keywords_type: type):
+    """按类型查找转换函数，str/list的子类沿MRO回退到父类规则"""
+    return next(
+        (_KEYWORD_NORMALIZERS[base] for base in keywords_type.__mro__ if base in _KEYWORD_NORMALIZERS),
+        _no_keywords
+    )
+
 
 class ZhihuPlatform(AbstractPlatform):
     """
@@ -72,7 +130,7 @@ class ZhihuPlatform(AbstractPlatform):
         # 验证关键词
         validated_keywords = await self.validate_keywords(keywords)
         
-        self.logger.info(f"Starting zhihu crawl: keywords={validated_keywords}, max_count={max_count}")
+        self.logger.info("Starting zhihu crawl", keywords=validated_keywords, max_count=max_count)
         
         try:
             # 获取MediaCrawler集成实例
@@ -93,13 +151,20 @@ class ZhihuPlatform(AbstractPlatform):
                             all_contents.append(content)
                             
                 except Exception as e:
-                    self.logger.warning(f"Failed to search for keyword '{keyword}': {e}")
+                    self.logger.warning("Failed to search for keyword", keyword=keyword, error=str(e))
                     continue
             
             # 过滤内容
             filtered_contents = await self.filter_content(all_contents)
             
-            self.logger.info(f"Zhihu crawl completed: {len(filtered_contents)} contents found")
+            # 跳过转载、搬运等近似重复内容；索引只在本次爬取内有效，且只收录通过过滤的内容
+            lsh = MinHashLSH(threshold=0.7, num_perm=128, shingle_size=5)
+            filtered_contents = [
+                content for content in filtered_contents
+                if not self._is_near_duplicate(lsh, content.content_id, content.content)
+            ]
+            
+            self.logger.info("Zhihu crawl completed", content_count=len(filtered_contents))
             return filtered_contents[:max_count]  # 限制最终结果数量
             
         except Exception as e:
@@ -178,12 +243,7 @@ class ZhihuPlatform(AbstractPlatform):
             stats = item.get('stats', {})
             
             # 处理source_keywords - 确保它是列表格式
-            if isinstance(source_keywords, str):
-                keyword_list = [source_keywords] if source_keywords else []
-            elif isinstance(source_keywords, list):
-                keyword_list = source_keywords
-            else:
-                keyword_list = []
+            keyword_list = _keyword_normalizer_for(type(source_keywords))(source_keywords)
             
             # 创建RawContent对象
             raw_content = RawContent(
@@ -210,7 +270,7 @@ class ZhihuPlatform(AbstractPlatform):
                 video_urls=[],  # 可以后续从内容中提取
                 source_keywords=keyword_list,
                 platform_metadata={
-                    'source_keywords': source_keywords or item.get('metadata', {}).get('source_keyword', ''),
+                    'source_keywords': source_keywords or _intern_short(item.get('metadata', {}).get('source_keyword', '')),
                     'question_id': item.get('metadata', {}).get('question_id', ''),
                     'description': item.get('metadata', {}).get('description', ''),
                     'author_profile_url': author_info.get('profile_url', ''),
@@ -220,15 +280,38 @@ class ZhihuPlatform(AbstractPlatform):
             
             # 验证必需字段
             if not raw_content.content_id or not raw_content.title:
-                self.logger.warning(f"Skipping content with missing required fields: {item}")
+                self.logger.warning("Skipping content with missing required fields", content_id=item.get('id', ''))
                 return None
             
             return raw_content
             
         except Exception as e:
-            self.logger.error(f"Failed to convert item to RawContent: {e}")
+            self.logger.error("Failed to convert item to RawContent", error=str(e))
             return None
     
+    def _is_near_duplicate(self, lsh: MinHashLSH, content_id: str, text: str) -> bool:
+        """
+        基于MinHash LSH检查内容是否与本次爬取已收录的内容近似重复，不重复时收录
+        
+        Args:
+            lsh: 本次爬取的近似重复检测索引
+            content_id: 内容ID
+            text: 清理后的文本
+            
+        Returns:
+            bool: 是否为近似重复内容
+        """
+        if not content_id or not text:
+            return False
+        
+        signature = lsh.signature(text)
+        if lsh.query(signature) - {content_id}:
+            self.logger.debug("Skipping near-duplicate content", content_id=content_id)
+            return True
+        
+        lsh.insert(content_id, signature)
+        return False
+    
     def _determine_content_type(self, mediacrawler_type: str) -> ContentType:
         """
         根据MediaCrawler的content_type确定我们的ContentType
@@ -239,15 +322,8 @@ class ZhihuPlatform(AbstractPlatform):
         Returns:
             ContentType: 对应的内容类型
         """
-        type_mapping = {
-            'answer': ContentType.ANSWER,
-            'article': ContentType.ARTICLE,
-            'pin': ContentType.PIN,
-            'question': ContentType.QUESTION,
-            'zvideo': ContentType.VIDEO
-        }
-        
-        return type_mapping.get(mediacrawler_type.lower(), ContentType.POST)
+        key = mediacrawler_type if mediacrawler_type.islower() else mediacrawler_type.lower()
+        return _CONTENT_TYPE_MAP.get(key, ContentType.POST)
     
     def _clean_content_text(self, text: str) -> str:
         """
@@ -262,19 +338,8 @@ class ZhihuPlatform(AbstractPlatform):
         if not text:
             return ""
         
-        # HTML解码
-        text = html.unescape(text)
-        
-        # 移除HTML标签
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # 清理多余的空白字符
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # 移除特殊字符
-        text = re.sub(r'[\\n\\r\\t]', ' ', text)
-        
-        return text
+        # HTML解码后一次扫描完成：移除HTML标签并合并空白字符
+        return _HTML_CLEAN_RE.sub(_replace_tag_or_whitespace, html.unescape(text)).strip()
     
     def _convert_timestamp(self, timestamp: Any) -> Optional[datetime]:
         """
@@ -297,7 +362,7 @@ class ZhihuPlatform(AbstractPlatform):
             else:
                 return None
         except (ValueError, TypeError, OSError):
-            self.logger.warning(f"Failed to convert timestamp: {timestamp}")
+            self.logger.warning("Failed to convert timestamp", timestamp=timestamp)
             return None
     
     async def is_available(self) -> bool:
@@ -341,17 +406,19 @@ class ZhihuPlatform(AbstractPlatform):
         self.logger.warning("get_trending_topics not implemented for MediaCrawler integration")
         return []
     
-    def cleanup(self):
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+    
+    async def aclose(self):
         """清理资源"""
         if self._mediacrawler_integration:
-            self._mediacrawler_integration.cleanup()
+            await self._mediacrawler_integration.cleanup()
             self._mediacrawler_integration = None
         
         self.logger.info("ZhihuPlatform resources cleaned up")
-    
-    def __del__(self):
-        """析构函数，确保资源清理"""
-        self.cleanup()
 
 
 # 知乎平台特定的辅助功能
@@ -408,19 +475,15 @@ class ZhihuContentAnalyzer:
         Returns:
             List[str]: 关键词列表
         """
-        keywords = []
-        
-        # 从标题提取
-        if content.title:
-            # 简单的关键词提取（可以后续优化）
-            title_words = re.findall(r'[\u4e00-\u9fa5]+|[a-zA-Z]+', content.title)
-            keywords.extend([w for w in title_words if len(w) > 1])
-        
-        # 从内容提取（取前100个字符）
-        if content.content:
-            content_preview = content.content[:100]
-            content_words = re.findall(r'[\u4e00-\u9fa5]+|[a-zA-Z]+', content_preview)
-            keywords.extend([w for w in content_words if len(w) > 1])
-        
-        # 去重并限制数量
-        return list(set(keywords))[:10]
\ No newline at end of file
+        keywords = {}
+        
+        # 依次从标题和内容前100个字符提取，按出现顺序去重，满10个即停止
+        for source in (content.title or '', (content.content or '')[:100]):
+            for match in _KEYWORD_TOKEN_RE.finditer(source):
+                word = match.group()
+                if len(word) > 1:
+                    keywords[word] = None
+                    if len(keywords) >= 10:
+                        return list(keywords)
+        
+        return list(keywords)
@@ -4,9 +4,13 @@
 集成MediaCrawler的原生知乎爬取能力
 """
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import structlog
+import asyncio
+import html
 import os
+import re
 import sys
 
 from crawler.base_platform import AbstractPlatform, PlatformError
@@ -15,6 +19,181 @@ from crawler.platforms.mediacrawler_zhihu_adapter import MediaCrawlerZhihuAdapte
 
 logger = structlog.get_logger()
 
+# 知乎内容类型 -> ContentType
+_CONTENT_TYPE_MAP = {
+    'answer': ContentType.ANSWER,
+    'article': ContentType.ARTICLE,
+    'pin': ContentType.POST,  # 想法映射为POST
+    'question': ContentType.QUESTION
+}
+
+# 文本清理与话题提取
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_TOPIC_RE = re.compile(r'「([^」]+)」')
+
+# 单批条目数超过该值时将CPU密集的文本处理移到线程中执行，避免阻塞事件循环
+OFFLOAD_MIN_BATCH = 64
+
+# 不超过该长度的重复字段值（类型、作者签名等）驻留为同一对象
+INTERN_MAX_LENGTH = 32
+
+
+def _intern_short(value: Any) -> Any:
+    """驻留跨条目重复出现的短字符串，共享同一份内存"""
+    if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def clean_html_content(content: str) -> str:
+    """清理HTML标签并保留纯文本"""
+    if not content:
+        return ""
+    
+    # 解码HTML实体
+    content = html.unescape(content)
+    
+    # 移除HTML标签
+    content = _HTML_TAG_RE.sub('', content)
+    
+    # 清理多余的空白字符
+    content = _WHITESPACE_RE.sub(' ', content).strip()
+    
+    return content
+
+
+def extract_hashtags_from_content(content: str) -> List[str]:
+    """从内容中提取话题标签"""
+    hashtags = []
+    
+    # 知乎中的话题通常用「」包围
+    topics = _TOPIC_RE.findall(content)
+    
+    for topic in topics:
+        topic = topic.strip()
+        if topic and topic not in hashtags:
+            hashtags.append(topic)
+    
+    return hashtags
+
+
+def calculate_professional_score(zhihu_data: Dict[str, Any]) -> float:
+    """计算内容专业度分数"""
+    score = 0.0
+    
+    # 作者专业度
+    author = zhihu_data.get('author', {})
+    headline = author.get('headline', '')
+    follower_count = author.get('follower_count', 0)
+    
+    # 根据作者标题判断专业度
+    professional_keywords = ['分析师', '投资', '研究员', '专家', '顾问', '基金', '经理']
+    if any(keyword in headline for keyword in professional_keywords):
+        score += 0.3
+    
+    # 根据粉丝数量判断影响力
+    if follower_count > 10000:
+        score += 0.2
+    elif follower_count > 1000:
+        score += 0.1
+    
+    # 根据互动数据判断质量
+    voteup_count = zhihu_data.get('voteup_count', 0) or zhihu_data.get('like_count', 0)
+    comment_count = zhihu_data.get('comment_count', 0)
+    
+    if voteup_count > 100:
+        score += 0.2
+    elif voteup_count > 50:
+        score += 0.1
+    
+    if comment_count > 20:
+        score += 0.1
+    elif comment_count > 10:
+        score += 0.05
+    
+    # 根据内容长度判断深度
+    content_length = len(zhihu_data.get('content', ''))
+    if content_length > 1000:
+        score += 0.1
+    elif content_length > 500:
+        score += 0.05
+    
+    return min(score, 1.0)  # 最大值为1.0
+
+
+def prepare_content_items(items: List[Dict[str, Any]]) -> List[Tuple[str, List[str], float]]:
+    """
+    批量执行CPU密集的预处理（HTML清理、话题提取、专业度评分）
+    纯函数，可在工作线程中执行
+    
+    Returns:
+        每个条目对应的 (清理后文本, 话题标签, 专业度分数)
+    """
+    results = []
+    for item in items:
+        content_text = clean_html_content(item.get('content', ''))
+        results.append((
+            content_text,
+            extract_hashtags_from_content(content_text),
+            calculate_professional_score(item)
+        ))
+    return results
+
+
+def _filter_raw_content(content: RawContent) -> bool:
+    """RawContent过滤规则（按开销从低到高检查）"""
+    # 质量过滤：点赞数和评论数都很少的内容（最常见的过滤原因）
+    if content.like_count < 5 and content.comment_count < 2:
+        return True
+    
+    # 内容长度过滤
+    if len(content.content) < 20:  # 知乎内容一般较长
+        return True
+    
+    # 专业度评估
+    if content.platform_metadata and content.platform_metadata.get('professional_score', 0) < 0.3:
+        return True
+    
+    return False
+
+
+def _filter_dict(content: Dict[str, Any]) -> bool:
+    """字典数据过滤规则（按开销从低到高检查）"""
+    # 先检查整数互动数据
+    voteup_count = content.get('voteup_count') or content.get('like_count') or 0
+    comment_count = content.get('comment_count') or 0
+    if voteup_count < 5 and comment_count < 2:
+        return True
+    
+    # 再检查内容长度
+    text_content = content.get('content')
+    if text_content is None or len(text_content) < 20:
+        return True
+    
+    return False
+
+
+def _filter_noop(content: Any) -> bool:
+    """未知类型不过滤"""
+    return False
+
+
+# 内容类型 -> 过滤函数
+_CONTENT_FILTERS = {
+    RawContent: _filter_raw_content,
+    dict: _filter_dict,
+}
+
+
+@lru_cache(maxsize=None)
+def _content_filter_for(content_type: type):
+    """按类型查找过滤函数，子类（如OrderedDict、RawContent子类）沿MRO回退到父类规则"""
+    return next(
+        (_CONTENT_FILTERS[base] for base in content_type.__mro__ if base in _CONTENT_FILTERS),
+        _filter_noop
+    )
+
 
 class ZhihuPlatform(AbstractPlatform):
     """
@@ -34,12 +213,14 @@ class ZhihuPlatform(AbstractPlatform):
         self.search_type = os.getenv("ZHIHU_SEARCH_TYPE", "综合")
         self.max_pages = int(os.getenv("ZHIHU_MAX_PAGES", "10"))
         self.rate_limit = int(os.getenv("ZHIHU_RATE_LIMIT", "60"))
+        self._delay_seconds = 60.0 / max(self.rate_limit, 1)  # 根据速率限制计算请求间延迟
         self.cookie = os.getenv("ZHIHU_COOKIE", "")
         self.login_method = os.getenv("ZHIHU_LOGIN_METHOD", "cookie")
         self.headless = os.getenv("ZHIHU_HEADLESS", "true").lower() == "true"
         
-        # MediaCrawler适配器
+        # MediaCrawler适配器（首次搜索时初始化）
         self._mediacrawler_adapter = None
+        self._adapter_lock = asyncio.Lock()
         self._mediacrawler_path = os.getenv("MEDIACRAWLER_PATH", "./mediacrawler")
         
     def get_platform_name(self) -> Platform:
@@ -54,25 +235,37 @@ class ZhihuPlatform(AbstractPlatform):
                 self.logger.warning("Zhihu cookie not configured")
                 return False
             
-            # 初始化MediaCrawler适配器
-            adapter = await self._get_mediacrawler_adapter()
-            if not adapter:
-                return False
-            
-            # 检查连接状态
-            ping_result = await adapter.ping()
-            
-            if ping_result:
-                self.logger.info("Zhihu platform is available via MediaCrawler")
+            # 仅做轻量的Cookie有效性检查，不初始化MediaCrawler/Playwright
+            if await self._check_login_status():
+                self.logger.info("Zhihu platform is available")
                 return True
             else:
-                self.logger.warning("MediaCrawler zhihu ping failed")
+                self.logger.warning("Zhihu login status check failed")
                 return False
                 
         except Exception as e:
             self.logger.error("Zhihu platform availability check failed", error=str(e))
             return False
     
+    async def _ensure_search_adapter(self) -> MediaCrawlerZhihuAdapter:
+        """获取MediaCrawler适配器，仅在首次实际搜索时初始化"""
+        if self._mediacrawler_adapter is not None:
+            return self._mediacrawler_adapter
+        
+        async with self._adapter_lock:
+            # 等锁期间可能已被其他协程初始化
+            if self._mediacrawler_adapter is None:
+                adapter = MediaCrawlerZhihuAdapter(cookie=self.cookie, logger=self.logger)
+                if not await adapter.initialize():
+                    raise PlatformError(
+                        platform=self.platform_name.value,
+                        message="MediaCrawler adapter initialization failed",
+                        error_code="ADAPTER_INIT_FAILED"
+                    )
+                self._mediacrawler_adapter = adapter
+        
+        return self._mediacrawler_adapter
+    
     async def crawl(
         self, 
         keywords: List[str], 
@@ -91,11 +284,11 @@ class ZhihuPlatform(AbstractPlatform):
             爬取到的内容列表
         """
         
-        # 检查平台可用性
-        if not await self.is_available():
+        # 检查Cookie配置（完整可用性由适配器初始化保证）
+        if not self.cookie:
             raise PlatformError(
                 platform=self.platform_name.value,
-                message="Platform not available",
+                message="Platform not available: cookie not configured",
                 error_code="PLATFORM_UNAVAILABLE"
             )
         
@@ -115,9 +308,11 @@ class ZhihuPlatform(AbstractPlatform):
         
         try:
             # 获取MediaCrawler适配器
-            adapter = await self._get_mediacrawler_adapter()
+            adapter = await self._ensure_search_adapter()
+            
+            # 执行搜索，按内容ID在累积阶段去重，避免重复转换
+            seen_ids = set()
             
-            # 执行搜索
             all_raw_data = []
             for keyword in valid_keywords:
                 try:
@@ -128,39 +323,37 @@ class ZhihuPlatform(AbstractPlatform):
                         page_size=min(max_count, 20)  # MediaCrawler单次最多20条
                     )
                     
-                    self.logger.info(f"MediaCrawler search for '{keyword}' returned {len(search_results)} results")
-                    all_raw_data.extend(search_results)
+                    self.logger.info("MediaCrawler search completed", keyword=keyword, count=len(search_results))
+                    for result in search_results:
+                        # 没有ID的条目无法判重，直接保留
+                        result_id = str(result.get('id', ''))
+                        if result_id:
+                            if result_id in seen_ids:
+                                continue
+                            seen_ids.add(result_id)
+                        all_raw_data.append(result)
                     
                     # 延迟避免过快请求
                     await self._delay_between_requests()
                     
                 except Exception as e:
-                    self.logger.error(f"Failed to search keyword '{keyword}'", error=str(e))
+                    self.logger.error("Failed to search keyword", keyword=keyword, error=str(e))
                     continue
             
-            # 限制总结果数量
-            if len(all_raw_data) > max_count:
-                all_raw_data = all_raw_data[:max_count]
-            
-            # 转换为统一格式
-            raw_contents = []
-            for item in all_raw_data:
-                try:
-                    content = self._convert_to_raw_content(item)
-                    if content:
-                        raw_contents.append(content)
-                except Exception as e:
-                    self.logger.warning("Failed to convert item", error=str(e), item_id=item.get('id'))
-                    continue
+            # 限制总结果数量（原地截断，避免复制）
+            del all_raw_data[max_count:]
             
-            # 内容过滤
-            filtered_contents = [
-                content for content in raw_contents 
-                if not self._should_filter_content(content)
-            ]
+            # 转换与过滤合并为单次流式处理，只保留最终结果列表
+            prepared = await self._prepare_items(all_raw_data)
+            converted_count = 0
+            filtered_contents = []
+            for content in self._iter_raw_contents(all_raw_data, prepared):
+                converted_count += 1
+                if not self._should_filter_content(content):
+                    filtered_contents.append(content)
             
             self.logger.info("Content filtered",
-                           original_count=len(raw_contents),
+                           original_count=converted_count,
                            filtered_count=len(filtered_contents))
             
             self.logger.info("Zhihu crawl completed via MediaCrawler",
@@ -357,23 +550,44 @@ class ZhihuPlatform(AbstractPlatform):
             'url': item.get('url', '')
         }
     
-    def _convert_to_raw_content(self, zhihu_data: Dict[str, Any]) -> RawContent:
+    async def _prepare_items(self, items: List[Dict[str, Any]]) -> Optional[List[Tuple[str, List[str], float]]]:
+        """大批量时在线程中执行CPU密集的预处理，小批量返回None（在转换时就地处理）"""
+        if len(items) <= OFFLOAD_MIN_BATCH:
+            return None
+        
+        try:
+            return await asyncio.to_thread(prepare_content_items, items)
+        except Exception as e:
+            self.logger.warning("Threaded preparation failed, falling back to inline", error=str(e))
+            return None
+    
+    def _iter_raw_contents(
+        self,
+        items: List[Dict[str, Any]],
+        prepared: Optional[List[Tuple[str, List[str], float]]] = None
+    ) -> Iterator[RawContent]:
+        """逐条转换为RawContent，跳过转换失败的数据"""
+        for index, item in enumerate(items):
+            try:
+                content = self._convert_to_raw_content(item, prepared[index] if prepared else None)
+                if content:
+                    yield content
+            except Exception as e:
+                self.logger.warning("Failed to convert item", error=str(e), item_id=item.get('id'))
+    
+    def _convert_to_raw_content(
+        self,
+        zhihu_data: Dict[str, Any],
+        prepared: Optional[Tuple[str, List[str], float]] = None
+    ) -> RawContent:
         """将知乎数据转换为统一的RawContent格式"""
         try:
-            content_type_map = {
-                'answer': ContentType.ANSWER,
-                'article': ContentType.ARTICLE,
-                'pin': ContentType.POST,  # 想法映射为POST
-                'question': ContentType.QUESTION
-            }
-            
-            content_type = content_type_map.get(
-                zhihu_data.get('type'), 
-                ContentType.POST
-            )
+            content_type = _CONTENT_TYPE_MAP.get(zhihu_data.get('type'), ContentType.POST)
             
-            # 清理HTML标签
-            content_text = self._clean_html_content(zhihu_data.get('content', ''))
+            # 清理HTML标签、提取话题、计算专业度（可能已在工作线程中完成）
+            if prepared is None:
+                prepared = prepare_content_items([zhihu_data])[0]
+            content_text, hashtags, professional_score = prepared
             
             # 处理标题
             title = ""
@@ -400,9 +614,6 @@ class ZhihuPlatform(AbstractPlatform):
             # 处理URL
             source_url = zhihu_data.get('url', '')
             
-            # 处理标签（从内容中提取话题）
-            hashtags = self._extract_hashtags_from_content(content_text)
-            
             return RawContent(
                 content_id=str(zhihu_data.get('id', '')),
                 platform=self.platform_name,
@@ -421,9 +632,9 @@ class ZhihuPlatform(AbstractPlatform):
                 hashtags=hashtags,
                 image_urls=[],  # 知乎图片需要特殊处理，暂时留空
                 platform_metadata={
-                    'zhihu_type': zhihu_data.get('type'),
-                    'professional_score': self._calculate_professional_score(zhihu_data),
-                    'author_headline': author.get('headline', ''),
+                    'zhihu_type': _intern_short(zhihu_data.get('type')),
+                    'professional_score': professional_score,
+                    'author_headline': _intern_short(author.get('headline', '')),
                     'follower_count': author.get('follower_count', 0)
                 }
             )
@@ -434,106 +645,20 @@ class ZhihuPlatform(AbstractPlatform):
     
     def _clean_html_content(self, content: str) -> str:
         """清理HTML标签并保留纯文本"""
-        if not content:
-            return ""
-        
-        # 解码HTML实体
-        content = html.unescape(content)
-        
-        # 移除HTML标签
-        content = re.sub(r'<[^>]+>', '', content)
-        
-        # 清理多余的空白字符
-        content = re.sub(r'\s+', ' ', content).strip()
-        
-        return content
+        return clean_html_content(content)
     
     def _extract_hashtags_from_content(self, content: str) -> List[str]:
         """从内容中提取话题标签"""
-        hashtags = []
-        
-        # 知乎中的话题通常用「」包围
-        topic_pattern = r'「([^」]+)」'
-        topics = re.findall(topic_pattern, content)
-        
-        for topic in topics:
-            topic = topic.strip()
-            if topic and topic not in hashtags:
-                hashtags.append(topic)
-        
-        return hashtags
+        return extract_hashtags_from_content(content)
     
     def _should_filter_content(self, content) -> bool:
         """判断内容是否应该被过滤掉"""
-        if isinstance(content, RawContent):
-            # 内容长度过滤
-            if len(content.content) < 20:  # 知乎内容一般较长
-                return True
-            
-            # 质量过滤：点赞数和评论数都很少的内容
-            if content.like_count < 5 and content.comment_count < 2:
-                return True
-            
-            # 专业度评估
-            if content.platform_metadata and content.platform_metadata.get('professional_score', 0) < 0.3:
-                return True
-                
-        elif isinstance(content, dict):
-            # 直接从字典数据过滤
-            text_content = content.get('content', '')
-            if len(text_content) < 20:
-                return True
-            
-            voteup_count = content.get('voteup_count', 0) or content.get('like_count', 0)
-            comment_count = content.get('comment_count', 0)
-            
-            if voteup_count < 5 and comment_count < 2:
-                return True
-        
-        return False
+        # 按类型查表分派（结果按类型缓存），避免逐条isinstance判断
+        return _content_filter_for(type(content))(content)
     
     def _calculate_professional_score(self, zhihu_data: Dict[str, Any]) -> float:
         """计算内容专业度分数"""
-        score = 0.0
-        
-        # 作者专业度
-        author = zhihu_data.get('author', {})
-        headline = author.get('headline', '')
-        follower_count = author.get('follower_count', 0)
-        
-        # 根据作者标题判断专业度
-        professional_keywords = ['分析师', '投资', '研究员', '专家', '顾问', '基金', '经理']
-        if any(keyword in headline for keyword in professional_keywords):
-            score += 0.3
-        
-        # 根据粉丝数量判断影响力
-        if follower_count > 10000:
-            score += 0.2
-        elif follower_count > 1000:
-            score += 0.1
-        
-        # 根据互动数据判断质量
-        voteup_count = zhihu_data.get('voteup_count', 0) or zhihu_data.get('like_count', 0)
-        comment_count = zhihu_data.get('comment_count', 0)
-        
-        if voteup_count > 100:
-            score += 0.2
-        elif voteup_count > 50:
-            score += 0.1
-        
-        if comment_count > 20:
-            score += 0.1
-        elif comment_count > 10:
-            score += 0.05
-        
-        # 根据内容长度判断深度
-        content_length = len(zhihu_data.get('content', ''))
-        if content_length > 1000:
-            score += 0.1
-        elif content_length > 500:
-            score += 0.05
-        
-        return min(score, 1.0)  # 最大值为1.0
+        return calculate_professional_score(zhihu_data)
     
     def _map_search_type(self, search_type_str: str):
         """映射搜索类型字符串到枚举"""
@@ -563,9 +688,7 @@ class ZhihuPlatform(AbstractPlatform):
     
     async def _delay_between_requests(self):
         """请求间延迟"""
-        import asyncio
-        delay = 60 / self.rate_limit  # 根据速率限制计算延迟
-        await asyncio.sleep(delay)
+        await asyncio.sleep(self._delay_seconds)
     
     async def _check_login_status(self) -> bool:
         """检查知乎登录状态"""
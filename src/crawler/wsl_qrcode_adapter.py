@@ -2,77 +2,132 @@
 WSL环境下的二维码登录适配器
 为WSL环境提供专门的二维码显示和登录支持
 """
+import asyncio
+import io
 import os
 import platform
-import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import structlog
 
 logger = structlog.get_logger()
 
+# 查找用户桌面时跳过的系统用户目录
+_SYSTEM_USER_FOLDERS = frozenset({'Public', 'Default', 'All Users'})
 
-class WSLQRCodeAdapter:
-    """WSL环境二维码适配器"""
-    
-    def __init__(self):
-        self.is_wsl = self._detect_wsl_environment()
-        self.desktop_path = self._get_windows_desktop_path() if self.is_wsl else None
+# 终端提示文本，模块加载时构建一次
+_ASCII_FRAME = """
+        ┌────────────────────────────────────────────────────┐
+        │                                                    │
+        │  🔐 小红书扫码登录 - WSL环境适配                     │
+        │                                                    │
+        │  📂 二维码文件已生成，请按以下步骤操作：              │
+        │                                                    │
+        │  1️⃣  打开Windows文件管理器                          │
+        │  2️⃣  找到桌面上的 xhs_qrcode.png 文件               │
+        │  3️⃣  双击打开图片                                   │
+        │  4️⃣  使用小红书APP扫描二维码                        │
+        │                                                    │
+        │  ⚠️  如果桌面没有文件，请查看程序输出的备份路径       │
+        │                                                    │
+        └────────────────────────────────────────────────────┘
+        """
+
+_WSL_HEADER = "\n" + "=" * 60 + "\n🔍 WSL环境检测到 - 二维码登录指引\n" + "=" * 60
+
+_WSL_FOOTER = (
+    "\n📱 扫码步骤:\n"
+    "   1. 在Windows中打开保存的二维码图片\n"
+    "   2. 使用小红书APP扫描二维码\n"
+    "   3. 完成登录后等待程序继续运行\n"
+    "\n⏰ 等待扫码中... (120秒超时)\n"
+    + "=" * 60
+)
+
+_TERMINAL_REMINDER = (
+    "\n💡 提示:\n"
+    "   - 如果无法打开图片，请检查Windows默认图片查看器\n"
+    "   - 确保小红书APP已安装并可以扫码\n"
+    "   - 扫码后请保持程序运行，等待登录完成"
+)
+
+
+@lru_cache(maxsize=1)
+def detect_wsl_environment() -> bool:
+    """检测是否在WSL环境中运行（进程内只检测一次）"""
+    try:
+        # 检查 /proc/version 文件中是否包含 WSL 或 Microsoft
+        if os.path.exists('/proc/version'):
+            with open('/proc/version', 'r') as f:
+                version_info = f.read().lower()
+                if 'microsoft' in version_info or 'wsl' in version_info:
+                    return True
         
-    def _detect_wsl_environment(self) -> bool:
-        """检测是否在WSL环境中运行"""
-        try:
-            # 检查 /proc/version 文件中是否包含 WSL 或 Microsoft
-            if os.path.exists('/proc/version'):
-                with open('/proc/version', 'r') as f:
-                    version_info = f.read().lower()
-                    if 'microsoft' in version_info or 'wsl' in version_info:
-                        return True
+        # 检查环境变量
+        wsl_distro = os.environ.get('WSL_DISTRO_NAME')
+        if wsl_distro:
+            return True
             
-            # 检查环境变量
-            wsl_distro = os.environ.get('WSL_DISTRO_NAME')
-            if wsl_distro:
-                return True
-                
-            # 检查是否在Linux上但有Windows文件系统挂载
-            if platform.system() == 'Linux' and os.path.exists('/mnt/c'):
-                return True
-                
-            return False
-        except Exception:
-            return False
-    
-    def _get_windows_desktop_path(self) -> Optional[str]:
-        """获取Windows桌面路径"""
-        if not self.is_wsl:
-            return None
+        # 检查是否在Linux上但有Windows文件系统挂载
+        if platform.system() == 'Linux' and os.path.exists('/mnt/c'):
+            return True
             
+        return False
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1)
+def get_windows_desktop_path() -> Optional[str]:
+    """获取Windows桌面路径（进程内只解析一次，避免重复访问/mnt/c）"""
+    if not detect_wsl_environment():
+        return None
+        
+    try:
+        # 尝试从环境变量获取用户名
+        username = os.environ.get('USER', os.environ.get('USERNAME', ''))
+        if username:
+            user_desktop = f'/mnt/c/Users/{username}/Desktop'
+            if os.path.exists(user_desktop):
+                return user_desktop
+        
+        # 单次scandir查找第一个可用的用户桌面（DirEntry自带类型信息，减少/mnt/c上的stat调用）
         try:
-            # 尝试从环境变量获取用户名
-            username = os.environ.get('USER', os.environ.get('USERNAME', ''))
-            if username:
-                user_desktop = f'/mnt/c/Users/{username}/Desktop'
-                if os.path.exists(user_desktop):
-                    return user_desktop
-            
-            # 查找第一个可用的用户桌面
-            users_dir = '/mnt/c/Users'
-            if os.path.exists(users_dir):
-                for user_folder in os.listdir(users_dir):
-                    desktop_path = os.path.join(users_dir, user_folder, 'Desktop')
-                    if os.path.exists(desktop_path) and user_folder not in ['Public', 'Default', 'All Users']:
+            with os.scandir('/mnt/c/Users') as entries:
+                for entry in entries:
+                    if entry.name in _SYSTEM_USER_FOLDERS or not entry.is_dir():
+                        continue
+                    desktop_path = os.path.join(entry.path, 'Desktop')
+                    if os.path.isdir(desktop_path):
                         return desktop_path
+        except FileNotFoundError:
+            pass
+        
+        # 使用Public桌面作为最后选择
+        public_desktop = '/mnt/c/Users/Public/Desktop'
+        if os.path.exists(public_desktop):
+            return public_desktop
             
-            # 使用Public桌面作为最后选择
-            public_desktop = '/mnt/c/Users/Public/Desktop'
-            if os.path.exists(public_desktop):
-                return public_desktop
-                
-            return None
-        except Exception as e:
-            logger.error("获取Windows桌面路径失败", error=str(e))
-            return None
+        return None
+    except Exception as e:
+        logger.error("获取Windows桌面路径失败", error=str(e))
+        return None
+
+
+class WSLQRCodeAdapter:
+    """WSL环境二维码适配器"""
+    
+    @property
+    def is_wsl(self) -> bool:
+        """是否运行在WSL环境"""
+        return detect_wsl_environment()
+    
+    @property
+    def desktop_path(self) -> Optional[str]:
+        """Windows桌面路径"""
+        return get_windows_desktop_path()
     
     def save_qrcode_to_desktop(self, image, filename: str = 'xhs_qrcode.png') -> Optional[str]:
         """保存二维码到Windows桌面"""
@@ -81,15 +136,27 @@ class WSLQRCodeAdapter:
             
         try:
             qr_file_path = os.path.join(self.desktop_path, filename)
-            image.save(qr_file_path)
+            # 先在内存中编码，再一次性写入/mnt/c，避免PIL在9P文件系统上的大量小写操作
+            self._write_png(image, qr_file_path)
             logger.info(f"二维码已保存到Windows桌面: {qr_file_path}")
             return qr_file_path
         except Exception as e:
             logger.error(f"保存二维码到桌面失败: {e}")
             return None
     
+    @staticmethod
+    def _write_png(image, file_path: str) -> None:
+        """将图片编码为PNG后单次写入文件"""
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        with open(file_path, 'wb') as f:
+            f.write(buffer.getvalue())
+    
     def save_qrcode_to_temp(self, image, filename: str = 'xhs_qrcode.png') -> str:
         """保存二维码到临时目录"""
+        # 仅在登录流程中使用，延迟导入
+        import tempfile
+        
         try:
             temp_dir = tempfile.gettempdir()
             qr_file_path = os.path.join(temp_dir, filename)
@@ -100,47 +167,34 @@ class WSLQRCodeAdapter:
             logger.error(f"保存二维码到临时目录失败: {e}")
             return ""
     
+    async def save_qrcode_to_desktop_async(self, image, filename: str = 'xhs_qrcode.png') -> Optional[str]:
+        """在线程池中保存二维码到Windows桌面，避免阻塞事件循环"""
+        return await asyncio.to_thread(self.save_qrcode_to_desktop, image, filename)
+    
+    async def save_qrcode_to_temp_async(self, image, filename: str = 'xhs_qrcode.png') -> str:
+        """在线程池中保存二维码到临时目录，避免阻塞事件循环"""
+        return await asyncio.to_thread(self.save_qrcode_to_temp, image, filename)
+    
     def show_wsl_instructions(self, desktop_path: Optional[str] = None, temp_path: Optional[str] = None):
         """显示WSL环境下的操作指引"""
-        print("\n" + "="*60)
-        print("🔍 WSL环境检测到 - 二维码登录指引")
-        print("="*60)
+        # 先拼好全部行再一次性输出，避免逐行写终端
+        lines = [_WSL_HEADER]
         
         if desktop_path:
-            print(f"✅ 二维码已保存到Windows桌面:")
-            print(f"   📁 {desktop_path}")
-            print("   👆 请在Windows文件管理器中打开上述文件")
+            lines.append("✅ 二维码已保存到Windows桌面:")
+            lines.append(f"   📁 {desktop_path}")
+            lines.append("   👆 请在Windows文件管理器中打开上述文件")
         
         if temp_path:
-            print(f"\n📋 备份位置:")
-            print(f"   📁 {temp_path}")
-        
-        print("\n📱 扫码步骤:")
-        print("   1. 在Windows中打开保存的二维码图片")
-        print("   2. 使用小红书APP扫描二维码")
-        print("   3. 完成登录后等待程序继续运行")
+            lines.append("\n📋 备份位置:")
+            lines.append(f"   📁 {temp_path}")
         
-        print("\n⏰ 等待扫码中... (120秒超时)")
-        print("="*60)
+        lines.append(_WSL_FOOTER)
+        print('\n'.join(lines))
     
     def show_ascii_frame(self):
         """显示ASCII艺术边框提示"""
-        print("""
-        ┌────────────────────────────────────────────────────┐
-        │                                                    │
-        │  🔐 小红书扫码登录 - WSL环境适配                     │
-        │                                                    │
-        │  📂 二维码文件已生成，请按以下步骤操作：              │
-        │                                                    │
-        │  1️⃣  打开Windows文件管理器                          │
-        │  2️⃣  找到桌面上的 xhs_qrcode.png 文件               │
-        │  3️⃣  双击打开图片                                   │
-        │  4️⃣  使用小红书APP扫描二维码                        │
-        │                                                    │
-        │  ⚠️  如果桌面没有文件，请查看程序输出的备份路径       │
-        │                                                    │
-        └────────────────────────────────────────────────────┘
-        """)
+        print(_ASCII_FRAME)
     
     def handle_qrcode_display(self, image) -> None:
         """处理WSL环境下的二维码显示"""
@@ -165,33 +219,48 @@ class WSLQRCodeAdapter:
         # 额外的终端提示
         self._show_terminal_reminder()
     
+    async def handle_qrcode_display_async(self, image) -> None:
+        """处理WSL环境下的二维码显示（异步版本，文件写入在线程池中执行）"""
+        if not self.is_wsl:
+            await asyncio.to_thread(self.handle_qrcode_display, image)
+            return
+        
+        desktop_path = await self.save_qrcode_to_desktop_async(image)
+        temp_path = await self.save_qrcode_to_temp_async(image)
+        
+        self.show_ascii_frame()
+        self.show_wsl_instructions(desktop_path, temp_path)
+        self._show_terminal_reminder()
+    
     def _show_terminal_reminder(self):
         """显示终端提醒信息"""
-        print("\n💡 提示:")
-        print("   - 如果无法打开图片，请检查Windows默认图片查看器")
-        print("   - 确保小红书APP已安装并可以扫码")
-        print("   - 扫码后请保持程序运行，等待登录完成")
+        print(_TERMINAL_REMINDER)
         
+    @staticmethod
+    def _remove_file(file_path: str, label: str) -> None:
+        """删除文件，文件不存在时直接忽略（省去一次exists检查）"""
+        try:
+            os.remove(file_path)
+            logger.info(f"已清理{label}二维码文件")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"清理{label}二维码文件时出错: {e}")
+    
     def cleanup_qrcode_files(self, filename: str = 'xhs_qrcode.png'):
         """清理生成的二维码文件"""
-        try:
-            # 清理桌面文件
-            if self.desktop_path:
-                desktop_file = os.path.join(self.desktop_path, filename)
-                if os.path.exists(desktop_file):
-                    os.remove(desktop_file)
-                    logger.info("已清理桌面二维码文件")
-            
-            # 清理临时文件
-            temp_dir = tempfile.gettempdir()
-            temp_file = os.path.join(temp_dir, filename)
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-                logger.info("已清理临时二维码文件")
-                
-        except Exception as e:
-            logger.warning(f"清理二维码文件时出错: {e}")
+        # 清理桌面文件
+        if self.desktop_path:
+            self._remove_file(os.path.join(self.desktop_path, filename), "桌面")
+        
+        # 清理临时文件
+        import tempfile
+        self._remove_file(os.path.join(tempfile.gettempdir(), filename), "临时")
+    
+    async def cleanup_qrcode_files_async(self, filename: str = 'xhs_qrcode.png'):
+        """在线程池中清理生成的二维码文件，避免阻塞事件循环"""
+        await asyncio.to_thread(self.cleanup_qrcode_files, filename)
 
 
 # 全局适配器实例
-wsl_qrcode_adapter = WSLQRCodeAdapter()
\ No newline at end of file
+wsl_qrcode_adapter = WSLQRCodeAdapter()
@@ -0,0 +1,95 @@
+"""
+基于Redis的查询结果缓存
+"""
+import json
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional
+import structlog
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+from ..config.settings import settings
+
+logger = structlog.get_logger()
+
+# Redis连接失败后暂停使用缓存的秒数，避免每次请求都重试连接
+REDIS_RETRY_INTERVAL = 60
+
+_redis_client = None
+_redis_disabled_until = 0.0
+
+
+def _get_redis():
+    """获取Redis客户端，不可用时返回None"""
+    global _redis_client
+    
+    if aioredis is None or settings.stats_cache_ttl <= 0:
+        return None
+    if time.monotonic() < _redis_disabled_until:
+        return None
+    
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+    return _redis_client
+
+
+def _mark_redis_unavailable(error: Exception) -> None:
+    """记录Redis不可用，在重试间隔内跳过缓存"""
+    global _redis_disabled_until
+    _redis_disabled_until = time.monotonic() + REDIS_RETRY_INTERVAL
+    logger.warning("Redis cache unavailable, falling back to database", error=str(error))
+
+
+def cached(
+    key: str,
+    ttl: Optional[int] = None,
+    encode: Callable[[Any], Any] = lambda value: value,
+    decode: Callable[[Any], Any] = lambda value: value
+):
+    """缓存异步函数结果到Redis
+    
+    缓存键与函数参数无关，适用于全局聚合结果；Redis不可用时直接调用原函数。
+    encode/decode 用于在结果与可JSON序列化的结构之间转换。
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = _get_redis()
+            if client is not None:
+                try:
+                    cached_value = await client.get(key)
+                    if cached_value is not None:
+                        return decode(json.loads(cached_value))
+                except Exception as e:
+                    _mark_redis_unavailable(e)
+                    client = None
+            
+            result = await func(*args, **kwargs)
+            
+            if client is not None:
+                try:
+                    await client.setex(key, ttl or settings.stats_cache_ttl, json.dumps(encode(result)))
+                except Exception as e:
+                    _mark_redis_unavailable(e)
+            return result
+        return wrapper
+    return decorator
+
+
+async def invalidate(key: str) -> None:
+    """删除缓存键"""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.delete(key)
+    except Exception as e:
+        _mark_redis_unavailable(e)
@@ -1,17 +1,131 @@
 """
 数据库CRUD操作
 """
-from typing import List, Optional, Dict, Any
+import time
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import select, insert, update, delete, func, and_, or_, case, inspect
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from sqlalchemy.exc import IntegrityError
 import structlog
 
 from .models import TGEProject, CrawlerLog, AIProcessLog
+from .cache import cached, invalidate
 
 logger = structlog.get_logger()
 
+# 项目统计结果的缓存键，数据变更时需要失效
+STATS_CACHE_KEY = 'tge:stats'
+
+# 清理过期记录时每批删除的行数
+CLEANUP_BATCH_SIZE = 1000
+
+# 批量创建时每条多行INSERT语句包含的行数
+BULK_INSERT_BATCH_SIZE = 500
+
+# 项目搜索结果（ID列表和总数）的进程内缓存，翻页或重复搜索时不再重复扫描
+SEARCH_CACHE_TTL = 10
+SEARCH_CACHE_MAXSIZE = 256
+_search_cache: "OrderedDict[Tuple, Tuple[float, List[int], int]]" = OrderedDict()
+
+# 列表/摘要场景所需的列，避免加载 raw_content、ai_summary 等大文本字段
+SUMMARY_COLUMNS = (
+    TGEProject.id,
+    TGEProject.project_name,
+    TGEProject.token_symbol,
+    TGEProject.project_category,
+    TGEProject.risk_level,
+    TGEProject.sentiment,
+    TGEProject.source_platform,
+    TGEProject.engagement_score,
+    TGEProject.tge_date,
+    TGEProject.is_processed,
+    TGEProject.created_at,
+)
+
+
+def _encode_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """情感分布可能包含None键，转为键值对列表以便JSON序列化"""
+    return {**stats, "sentiment_distribution": list(stats["sentiment_distribution"].items())}
+
+
+def _decode_statistics(data: Dict[str, Any]) -> Dict[str, Any]:
+    """还原缓存中的统计结果"""
+    return {**data, "sentiment_distribution": dict(data["sentiment_distribution"])}
+
+
+# 分页过滤条件构造表：过滤键 -> 条件构造函数
+_FILTER_BUILDERS = {
+    'project_category': lambda value: TGEProject.project_category == value,
+    'risk_level': lambda value: TGEProject.risk_level == value,
+    'source_platform': lambda value: TGEProject.source_platform == value,
+    'has_tge_date': lambda value: TGEProject.tge_date.isnot(None) if value else TGEProject.tge_date.is_(None),
+    'is_processed': lambda value: TGEProject.is_processed == value,
+}
+
+# 允许排序的列，未知字段回退为 created_at，避免按任意模型属性排序
+_SORTABLE_COLUMNS = {
+    'id': TGEProject.id,
+    'created_at': TGEProject.created_at,
+    'updated_at': TGEProject.updated_at,
+    'project_name': TGEProject.project_name,
+    'tge_date': TGEProject.tge_date,
+    'engagement_score': TGEProject.engagement_score,
+    'confidence_score': TGEProject.confidence_score,
+}
+
+# 搜索仅支持按分类、风险和平台过滤
+_SEARCH_FILTER_BUILDERS = {
+    key: _FILTER_BUILDERS[key] for key in ('project_category', 'risk_level', 'source_platform')
+}
+
+
+async def _load_server_defaults(session: AsyncSession, instance: Any) -> None:
+    """加载插入后尚未取回的服务端默认值
+    
+    支持 INSERT ... RETURNING 的数据库在flush时已取回 created_at 等字段，无需再查询；
+    MySQL 不支持 RETURNING，仅刷新这些过期字段
+    """
+    expired = inspect(instance).expired_attributes
+    if expired:
+        await session.refresh(instance, attribute_names=list(expired))
+
+
+def _select_projects(columns: Optional[Sequence[Any]] = None):
+    """构造项目查询，指定columns时只加载这些列，访问其他列会直接报错而不是触发异步懒加载"""
+    query = select(TGEProject)
+    if columns:
+        query = query.options(load_only(*columns, raiseload=True))
+    return query
+
+
+def _boolean_phrases(keywords: Sequence[str]) -> str:
+    """将关键词转换为全文检索布尔模式的短语查询，任一短语命中即可
+    
+    去掉双引号避免破坏布尔模式语法
+    """
+    return ' '.join('"%s"' % keyword.replace('"', ' ') for keyword in keywords if keyword.strip())
+
+
+def _build_filter_conditions(filters: Optional[Dict[str, Any]], builders: Dict[str, Any]) -> List[Any]:
+    """根据过滤参数构造查询条件，忽略未知键以及None/空字符串值"""
+    if not filters:
+        return []
+    return [
+        builder(value)
+        for key, value in filters.items()
+        if value is not None and value != '' and (builder := builders.get(key)) is not None
+    ]
+
+
+async def _invalidate_project_caches() -> None:
+    """项目数据变更后清除统计缓存和搜索结果缓存"""
+    _search_cache.clear()
+    await invalidate(STATS_CACHE_KEY)
+
 
 class TGEProjectCRUD:
     """TGE项目数据操作"""
@@ -23,7 +137,8 @@ class TGEProjectCRUD:
             project = TGEProject(**project_data)
             session.add(project)
             await session.commit()
-            await session.refresh(project)
+            await _load_server_defaults(session, project)
+            await _invalidate_project_caches()
             logger.info("TGE project created", project_id=project.id, project_name=project.project_name)
             return project
         except IntegrityError:
@@ -35,6 +150,73 @@ class TGEProjectCRUD:
             logger.error("Failed to create TGE project", error=str(e))
             raise
     
+    @staticmethod
+    async def create_many(session: AsyncSession, projects_data: List[Dict[str, Any]]) -> int:
+        """批量创建TGE项目记录，整批只提交一次
+        
+        遇到重复的content_hash时，剔除库中已存在及批内重复的记录后重新提交，
+        仍冲突（并发写入）则逐条创建。返回实际新增的记录数。
+        """
+        if not projects_data:
+            return 0
+        
+        try:
+            await TGEProjectCRUD._bulk_insert(session, projects_data)
+            await session.commit()
+            inserted = len(projects_data)
+        except IntegrityError:
+            await session.rollback()
+            inserted = await TGEProjectCRUD._create_many_skip_duplicates(session, projects_data)
+        except Exception as e:
+            await session.rollback()
+            logger.error("Failed to create TGE projects in batch", count=len(projects_data), error=str(e))
+            raise
+        
+        await _invalidate_project_caches()
+        logger.info("TGE projects created in batch", requested=len(projects_data), inserted=inserted)
+        return inserted
+    
+    @staticmethod
+    async def _bulk_insert(session: AsyncSession, projects_data: List[Dict[str, Any]]) -> None:
+        """以多行INSERT分批写入，不构造ORM对象，也无需逐行回取主键"""
+        for start in range(0, len(projects_data), BULK_INSERT_BATCH_SIZE):
+            await session.execute(insert(TGEProject), projects_data[start:start + BULK_INSERT_BATCH_SIZE])
+    
+    @staticmethod
+    async def _create_many_skip_duplicates(session: AsyncSession, projects_data: List[Dict[str, Any]]) -> int:
+        """剔除重复content_hash后批量创建"""
+        hashes = [data.get('content_hash') for data in projects_data]
+        result = await session.execute(
+            select(TGEProject.content_hash).where(TGEProject.content_hash.in_(hashes))
+        )
+        seen = set(result.scalars().all())
+        
+        remaining = []
+        for data in projects_data:
+            content_hash = data.get('content_hash')
+            if content_hash in seen:
+                continue
+            seen.add(content_hash)
+            remaining.append(data)
+        
+        logger.warning("Duplicate content hashes skipped in batch",
+                       skipped=len(projects_data) - len(remaining))
+        if not remaining:
+            return 0
+        
+        try:
+            await TGEProjectCRUD._bulk_insert(session, remaining)
+            await session.commit()
+            return len(remaining)
+        except IntegrityError:
+            # 并发写入导致仍有冲突，逐条创建只跳过冲突的记录
+            await session.rollback()
+            inserted = 0
+            for data in remaining:
+                if await TGEProjectCRUD.create(session, data):
+                    inserted += 1
+            return inserted
+    
     @staticmethod
     async def get_by_id(session: AsyncSession, project_id: int) -> Optional[TGEProject]:
         """根据ID获取TGE项目"""
@@ -48,9 +230,14 @@ class TGEProjectCRUD:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_latest(session: AsyncSession, limit: int = 10, sentiment: Optional[str] = None) -> List[TGEProject]:
+    async def get_latest(
+        session: AsyncSession,
+        limit: int = 10,
+        sentiment: Optional[str] = None,
+        columns: Optional[Sequence[Any]] = None
+    ) -> List[TGEProject]:
         """获取最新的TGE项目"""
-        query = select(TGEProject).where(TGEProject.is_valid == True)
+        query = _select_projects(columns).where(TGEProject.is_valid == True)
         
         if sentiment:
             query = query.where(TGEProject.sentiment == sentiment)
@@ -61,17 +248,30 @@ class TGEProjectCRUD:
     
     @staticmethod
     async def search_by_keywords(session: AsyncSession, keywords: List[str], limit: int = 20) -> List[TGEProject]:
-        """根据关键词搜索TGE项目"""
-        conditions = []
-        for keyword in keywords:
-            conditions.append(TGEProject.raw_content.contains(keyword))
-            conditions.append(TGEProject.ai_summary.contains(keyword))
-            conditions.append(TGEProject.project_name.contains(keyword))
+        """根据关键词搜索TGE项目
+        
+        MySQL 下走 ft_search 全文索引（MATCH ... AGAINST），其他数据库回退为 LIKE 匹配
+        """
+        if session.get_bind().dialect.name == 'mysql':
+            phrases = _boolean_phrases(keywords)
+            if not phrases:
+                return []
+            search_condition = match(
+                TGEProject.raw_content, TGEProject.ai_summary, TGEProject.project_name,
+                against=phrases
+            ).in_boolean_mode()
+        else:
+            conditions = []
+            for keyword in keywords:
+                conditions.append(TGEProject.raw_content.contains(keyword))
+                conditions.append(TGEProject.ai_summary.contains(keyword))
+                conditions.append(TGEProject.project_name.contains(keyword))
+            search_condition = or_(*conditions)
         
         query = select(TGEProject).where(
             and_(
                 TGEProject.is_valid == True,
-                or_(*conditions)
+                search_condition
             )
         ).order_by(TGEProject.created_at.desc()).limit(limit)
         
@@ -88,6 +288,7 @@ class TGEProjectCRUD:
                 .values(**analysis_data, is_processed=True)
             )
             await session.commit()
+            await _invalidate_project_caches()
             logger.info("AI analysis updated", project_id=project_id)
             return True
         except Exception as e:
@@ -109,33 +310,54 @@ class TGEProjectCRUD:
         return list(result.scalars().all())
     
     @staticmethod
-    async def cleanup_old_records(session: AsyncSession, days: int = 30) -> int:
-        """清理过期记录"""
+    async def cleanup_old_records(session: AsyncSession, days: int = 30, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
+        """清理过期记录
+        
+        分批删除并逐批提交，避免单个大事务长时间锁表
+        """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
+        expired = TGEProject.created_at < cutoff_date
         
-        result = await session.execute(
-            delete(TGEProject).where(TGEProject.created_at < cutoff_date)
-        )
-        await session.commit()
+        if session.get_bind().dialect.name == 'mysql':
+            statement = delete(TGEProject).where(expired).with_dialect_options(mysql_limit=batch_size)
+        else:
+            # 其他数据库不支持 DELETE ... LIMIT，通过主键子查询限定每批范围
+            batch_ids = select(TGEProject.id).where(expired).limit(batch_size).scalar_subquery()
+            statement = delete(TGEProject).where(TGEProject.id.in_(batch_ids))
+        statement = statement.execution_options(synchronize_session=False)
+        
+        deleted_count = 0
+        while True:
+            result = await session.execute(statement)
+            await session.commit()
+            deleted_count += result.rowcount
+            if result.rowcount < batch_size:
+                break
         
-        deleted_count = result.rowcount
+        if deleted_count:
+            await _invalidate_project_caches()
         logger.info("Old records cleaned up", deleted_count=deleted_count, days=days)
         return deleted_count
     
     @staticmethod
+    @cached(STATS_CACHE_KEY, encode=_encode_statistics, decode=_decode_statistics)
     async def get_statistics(session: AsyncSession) -> Dict[str, Any]:
         """获取统计信息"""
-        total_query = select(func.count(TGEProject.id))
-        total_result = await session.execute(total_query)
-        total_count = total_result.scalar()
-        
-        processed_query = select(func.count(TGEProject.id)).where(TGEProject.is_processed == True)
-        processed_result = await session.execute(processed_query)
-        processed_count = processed_result.scalar()
+        # 单次查询：按情感分组同时统计总数和已处理数，总计在应用层汇总
+        stats_query = select(
+            TGEProject.sentiment,
+            func.count(TGEProject.id),
+            func.sum(case((TGEProject.is_processed == True, 1), else_=0))
+        ).group_by(TGEProject.sentiment)
+        stats_result = await session.execute(stats_query)
         
-        sentiment_query = select(TGEProject.sentiment, func.count(TGEProject.id)).group_by(TGEProject.sentiment)
-        sentiment_result = await session.execute(sentiment_query)
-        sentiment_stats = dict(sentiment_result.all())
+        sentiment_stats = {}
+        total_count = 0
+        processed_count = 0
+        for sentiment, count, processed in stats_result.all():
+            sentiment_stats[sentiment] = count
+            total_count += count
+            processed_count += processed or 0
         
         return {
             "total_projects": total_count,
@@ -178,34 +400,33 @@ class TGEProjectCRUD:
         return list(result.scalars().all())
     
     @staticmethod
-    async def count_all(session: AsyncSession) -> int:
-        """统计所有项目数量"""
-        result = await session.execute(select(func.count(TGEProject.id)))
-        return result.scalar()
-    
-    @staticmethod
-    async def count_processed(session: AsyncSession) -> int:
-        """统计已处理项目数量"""
-        result = await session.execute(
-            select(func.count(TGEProject.id)).where(TGEProject.is_processed == True)
-        )
-        return result.scalar()
-    
-    @staticmethod
-    async def count_unprocessed(session: AsyncSession) -> int:
-        """统计未处理项目数量"""
-        result = await session.execute(
-            select(func.count(TGEProject.id)).where(TGEProject.is_processed == False)
-        )
-        return result.scalar()
-    
-    @staticmethod
-    async def count_recent(session: AsyncSession, since: datetime) -> int:
-        """统计指定时间以来的项目数量"""
-        result = await session.execute(
-            select(func.count(TGEProject.id)).where(TGEProject.created_at >= since)
+    async def _paginate(
+        session: AsyncSession,
+        conditions: List[Any],
+        order_by: Any,
+        page: int,
+        size: int,
+        columns: Optional[Sequence[Any]] = None
+    ) -> tuple[List[TGEProject], int]:
+        """分页查询，通过窗口函数 COUNT(*) OVER() 在同一次扫描中取得总数"""
+        offset = (page - 1) * size
+        query = (
+            _select_projects(columns)
+            .add_columns(func.count().over().label('_total'))
+            .where(*conditions)
+            .order_by(order_by)
+            .offset(offset)
+            .limit(size)
         )
-        return result.scalar()
+        result = await session.execute(query)
+        rows = result.all()
+        
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if offset == 0:
+            return [], 0
+        # 页码超出范围时窗口函数没有返回行，单独统计总数
+        return [], await TGEProjectCRUD._count(session, *conditions)
     
     @staticmethod
     async def get_paginated(
@@ -214,54 +435,23 @@ class TGEProjectCRUD:
         size: int = 20,
         filters: Dict[str, Any] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        columns: Optional[Sequence[Any]] = None
     ) -> tuple[List[TGEProject], int]:
-        """分页获取项目列表"""
-        # 构建基础查询
-        query = select(TGEProject).where(TGEProject.is_valid == True)
-        count_query = select(func.count(TGEProject.id)).where(TGEProject.is_valid == True)
+        """分页获取项目列表，columns 为需要加载的列（默认加载完整记录）"""
+        conditions = [TGEProject.is_valid == True]
         
         # 应用过滤条件
-        if filters:
-            conditions = []
-            for key, value in filters.items():
-                if key == 'project_category' and value:
-                    conditions.append(TGEProject.project_category == value)
-                elif key == 'risk_level' and value:
-                    conditions.append(TGEProject.risk_level == value)
-                elif key == 'source_platform' and value:
-                    conditions.append(TGEProject.source_platform == value)
-                elif key == 'has_tge_date' and value is not None:
-                    if value:
-                        conditions.append(TGEProject.tge_date.isnot(None))
-                    else:
-                        conditions.append(TGEProject.tge_date.is_(None))
-                elif key == 'is_processed' and value is not None:
-                    conditions.append(TGEProject.is_processed == value)
-            
-            if conditions:
-                query = query.where(and_(*conditions))
-                count_query = count_query.where(and_(*conditions))
+        conditions.extend(_build_filter_conditions(filters, _FILTER_BUILDERS))
         
         # 应用排序
-        sort_column = getattr(TGEProject, sort_by, TGEProject.created_at)
+        sort_column = _SORTABLE_COLUMNS.get(sort_by, TGEProject.created_at)
         if sort_order.lower() == "desc":
-            query = query.order_by(sort_column.desc())
+            order_by = sort_column.desc()
         else:
-            query = query.order_by(sort_column.asc())
-        
-        # 应用分页
-        offset = (page - 1) * size
-        query = query.offset(offset).limit(size)
-        
-        # 执行查询
-        items_result = await session.execute(query)
-        total_result = await session.execute(count_query)
+            order_by = sort_column.asc()
         
-        items = list(items_result.scalars().all())
-        total = total_result.scalar()
-        
-        return items, total
+        return await TGEProjectCRUD._paginate(session, conditions, order_by, page, size, columns)
     
     @staticmethod
     async def search(
@@ -269,61 +459,69 @@ class TGEProjectCRUD:
         query: str,
         page: int = 1, 
         size: int = 20,
-        filters: Dict[str, Any] = None
+        filters: Dict[str, Any] = None,
+        columns: Optional[Sequence[Any]] = None
     ) -> tuple[List[TGEProject], int]:
-        """搜索项目"""
-        # 构建搜索条件
-        search_conditions = [
-            TGEProject.project_name.contains(query),
-            TGEProject.token_symbol.contains(query),
-            TGEProject.raw_content.contains(query),
-            TGEProject.tge_summary.contains(query),
-            TGEProject.key_features.contains(query)
-        ]
-        
-        base_query = select(TGEProject).where(
-            and_(
-                TGEProject.is_valid == True,
-                or_(*search_conditions)
-            )
-        )
+        """搜索项目，columns 为需要加载的列（默认加载完整记录）
         
-        count_query = select(func.count(TGEProject.id)).where(
-            and_(
-                TGEProject.is_valid == True,
-                or_(*search_conditions)
-            )
-        )
+        MySQL 下走 ft_project_search 全文索引，其他数据库回退为 LIKE 匹配；
+        结果ID和总数缓存 SEARCH_CACHE_TTL 秒，命中时只按主键取回当前页
+        """
+        query = query.strip()
+        cache_key = (query.lower(), tuple(sorted((filters or {}).items())), page, size)
+        cached_entry = _search_cache.get(cache_key)
+        if cached_entry is not None and cached_entry[0] > time.monotonic():
+            _search_cache.move_to_end(cache_key)
+            _, project_ids, total = cached_entry
+            return await TGEProjectCRUD._get_by_ids(session, project_ids, columns), total
+        
+        conditions = [TGEProject.is_valid == True]
+        
+        # 构建搜索条件
+        if session.get_bind().dialect.name == 'mysql':
+            phrases = _boolean_phrases([query])
+            if phrases:
+                conditions.append(match(
+                    TGEProject.project_name, TGEProject.token_symbol, TGEProject.raw_content,
+                    TGEProject.tge_summary, TGEProject.key_features,
+                    against=phrases
+                ).in_boolean_mode())
+        else:
+            conditions.append(or_(
+                TGEProject.project_name.contains(query),
+                TGEProject.token_symbol.contains(query),
+                TGEProject.raw_content.contains(query),
+                TGEProject.tge_summary.contains(query),
+                TGEProject.key_features.contains(query)
+            ))
         
         # 应用过滤条件
-        if filters:
-            conditions = []
-            for key, value in filters.items():
-                if key == 'project_category' and value:
-                    conditions.append(TGEProject.project_category == value)
-                elif key == 'risk_level' and value:
-                    conditions.append(TGEProject.risk_level == value)
-                elif key == 'source_platform' and value:
-                    conditions.append(TGEProject.source_platform == value)
-            
-            if conditions:
-                base_query = base_query.where(and_(*conditions))
-                count_query = count_query.where(and_(*conditions))
-        
-        # 排序和分页
-        base_query = base_query.order_by(TGEProject.created_at.desc())
-        offset = (page - 1) * size
-        base_query = base_query.offset(offset).limit(size)
+        conditions.extend(_build_filter_conditions(filters, _SEARCH_FILTER_BUILDERS))
         
-        # 执行查询
-        items_result = await session.execute(base_query)
-        total_result = await session.execute(count_query)
+        items, total = await TGEProjectCRUD._paginate(
+            session, conditions, TGEProject.created_at.desc(), page, size, columns
+        )
         
-        items = list(items_result.scalars().all())
-        total = total_result.scalar()
+        _search_cache[cache_key] = (time.monotonic() + SEARCH_CACHE_TTL, [item.id for item in items], total)
+        _search_cache.move_to_end(cache_key)
+        if len(_search_cache) > SEARCH_CACHE_MAXSIZE:
+            _search_cache.popitem(last=False)
         
         return items, total
     
+    @staticmethod
+    async def _get_by_ids(
+        session: AsyncSession,
+        project_ids: List[int],
+        columns: Optional[Sequence[Any]] = None
+    ) -> List[TGEProject]:
+        """按主键批量获取项目，保持传入ID的顺序"""
+        if not project_ids:
+            return []
+        result = await session.execute(_select_projects(columns).where(TGEProject.id.in_(project_ids)))
+        projects = {project.id: project for project in result.scalars().all()}
+        return [projects[project_id] for project_id in project_ids if project_id in projects]
+    
     @staticmethod
     async def get_platform_stats(session: AsyncSession) -> Dict[str, int]:
         """获取各平台项目数量统计"""
@@ -343,40 +541,34 @@ class TGEProjectCRUD:
         )
         return dict(result.all())
     
+    @staticmethod
+    async def _count(session: AsyncSession, *conditions) -> int:
+        """按给定条件统计项目数量"""
+        query = select(func.count(TGEProject.id))
+        if conditions:
+            query = query.where(*conditions)
+        result = await session.execute(query)
+        return result.scalar()
+    
     @staticmethod
     async def count_all(session: AsyncSession) -> int:
         """统计所有项目数量"""
-        result = await session.execute(
-            select(func.count(TGEProject.id))
-        )
-        return result.scalar()
+        return await TGEProjectCRUD._count(session)
     
     @staticmethod
     async def count_processed(session: AsyncSession) -> int:
         """统计已处理项目数量"""
-        result = await session.execute(
-            select(func.count(TGEProject.id))
-            .where(TGEProject.is_processed == True)
-        )
-        return result.scalar()
+        return await TGEProjectCRUD._count(session, TGEProject.is_processed == True)
     
     @staticmethod
     async def count_unprocessed(session: AsyncSession) -> int:
         """统计未处理项目数量"""
-        result = await session.execute(
-            select(func.count(TGEProject.id))
-            .where(TGEProject.is_processed == False)
-        )
-        return result.scalar()
+        return await TGEProjectCRUD._count(session, TGEProject.is_processed == False)
     
     @staticmethod
     async def count_recent(session: AsyncSession, since: datetime) -> int:
         """统计指定时间以来的项目数量"""
-        result = await session.execute(
-            select(func.count(TGEProject.id))
-            .where(TGEProject.created_at >= since)
-        )
-        return result.scalar()
+        return await TGEProjectCRUD._count(session, TGEProject.created_at >= since)
 
 
 class CrawlerLogCRUD:
@@ -388,7 +580,7 @@ class CrawlerLogCRUD:
         log = CrawlerLog(**log_data)
         session.add(log)
         await session.commit()
-        await session.refresh(log)
+        await _load_server_defaults(session, log)
         return log
     
     @staticmethod
@@ -416,7 +608,7 @@ class AIProcessLogCRUD:
         log = AIProcessLog(**log_data)
         session.add(log)
         await session.commit()
-        await session.refresh(log)
+        await _load_server_defaults(session, log)
         return log
     
     @staticmethod
@@ -445,4 +637,4 @@ class AIProcessLogCRUD:
         except Exception as e:
             await session.rollback()
             logger.error("Failed to update AI log status", error=str(e))
-            return False
\ No newline at end of file
+            return False
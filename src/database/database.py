@@ -18,6 +18,8 @@ engine = create_async_engine(
     echo=settings.app_debug,
     pool_pre_ping=True,
     pool_recycle=3600,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
 )
 
 # 创建会话工厂
@@ -4,6 +4,7 @@
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, Float, Boolean, Index
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -19,7 +20,11 @@ class TGEProject(Base):
     
     # 项目基本信息
     project_name = Column(String(255), nullable=False, comment="项目名称")
-    content_hash = Column(String(64), unique=True, nullable=False, comment="内容hash，用于去重")
+    # 128位hash的32位十六进制串；MySQL下用ascii定长列+二进制排序规则，唯一索引键只占32字节且按字节比较
+    content_hash = Column(
+        String(32).with_variant(mysql.CHAR(32, charset='ascii', collation='ascii_bin'), 'mysql'),
+        unique=True, nullable=False, comment="内容hash，用于去重"
+    )
     
     # 原始数据
     raw_content = Column(Text, nullable=False, comment="原始爬取内容")
@@ -59,10 +64,23 @@ class TGEProject(Base):
     __table_args__ = (
         Index('idx_created_at', 'created_at'),
         Index('idx_project_name', 'project_name'),
-        Index('idx_source_platform', 'source_platform'),
         Index('idx_sentiment', 'sentiment'),
-        Index('idx_is_processed', 'is_processed'),
         Index('idx_tge_date', 'tge_date'),
+        # 组合索引：按平台/处理状态过滤并按 created_at 排序，前缀同时覆盖单列查询
+        Index('idx_platform_created', 'source_platform', 'created_at'),
+        Index('idx_processed_created', 'is_processed', 'created_at'),
+        # 组合索引：匹配按 is_valid/is_processed/sentiment 过滤并按 created_at 排序的查询
+        Index('ix_tge_valid_proc_created', 'is_valid', 'is_processed', 'created_at'),
+        Index('ix_tge_valid_sent_created', 'is_valid', 'sentiment', 'created_at'),
+        # 全文索引（仅MySQL，ngram分词支持中文），分别供关键词搜索和项目搜索使用 MATCH ... AGAINST
+        Index(
+            'ft_search', 'raw_content', 'ai_summary', 'project_name',
+            mysql_prefix='FULLTEXT', mysql_with_parser='ngram'
+        ).ddl_if(dialect='mysql'),
+        Index(
+            'ft_project_search', 'project_name', 'token_symbol', 'raw_content', 'tge_summary', 'key_features',
+            mysql_prefix='FULLTEXT', mysql_with_parser='ngram'
+        ).ddl_if(dialect='mysql'),
     )
     
     def __repr__(self):
@@ -2,32 +2,187 @@
 去重工具模块
 """
 import hashlib
-from typing import List, Set, Optional
-from datetime import datetime, timedelta
+import heapq
+import math
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, List, Set, Optional, Tuple, Union
 import structlog
+import xxhash
 
 logger = structlog.get_logger()
 
+# 超过该字符数的文本分块编码并增量计算hash
+HASH_CHUNK_CHARS = 65536
+
+# 标题中的项目名称模式："XXX Token"、"XXX Protocol"、"XXX项目"、CamelCase
+_PROJECT_NAME_PATTERNS = [
+    re.compile(r'([A-Za-z]+)\s+(?:Token|Protocol|Network|Finance|Swap)'),
+    re.compile(r'([A-Za-z\u4e00-\u9fa5]+)(?:代币|项目|协议|网络)'),
+    re.compile(r'([A-Z][a-z]+[A-Z][a-z]+)'),
+]
+
+
+class BloomFilter:
+    """
+    布隆过滤器
+    以少量误判为代价，用位数组替代集合做成员检查，节省内存
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: 预期元素数量
+            error_rate: 可接受的误判率
+        """
+        capacity = max(capacity, 1)
+        self.num_bits = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item: str):
+        """双重哈希计算位位置"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str) -> None:
+        """添加元素"""
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def _shingles(text: str, size: int) -> Set[str]:
+    """生成字符级n-gram分片"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHashLSH:
+    """
+    MinHash局部敏感哈希索引
+    基于字符分片的MinHash签名和分段(banding)检索近似重复文本，查询复杂度与索引规模无关
+    """
+    
+    _MERSENNE_PRIME = (1 << 61) - 1
+    _MAX_HASH = (1 << 32) - 1
+    
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        Args:
+            threshold: Jaccard相似度阈值
+            num_perm: 签名长度（置换函数数量）
+            shingle_size: 分片长度
+            seed: 置换函数随机种子
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = self._optimal_bands(threshold, num_perm)
+        
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randint(1, self._MERSENNE_PRIME - 1), rng.randint(0, self._MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [{} for _ in range(self.bands)]
+    
+    @staticmethod
+    def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+        """选择阈值 (1/b)^(1/r) 最接近目标相似度的分段方式"""
+        candidates = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+        return min(candidates, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold))
+    
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """计算文本的MinHash签名"""
+        hashes = [
+            xxhash.xxh32_intdigest(shingle.encode('utf-8'))
+            for shingle in _shingles(text, self.shingle_size)
+        ]
+        if not hashes:
+            return tuple([self._MAX_HASH] * self.num_perm)
+        
+        prime, max_hash = self._MERSENNE_PRIME, self._MAX_HASH
+        return tuple(
+            min(((a * h + b) % prime) & max_hash for h in hashes)
+            for a, b in self._permutations
+        )
+    
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+    
+    def query(self, signature: Tuple[int, ...]) -> Set[str]:
+        """查询与签名相似的已索引键"""
+        candidates: Set[str] = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        return candidates
+    
+    def insert(self, key: str, signature: Tuple[int, ...]) -> None:
+        """将签名加入索引"""
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+
 
 class DeduplicationService:
     """去重服务"""
     
-    def __init__(self):
-        self._content_hashes: Set[str] = set()
-        self._project_time_windows: dict = {}  # project_name -> last_seen_time
+    def __init__(self, bloom_bits_log2: int = 25, max_hashes: int = 1_000_000,
+                 hash_ttl_seconds: int = 7 * 86400, similarity_threshold: float = 0.8):
+        """
+        Args:
+            bloom_bits_log2: 前置位图的位数（2的幂），默认 2^25 位即 4MB
+            max_hashes: 精确hash表最多保留的条目数，超出时淘汰最久未见的
+            hash_ttl_seconds: hash条目的有效期，过期后同样内容视为新内容
+            similarity_threshold: 近似重复检测的Jaccard相似度阈值
+        """
+        # k=1 的布隆位图在前：内容hash本身已均匀分布，直接取其低位作为位下标，
+        # 绝大多数新内容只需一次位测试；位已置位时再用精确hash表排除误判
+        self._bloom_mask = (1 << bloom_bits_log2) - 1
+        self._bloom_bits = bytearray(1 << max(bloom_bits_log2 - 3, 0))
+        # hash -> 最近一次出现的时间，按出现时间从旧到新排列（LRU）
+        self._content_hashes: "OrderedDict[str, float]" = OrderedDict()
+        self._max_hashes = max_hashes
+        self._hash_ttl_seconds = hash_ttl_seconds
+        self._project_time_windows: Dict[str, int] = {}  # project_name -> 最近出现的unix秒
+        # (出现时间, 项目名) 小顶堆，清理时只弹出过期条目；项目再次出现后旧条目在弹出时识别并跳过
+        self._expiry_heap: List[Tuple[int, str]] = []
+        # 近似重复检测的MinHash LSH索引，首次使用时创建
+        self._similarity_threshold = similarity_threshold
+        self._lsh: Optional[MinHashLSH] = None
     
     @staticmethod
-    def generate_content_hash(content: str) -> str:
+    def generate_content_hash(content: Union[str, bytes]) -> str:
         """
         生成内容hash用于去重
         
         Args:
-            content: 原始内容文本
+            content: 原始内容文本，已编码的bytes（或memoryview等缓冲区）可直接传入以免重复编码
             
         Returns:
-            MD5 hash字符串
+            xxHash128 hash字符串（32位十六进制）
         """
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        if not isinstance(content, str):
+            return xxhash.xxh128_hexdigest(content)
+        
+        if len(content) <= HASH_CHUNK_CHARS:
+            return xxhash.xxh128_hexdigest(content.encode('utf-8'))
+        
+        # 长文本分块编码后增量哈希，不为整篇内容分配完整的bytes副本；
+        # 按字符切分不会截断多字节字符，结果与整体编码一致
+        hasher = xxhash.xxh128()
+        for start in range(0, len(content), HASH_CHUNK_CHARS):
+            hasher.update(content[start:start + HASH_CHUNK_CHARS].encode('utf-8'))
+        return hasher.hexdigest()
     
     @staticmethod
     def extract_project_name(content: str, title: str = "") -> Optional[str]:
@@ -47,17 +202,8 @@ class DeduplicationService:
         # 首先检查标题
         if title:
             # 查找常见的项目名称模式
-            import re
-            
-            # 匹配 "XXX Token"、"XXX Protocol"、"XXX项目" 等模式
-            patterns = [
-                r'([A-Za-z]+)\s+(?:Token|Protocol|Network|Finance|Swap)',
-                r'([A-Za-z\u4e00-\u9fa5]+)(?:代币|项目|协议|网络)',
-                r'([A-Z][a-z]+[A-Z][a-z]+)',  # CamelCase
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, title)
+            for pattern in _PROJECT_NAME_PATTERNS:
+                match = pattern.search(title)
                 if match:
                     return match.group(1)
         
@@ -76,13 +222,74 @@ class DeduplicationService:
         Returns:
             是否重复
         """
-        if content_hash in self._content_hashes:
+        if self._check_and_add_hash(content_hash):
             logger.info("Duplicate content detected by hash", content_hash=content_hash)
             return True
+        return False
+    
+    def is_duplicate_by_hash_many(self, content_hashes: List[str]) -> List[bool]:
+        """
+        批量检查内容hash是否重复
+        
+        批次内相同的hash，第一次出现视为新内容，之后的视为重复
         
-        self._content_hashes.add(content_hash)
+        Args:
+            content_hashes: 内容hash列表
+            
+        Returns:
+            与输入一一对应的是否重复列表
+        """
+        check = self._check_and_add_hash
+        mask = [check(content_hash) for content_hash in content_hashes]
+        
+        duplicate_count = sum(mask)
+        if duplicate_count:
+            logger.info(
+                "Duplicate contents detected by hash",
+                duplicate_count=duplicate_count,
+                total=len(mask)
+            )
+        return mask
+    
+    def _check_and_add_hash(self, content_hash: str) -> bool:
+        """测试并记录hash，返回记录前是否已存在"""
+        index = self._bloom_index(content_hash)
+        now = time.time()
+        content_hashes = self._content_hashes
+        
+        byte_index, bit = index >> 3, 1 << (index & 7)
+        if self._bloom_bits[byte_index] & bit:
+            last_seen = content_hashes.get(content_hash)
+            if last_seen is not None and now - last_seen < self._hash_ttl_seconds:
+                content_hashes.move_to_end(content_hash)
+                content_hashes[content_hash] = now
+                return True
+        else:
+            self._bloom_bits[byte_index] |= bit
+        
+        content_hashes[content_hash] = now
+        content_hashes.move_to_end(content_hash)
+        self._evict_hashes(now)
         return False
     
+    def _bloom_index(self, content_hash: str) -> int:
+        """计算hash在位图中的位下标"""
+        try:
+            return int(content_hash[-16:], 16) & self._bloom_mask
+        except ValueError:
+            # 非十六进制的hash退回到Python内置哈希
+            return hash(content_hash) & self._bloom_mask
+    
+    def _evict_hashes(self, now: float) -> None:
+        """从最旧端淘汰过期或超出容量的hash条目（均摊O(1)）"""
+        content_hashes = self._content_hashes
+        cutoff = now - self._hash_ttl_seconds
+        while content_hashes and (
+            len(content_hashes) > self._max_hashes
+            or next(iter(content_hashes.values())) <= cutoff
+        ):
+            content_hashes.popitem(last=False)
+    
     def is_duplicate_by_project_time(self, project_name: str, time_window_hours: int = 24) -> bool:
         """
         检查项目是否在时间窗口内重复
@@ -97,22 +304,20 @@ class DeduplicationService:
         if not project_name:
             return False
         
-        now = datetime.utcnow()
+        now = int(time.time())
         
-        if project_name in self._project_time_windows:
-            last_seen = self._project_time_windows[project_name]
-            time_diff = now - last_seen
-            
-            if time_diff < timedelta(hours=time_window_hours):
-                logger.info(
-                    "Duplicate project detected within time window",
-                    project_name=project_name,
-                    last_seen=last_seen,
-                    time_diff_hours=time_diff.total_seconds() / 3600
-                )
-                return True
+        last_seen = self._project_time_windows.get(project_name)
+        if last_seen is not None and now - last_seen < time_window_hours * 3600:
+            logger.info(
+                "Duplicate project detected within time window",
+                project_name=project_name,
+                last_seen=last_seen,
+                time_diff_hours=(now - last_seen) / 3600
+            )
+            return True
         
         self._project_time_windows[project_name] = now
+        heapq.heappush(self._expiry_heap, (now, project_name))
         return False
     
     def check_content_similarity(self, content1: str, content2: str, threshold: float = 0.8) -> bool:
@@ -152,6 +357,39 @@ class DeduplicationService:
         
         return False
     
+    def is_near_duplicate(self, content: str, content_key: str) -> bool:
+        """
+        基于MinHash LSH检查内容是否与已见过的内容近似重复
+        
+        只需查询签名所在的分段桶，无需与全部历史内容逐一比较；
+        非重复内容会以 content_key 加入索引
+        
+        Args:
+            content: 内容文本
+            content_key: 内容唯一键（如内容hash）
+            
+        Returns:
+            是否近似重复
+        """
+        if not content or not content_key:
+            return False
+        
+        if self._lsh is None:
+            self._lsh = MinHashLSH(threshold=self._similarity_threshold, num_perm=128, shingle_size=5)
+        
+        signature = self._lsh.signature(content)
+        candidates = self._lsh.query(signature) - {content_key}
+        if candidates:
+            logger.info(
+                "Near-duplicate content detected",
+                content_key=content_key,
+                candidate_count=len(candidates)
+            )
+            return True
+        
+        self._lsh.insert(content_key, signature)
+        return False
+    
     def cleanup_old_entries(self, days: int = 7) -> None:
         """
         清理过期的去重记录
@@ -159,53 +397,96 @@ class DeduplicationService:
         Args:
             days: 保留天数
         """
-        cutoff_time = datetime.utcnow() - timedelta(days=days)
+        cutoff_timestamp = int(time.time()) - days * 86400
         
-        # 清理过期的项目时间窗口记录
-        expired_projects = [
-            project for project, last_seen in self._project_time_windows.items()
-            if last_seen < cutoff_time
-        ]
+        # 清理过期的项目时间窗口记录，只处理堆顶的过期条目，复杂度 O(k log n)
+        expired_project_count = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff_timestamp:
+            last_seen, project = heapq.heappop(self._expiry_heap)
+            if self._project_time_windows.get(project) == last_seen:
+                del self._project_time_windows[project]
+                expired_project_count += 1
         
-        for project in expired_projects:
-            del self._project_time_windows[project]
+        # 清理过期的内容hash，并按剩余hash重建位图，避免位图长期饱和
+        hash_count = len(self._content_hashes)
+        while self._content_hashes and next(iter(self._content_hashes.values())) <= cutoff_timestamp:
+            self._content_hashes.popitem(last=False)
+        expired_hash_count = hash_count - len(self._content_hashes)
+        
+        if expired_hash_count:
+            self._bloom_bits = bytearray(len(self._bloom_bits))
+            for content_hash in self._content_hashes:
+                index = self._bloom_index(content_hash)
+                self._bloom_bits[index >> 3] |= 1 << (index & 7)
         
         logger.info(
             "Cleaned up old deduplication entries",
-            expired_count=len(expired_projects),
+            expired_count=expired_project_count,
+            expired_hash_count=expired_hash_count,
             cutoff_days=days
         )
 
 
 # 全局去重服务实例
 deduplication_service = DeduplicationService()
+generate_content_hash = DeduplicationService.generate_content_hash
 
 
-def is_duplicate_content(content: str, title: str = "", check_similarity: bool = False) -> bool:
+def is_duplicate_content(content: Union[str, bytes], title: str = "", check_similarity: bool = False) -> bool:
     """
-    综合去重检查
+    内容去重检查（第一阶段，只做hash去重）
+    
+    项目名称提取和时间窗口检查开销较大，推迟到 is_duplicate_project，
+    仅对通过hash去重、即将入库的内容调用
     
     Args:
-        content: 内容文本
+        content: 内容文本，已编码的bytes可直接传入
         title: 标题（可选）
         check_similarity: 是否检查相似度
         
     Returns:
         是否重复
     """
-    # 1. 生成并检查内容hash
     content_hash = deduplication_service.generate_content_hash(content)
     if deduplication_service.is_duplicate_by_hash(content_hash):
         return True
     
-    # 2. 检查项目时间窗口
-    project_name = deduplication_service.extract_project_name(content, title)
-    if project_name and deduplication_service.is_duplicate_by_project_time(project_name):
-        return True
+    # 如果需要，通过LSH索引检查与历史内容的近似重复
+    if check_similarity:
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='ignore')
+        return deduplication_service.is_near_duplicate(content, content_hash)
     
-    # 3. 如果需要，检查内容相似度（暂时跳过，性能考虑）
-    # if check_similarity:
-    #     # 这里可以与最近的内容进行相似度比较
-    #     pass
+    return False
+
+
+def is_duplicate_content_many(contents: List[Union[str, bytes]]) -> List[bool]:
+    """
+    批量内容去重检查（只做hash去重）
+    
+    Args:
+        contents: 内容文本列表，已编码的bytes可直接传入
+        
+    Returns:
+        与输入一一对应的是否重复列表
+    """
+    hash_content = deduplication_service.generate_content_hash
+    return deduplication_service.is_duplicate_by_hash_many(
+        [hash_content(content) for content in contents]
+    )
+
+
+def is_duplicate_project(content: str, title: str = "", time_window_hours: int = 24) -> bool:
+    """
+    项目时间窗口去重检查（第二阶段，对通过hash去重、即将入库的内容调用）
     
-    return False
\ No newline at end of file
+    Args:
+        content: 内容文本
+        title: 标题（可选）
+        time_window_hours: 时间窗口（小时）
+        
+    Returns:
+        是否重复
+    """
+    project_name = deduplication_service.extract_project_name(content, title)
+    return bool(project_name) and deduplication_service.is_duplicate_by_project_time(project_name, time_window_hours)
@@ -1,14 +1,25 @@
 """
 日志配置模块
 """
+import logging
 import sys
 import structlog
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..config.settings import settings
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjson序列化，允许非字符串键（统计字典等）"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode('utf-8')
+
+
 def configure_logging() -> None:
     """配置结构化日志"""
     
@@ -16,9 +27,13 @@ def configure_logging() -> None:
     log_dir = Path("data/logs")
     log_dir.mkdir(parents=True, exist_ok=True)
     
+    # 低于该级别的日志在调用处直接返回，不经过下面任何处理器
+    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    if settings.app_debug:
+        log_level = min(log_level, logging.DEBUG)
+    
     # 配置日志处理器
     processors = [
-        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -28,17 +43,20 @@ def configure_logging() -> None:
     ]
     
     # 根据环境选择输出格式
-    if settings.app_debug:
-        # 开发环境：彩色输出到控制台
+    if settings.app_debug and sys.stdout.isatty():
+        # 开发环境的交互式终端：彩色输出到控制台
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
     else:
-        # 生产环境：JSON格式
-        processors.append(structlog.processors.JSONRenderer())
+        # 生产环境及CI等非终端输出：JSON格式，安装了orjson时使用更快的序列化
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     
     # 配置structlog
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         context_class=dict,
         cache_logger_on_first_use=True,
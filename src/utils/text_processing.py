@@ -1,7 +1,9 @@
 """
 文本处理工具模块
 """
+import asyncio
 import re
+from collections import Counter
 import jieba
 from typing import List, Dict, Any, Optional
 import structlog
@@ -9,35 +11,61 @@ import structlog
 logger = structlog.get_logger()
 
 
+# 正则表达式在模块加载时编译一次，所有实例共享
+# URL字符集写成单一字符类（A-Z、0-9、% 已包含在 $-_ 区间内），每个字符一次类判断，无分支回溯
+_URL_PATTERN = re.compile(r'https?://[$-_@.&+a-z!*\\(),]+')
+_EMOJI_PATTERN = re.compile(r'[\U00010000-\U0010ffff]', flags=re.UNICODE)
+_MENTION_PATTERN = re.compile(r'@[\u4e00-\u9fa5\w]+')
+_HASHTAG_PATTERN = re.compile(r'#[\u4e00-\u9fa5\w]+')
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[。！？.!?]')
+
+# TGE相关信息提取模式：日期和代币符号合并为一个正则，一次扫描得到两个字段
+# 同一字段的多个模式按优先级编号，取值时按编号顺序选取
+_TGE_COMBINED_PATTERN = re.compile(
+    r'(?P<date0>\d{4}年\d{1,2}月\d{1,2}日)'
+    r'|(?P<date1>\d{1,2}月\d{1,2}日)'
+    r'|(?P<date2>\d{4}-\d{1,2}-\d{1,2})'
+    r'|(?P<date3>20\d{2}/\d{1,2}/\d{1,2})'
+    r'|\$(?P<symbol0>[A-Z]{2,10})'
+    r'|(?P<symbol1>[A-Z]{2,10})代币'
+    r'|(?P<symbol2>[A-Z]{2,10})\s*Token'
+)
+# 数量只用通用数字模式提取；原先的“总供应量…”“发行…”模式捕获的数字都已被该模式覆盖，
+# 只会额外产生不带单位后缀的重复项（如“1亿枚”之外再加“1亿”），因此不再使用
+_AMOUNT_PATTERN = re.compile(r'\d+(?:\.\d+)?[万亿千百十]?[枚个]?')
+_TGE_DATE_GROUPS = ('date0', 'date1', 'date2', 'date3')
+_TGE_SYMBOL_GROUPS = ('symbol0', 'symbol1', 'symbol2')
+
+# 项目名称提取模式
+_PROJECT_PATTERNS = [
+    re.compile(r'([A-Za-z\u4e00-\u9fa5]+)(?:项目|协议|网络|平台)'),
+    re.compile(r'([A-Z][a-z]+[A-Z][a-z]+)'),  # CamelCase
+]
+
+# 联系方式提取模式
+# 关键词提取时过滤的停用词
+_STOPWORDS = frozenset({'的', '了', '在', '是', '有', '和', '与', '或'})
+
+# 联系方式提取模式，每个模式附带匹配所必需的小写字面量：
+# 文本（转小写后）不含该字面量时跳过对应正则，多数内容只需几次子串查找
+_CONTACT_PATTERNS = {
+    contact_type: [(literal, re.compile(pattern, re.IGNORECASE)) for literal, pattern in patterns]
+    for contact_type, patterns in {
+        'telegram': [('t.me/', r't\.me/[\w]+'), ('telegram', r'telegram.*?@[\w]+')],
+        'discord': [('discord.gg/', r'discord\.gg/[\w]+'), ('discord.com/invite/', r'discord\.com/invite/[\w]+')],
+        'twitter': [('twitter.com/', r'twitter\.com/[\w]+'), ('@', r'@[\w]+')],
+        'websites': [('http', r'https?://[\w\.-]+\.[\w]+')]
+    }.items()
+}
+
+
 class TextProcessor:
     """文本处理器"""
     
-    def __init__(self):
-        # 预编译正则表达式
-        self._url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        self._emoji_pattern = re.compile(r'[\U00010000-\U0010ffff]', flags=re.UNICODE)
-        self._mention_pattern = re.compile(r'@[\u4e00-\u9fa5\w]+')
-        self._hashtag_pattern = re.compile(r'#[\u4e00-\u9fa5\w]+')
-        
-        # TGE相关信息提取模式
-        self._tge_patterns = {
-            'tge_date': [
-                r'(\d{4}年\d{1,2}月\d{1,2}日)',
-                r'(\d{1,2}月\d{1,2}日)',
-                r'(\d{4}-\d{1,2}-\d{1,2})',
-                r'(20\d{2}/\d{1,2}/\d{1,2})'
-            ],
-            'token_symbol': [
-                r'\$([A-Z]{2,10})',
-                r'([A-Z]{2,10})代币',
-                r'([A-Z]{2,10})\s*Token'
-            ],
-            'amount': [
-                r'(\d+(?:\.\d+)?[万亿千百十]?[枚个]?)',
-                r'总供应量.*?(\d+(?:\.\d+)?[万亿千百十]?)',
-                r'发行.*?(\d+(?:\.\d+)?[万亿千百十]?)'
-            ]
-        }
+    _url_pattern = _URL_PATTERN
+    _emoji_pattern = _EMOJI_PATTERN
+    _mention_pattern = _MENTION_PATTERN
+    _hashtag_pattern = _HASHTAG_PATTERN
     
     def clean_text(self, text: str) -> str:
         """
@@ -52,27 +80,25 @@ class TextProcessor:
         if not text:
             return ""
         
-        # 移除URL
-        text = self._url_pattern.sub('', text)
+        # 移除URL（不含http的文本无需执行正则）
+        if 'http' in text:
+            text = self._url_pattern.sub('', text)
         
         # 移除emoji（可选）
         # text = self._emoji_pattern.sub('', text)
         
-        # 移除多余的空白字符
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 移除首尾空格
-        text = text.strip()
-        
-        return text
+        # 合并连续空白字符并去除首尾空格（str.split 按空白切分，一次线性扫描）
+        return ' '.join(text.split())
     
-    def extract_keywords(self, text: str, top_k: int = 10) -> List[str]:
+    def extract_keywords(self, text: str, top_k: int = 10,
+                         tokens: Optional[List[str]] = None) -> List[str]:
         """
         提取关键词
         
         Args:
             text: 文本内容
             top_k: 返回前k个关键词
+            tokens: 已有的jieba分词结果，传入时不再重复分词
             
         Returns:
             关键词列表
@@ -80,24 +106,17 @@ class TextProcessor:
         if not text:
             return []
         
-        # 使用jieba进行分词
-        words = jieba.cut(text)
-        
-        # 过滤停用词和短词
-        filtered_words = [
-            word.strip() for word in words 
-            if len(word.strip()) > 1 and word.strip() not in ['的', '了', '在', '是', '有', '和', '与', '或']
-        ]
-        
-        # 统计词频
-        word_count = {}
-        for word in filtered_words:
-            word_count[word] = word_count.get(word, 0) + 1
+        if tokens is None:
+            tokens = jieba.lcut(text)
         
-        # 按频率排序并返回前k个
-        sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
+        # 过滤停用词和短词后统计词频
+        word_count = Counter(
+            word for word in (token.strip() for token in tokens)
+            if len(word) > 1 and word not in _STOPWORDS
+        )
         
-        return [word for word, count in sorted_words[:top_k]]
+        # 取频率最高的前k个（堆选择，无需全量排序）
+        return [word for word, count in word_count.most_common(top_k)]
     
     def extract_tge_info(self, text: str) -> Dict[str, Any]:
         """
@@ -119,33 +138,24 @@ class TextProcessor:
         if not text:
             return info
         
-        # 提取TGE时间
-        for pattern in self._tge_patterns['tge_date']:
-            match = re.search(pattern, text)
-            if match:
-                info['tge_date'] = match.group(1)
-                break
+        # 单次扫描提取TGE时间和代币符号，两个字段都命中最高优先级模式后提前结束
+        first_matches = {}
+        for match in _TGE_COMBINED_PATTERN.finditer(text):
+            group = match.lastgroup
+            if group not in first_matches:
+                first_matches[group] = match.group(group)
+                if 'date0' in first_matches and 'symbol0' in first_matches:
+                    break
         
-        # 提取代币符号
-        for pattern in self._tge_patterns['token_symbol']:
-            match = re.search(pattern, text)
-            if match:
-                info['token_symbol'] = match.group(1)
-                break
+        info['tge_date'] = next((first_matches[g] for g in _TGE_DATE_GROUPS if g in first_matches), None)
+        info['token_symbol'] = next((first_matches[g] for g in _TGE_SYMBOL_GROUPS if g in first_matches), None)
         
         # 提取数量信息
-        for pattern in self._tge_patterns['amount']:
-            matches = re.findall(pattern, text)
-            info['amounts'].extend(matches)
+        info['amounts'] = _AMOUNT_PATTERN.findall(text)
         
         # 简单的项目名称提取
-        project_patterns = [
-            r'([A-Za-z\u4e00-\u9fa5]+)(?:项目|协议|网络|平台)',
-            r'([A-Z][a-z]+[A-Z][a-z]+)',  # CamelCase
-        ]
-        
-        for pattern in project_patterns:
-            match = re.search(pattern, text)
+        for pattern in _PROJECT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 info['project_name'] = match.group(1)
                 break
@@ -173,12 +183,14 @@ class TextProcessor:
             'hashtags': hashtags
         }
     
-    def calculate_readability_score(self, text: str) -> float:
+    def calculate_readability_score(self, text: str,
+                                    tokens: Optional[List[str]] = None) -> float:
         """
         计算文本可读性评分（简化版）
         
         Args:
             text: 文本内容
+            tokens: 已有的jieba分词结果，传入时不再重复分词
             
         Returns:
             可读性评分 (0-1)
@@ -187,8 +199,8 @@ class TextProcessor:
             return 0.0
         
         # 简单的可读性指标
-        sentences = len(re.split(r'[。！？.!?]', text))
-        words = len(list(jieba.cut(text)))
+        sentences = len(_SENTENCE_SPLIT_PATTERN.split(text))
+        words = len(tokens) if tokens is not None else len(jieba.lcut(text))
         
         if sentences == 0 or words == 0:
             return 0.0
@@ -218,21 +230,17 @@ class TextProcessor:
         if not text:
             return {'telegram': [], 'discord': [], 'twitter': [], 'websites': []}
         
-        contact_patterns = {
-            'telegram': [r't\.me/[\w]+', r'telegram.*?@[\w]+'],
-            'discord': [r'discord\.gg/[\w]+', r'discord\.com/invite/[\w]+'],
-            'twitter': [r'twitter\.com/[\w]+', r'@[\w]+'],
-            'websites': [r'https?://[\w\.-]+\.[\w]+']
+        # 各类别的模式可能在同一位置重叠命中（如网址中的 twitter.com/xxx），
+        # 因此不合并为单个交替正则，而是逐类别扫描并直接收集到集合中去重
+        lowered = text.lower()
+        return {
+            contact_type: list({
+                match
+                for literal, pattern in patterns if literal in lowered
+                for match in pattern.findall(text)
+            })
+            for contact_type, patterns in _CONTACT_PATTERNS.items()
         }
-        
-        results = {}
-        for contact_type, patterns in contact_patterns.items():
-            matches = []
-            for pattern in patterns:
-                matches.extend(re.findall(pattern, text, re.IGNORECASE))
-            results[contact_type] = list(set(matches))  # 去重
-        
-        return results
 
 
 # 全局文本处理器实例
@@ -250,10 +258,12 @@ def process_raw_content(content: str, extract_info: bool = True) -> Dict[str, An
     Returns:
         处理结果字典
     """
+    # 关键词与可读性评分共用一次分词结果
+    tokens = jieba.lcut(content) if content else []
     result = {
         'cleaned_text': text_processor.clean_text(content),
-        'keywords': text_processor.extract_keywords(content),
-        'readability_score': text_processor.calculate_readability_score(content)
+        'keywords': text_processor.extract_keywords(content, tokens=tokens),
+        'readability_score': text_processor.calculate_readability_score(content, tokens=tokens)
     }
     
     if extract_info:
@@ -263,4 +273,23 @@ def process_raw_content(content: str, extract_info: bool = True) -> Dict[str, An
             'contact_info': text_processor.extract_contact_info(content)
         })
     
-    return result
\ No newline at end of file
+    return result
+
+
+def _process_raw_content_chunk(contents: List[str], extract_info: bool) -> List[Dict[str, Any]]:
+    """处理一组原始内容（工作线程函数）"""
+    return [process_raw_content(content, extract_info) for content in contents]
+
+
+async def process_raw_content_many(contents: List[str], extract_info: bool = True) -> List[Dict[str, Any]]:
+    """
+    批量处理原始内容，在事件循环默认线程池中执行，不阻塞事件循环
+    
+    Args:
+        contents: 原始内容列表
+        extract_info: 是否提取详细信息
+        
+    Returns:
+        与输入一一对应的处理结果列表
+    """
+    return await asyncio.to_thread(_process_raw_content_chunk, contents, extract_info)
@@ -4,9 +4,15 @@
 import pytest
 import asyncio
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.pool import StaticPool
 
+try:
+    import uvloop
+except ImportError:  # uvloop为可选依赖，缺失时使用默认事件循环
+    uvloop = None
+
 from src.database.models import Base
 from src.database.database import get_db_session
 from src.config.settings import settings
@@ -22,36 +28,65 @@ test_engine = create_async_engine(
     connect_args={"check_same_thread": False}
 )
 
-# 创建测试会话工厂
-test_session_factory = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+# pysqlite默认的事务处理会破坏SAVEPOINT，改由SQLAlchemy显式发出BEGIN
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_pysqlite_transaction(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+        conn.exec_driver_sql("BEGIN")
+
+
+# 表结构在整个测试会话中只创建一次
+_schema_created = False
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """事件循环策略，安装了uvloop时使用uvloop"""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture(scope="session")
 def event_loop():
     """创建事件循环"""
-    loop = asyncio.new_event_loop()
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
     yield loop
     loop.close()
 
 
+async def _ensure_schema():
+    """首次使用时创建表结构"""
+    global _schema_created
+    if _schema_created:
+        return
+    # DDL逐条自动提交，与pysqlite原有行为一致
+    async with test_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.run_sync(Base.metadata.create_all)
+    _schema_created = True
+
+
 @pytest.fixture(scope="function")
 async def test_db() -> AsyncGenerator[AsyncSession, None]:
-    """创建测试数据库会话"""
-    # 创建表
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    # 创建会话
-    async with test_session_factory() as session:
-        yield session
+    """创建测试数据库会话，测试结束后回滚外层事务"""
+    await _ensure_schema()
     
-    # 清理表
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        # 会话内的commit/rollback只作用于SAVEPOINT，不会提交外层事务
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        await trans.rollback()
 
 
 @pytest.fixture
@@ -109,12 +109,13 @@ async def test_end_to_end_functionality():
         # 但我们可以验证接口的完整性
         try:
             # 验证crawl方法存在且参数正确
-            import inspect
-            crawl_sig = inspect.signature(platform.crawl)
+            # 直接读取代码对象的参数名，避免构造inspect.Signature
+            crawl_code = platform.crawl.__code__
+            crawl_params = crawl_code.co_varnames[:crawl_code.co_argcount + crawl_code.co_kwonlyargcount]
             expected_params = ['keywords', 'max_count']
             
             for param in expected_params:
-                if param not in crawl_sig.parameters:
+                if param not in crawl_params:
                     print(f"❌ crawl方法缺少参数: {param}")
                     return False
             
@@ -4,61 +4,138 @@ Step 5: MediaCrawler共享库集成测试套件
 全面验证XHS平台适配器的共享库集成功能
 """
 import asyncio
+import contextvars
+import io
 import sys
 import os
 import json
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 # 添加项目根目录到Python路径
 project_root = '/home/damian/Web3-TGE-Monitor'
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# 集成检查项：(名称, IntegrationTestSuite方法名)，脚本运行和pytest收集共用
+INTEGRATION_CHECKS = [
+    ("配置管理测试", "test_configuration_management"),
+    ("模块导入测试", "test_module_imports"),
+    ("平台初始化测试", "test_platform_initialization"),
+    ("配置灵活性测试", "test_configuration_flexibility"),
+    ("错误处理测试", "test_error_handling"),
+    ("资源管理测试", "test_resource_management"),
+    ("API接口兼容性测试", "test_api_compatibility"),
+    ("性能基准测试", "test_performance_baseline"),
+]
+
+# 需要单独运行的计时检查：与其他检查并发时计时会包含等待工作目录锁的时间
+_ISOLATED_CHECKS = frozenset({"test_performance_baseline"})
+
+# 模块导入测试检查的(模块名, 属性名)
+_MODULES_TO_TEST = (
+    ("media_platform.xhs.client", "XiaoHongShuClient"),
+    ("media_platform.xhs.core", "XiaoHongShuCrawler"),
+    ("media_platform.xhs.field", "SearchSortType"),
+    ("media_platform.xhs.help", "get_search_id"),
+    ("base.base_crawler", "AbstractCrawler"),
+)
+
+# 平台必须提供的API方法，保持元组以固定输出顺序
+_API_METHODS = (
+    'get_platform_name',
+    'is_available',
+    'validate_keywords',
+    'crawl',
+    'transform_to_raw_content',
+    'filter_content',
+)
+
+# 当前测试任务的输出缓冲区，并发运行的测试各自写入自己的缓冲区
+_task_output = contextvars.ContextVar('task_output', default=None)
+
+
+class _TaskStdout:
+    """按任务分发print输出的stdout代理，不在测试任务内时直接写原始stdout"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = _task_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
 class IntegrationTestSuite:
     """集成测试套件"""
     
     def __init__(self):
         self.test_results = {}
         self.failed_tests = []
+        # 测试抛出的异常，堆栈在生成报告时才格式化
+        self.test_exceptions = {}
         
     async def run_all_tests(self):
         """运行所有集成测试"""
         print("🚀 Step 5: MediaCrawler共享库集成测试")
         print("=" * 70)
         
-        tests = [
-            ("配置管理测试", self.test_configuration_management),
-            ("模块导入测试", self.test_module_imports),
-            ("平台初始化测试", self.test_platform_initialization),
-            ("配置灵活性测试", self.test_configuration_flexibility),
-            ("错误处理测试", self.test_error_handling),
-            ("资源管理测试", self.test_resource_management),
-            ("API接口兼容性测试", self.test_api_compatibility),
-            ("性能基准测试", self.test_performance_baseline),
+        concurrent_tests = [
+            (test_name, getattr(self, method_name))
+            for test_name, method_name in INTEGRATION_CHECKS if method_name not in _ISOLATED_CHECKS
+        ]
+        isolated_tests = [
+            (test_name, getattr(self, method_name))
+            for test_name, method_name in INTEGRATION_CHECKS if method_name in _ISOLATED_CHECKS
         ]
         
-        for test_name, test_func in tests:
-            print(f"\n📋 {test_name}")
-            print("-" * 50)
-            try:
-                result = await test_func()
-                self.test_results[test_name] = result
-                if result:
-                    print(f"✅ {test_name}: 通过")
-                else:
-                    print(f"❌ {test_name}: 失败")
-                    self.failed_tests.append(test_name)
-            except Exception as e:
-                print(f"❌ {test_name}: 异常 - {e}")
-                self.test_results[test_name] = False
+        # 各测试相互独立，并发运行；输出按任务缓冲，结束后按原顺序打印。
+        # 计时检查在并发组结束后逐个在独立任务中运行
+        original_stdout = sys.stdout
+        sys.stdout = _TaskStdout(original_stdout)
+        try:
+            results = await asyncio.gather(
+                *(self._run_one(test_name, test_func) for test_name, test_func in concurrent_tests)
+            )
+            for test_name, test_func in isolated_tests:
+                results.append(await asyncio.create_task(self._run_one(test_name, test_func)))
+        finally:
+            sys.stdout = original_stdout
+        
+        for test_name, result, output in results:
+            sys.stdout.write(output)
+            self.test_results[test_name] = result
+            if not result:
                 self.failed_tests.append(test_name)
-                import traceback
-                traceback.print_exc()
         
         # 输出测试报告
         await self.generate_test_report()
         
+    async def _run_one(self, test_name, test_func):
+        """运行单个测试，返回 (测试名, 结果, 缓冲的输出)"""
+        buffer = io.StringIO()
+        _task_output.set(buffer)
+        
+        print(f"\n📋 {test_name}")
+        print("-" * 50)
+        try:
+            result = await test_func()
+            if result:
+                print(f"✅ {test_name}: 通过")
+            else:
+                print(f"❌ {test_name}: 失败")
+        except Exception as e:
+            print(f"❌ {test_name}: 异常 - {e}")
+            result = False
+            self.test_exceptions[test_name] = e
+        
+        return test_name, result, buffer.getvalue()
+    
     async def test_configuration_management(self):
         """测试配置管理功能"""
         try:
@@ -96,18 +173,23 @@ class IntegrationTestSuite:
             if mc_config.mediacrawler_path not in sys.path:
                 sys.path.insert(0, mc_config.mediacrawler_path)
             
-            # 测试关键模块导入
-            modules_to_test = [
-                ("media_platform.xhs.client", "XiaoHongShuClient"),
-                ("media_platform.xhs.core", "XiaoHongShuCrawler"),
-                ("media_platform.xhs.field", "SearchSortType"),
-                ("media_platform.xhs.help", "get_search_id"),
-                ("base.base_crawler", "AbstractCrawler"),
-            ]
+            # 并行预取各模块，使文件读取相互重叠；属性解析和结果输出仍按顺序进行
+            import importlib
+            from concurrent.futures import ThreadPoolExecutor
             
-            for module_name, class_name in modules_to_test:
+            def prefetch(module_name):
                 try:
-                    module = __import__(module_name, fromlist=[class_name])
+                    return importlib.import_module(module_name), None
+                except Exception as e:
+                    return None, e
+            
+            with ThreadPoolExecutor(max_workers=len(_MODULES_TO_TEST)) as executor:
+                prefetched = list(executor.map(prefetch, [module_name for module_name, _ in _MODULES_TO_TEST]))
+            
+            for (module_name, class_name), (module, error) in zip(_MODULES_TO_TEST, prefetched):
+                try:
+                    if error is not None:
+                        raise error
                     getattr(module, class_name)
                     print(f"   ✅ {module_name}.{class_name} 导入成功")
                 except Exception as e:
@@ -169,22 +251,16 @@ class IntegrationTestSuite:
                     print(f"   ❌ 配置方式 {i+1}: 失败 - {e}")
                     return False
             
-            # 测试环境变量配置
-            original_env = os.environ.get('MEDIACRAWLER_PATH')
-            os.environ['MEDIACRAWLER_PATH'] = '/home/damian/MediaCrawler'
+            # 测试环境变量配置，退出上下文时自动恢复环境变量
+            from unittest.mock import patch
             
-            try:
-                platform = XHSPlatform()
-                print(f"   ✅ 环境变量配置: 成功")
-            except Exception as e:
-                print(f"   ❌ 环境变量配置: 失败 - {e}")
-                return False
-            finally:
-                # 恢复环境变量
-                if original_env:
-                    os.environ['MEDIACRAWLER_PATH'] = original_env
-                else:
-                    os.environ.pop('MEDIACRAWLER_PATH', None)
+            with patch.dict(os.environ, {'MEDIACRAWLER_PATH': '/home/damian/MediaCrawler'}):
+                try:
+                    platform = XHSPlatform()
+                    print(f"   ✅ 环境变量配置: 成功")
+                except Exception as e:
+                    print(f"   ❌ 环境变量配置: 失败 - {e}")
+                    return False
             
             return True
             
@@ -234,9 +310,9 @@ class IntegrationTestSuite:
                 platforms.append(platform)
                 print(f"   ✅ 平台实例 {i+1} 创建成功")
             
-            # 测试客户端延迟初始化
-            for i, platform in enumerate(platforms):
-                client = await platform._get_xhs_client()
+            # 测试客户端延迟初始化，各实例相互独立，并发创建
+            await asyncio.gather(*(platform._get_xhs_client() for platform in platforms))
+            for i in range(len(platforms)):
                 print(f"   ✅ 平台实例 {i+1} 客户端初始化成功")
             
             print(f"   ✅ 资源管理测试通过")
@@ -254,22 +330,12 @@ class IntegrationTestSuite:
             
             platform = XHSPlatform()
             
-            # 测试必需的API方法
-            api_methods = [
-                'get_platform_name',
-                'is_available', 
-                'validate_keywords',
-                'crawl',
-                'transform_to_raw_content',
-                'filter_content'
-            ]
-            
-            for method_name in api_methods:
-                if hasattr(platform, method_name):
-                    print(f"   ✅ API方法 {method_name} 存在")
-                else:
-                    print(f"   ❌ API方法 {method_name} 缺失")
-                    return False
+            present = set(dir(platform))
+            missing = [method_name for method_name in _API_METHODS if method_name not in present]
+            if missing:
+                print(f"   ❌ API方法缺失: {missing}")
+                return False
+            print("\n".join(f"   ✅ API方法 {method_name} 存在" for method_name in _API_METHODS))
             
             # 测试返回值类型
             platform_name = platform.get_platform_name()
@@ -292,21 +358,21 @@ class IntegrationTestSuite:
             import time
             
             # 测试初始化性能
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             platform = XHSPlatform()
-            init_time = time.time() - start_time
+            init_time = (time.perf_counter_ns() - start_time) / 1e9
             print(f"   ✅ 初始化时间: {init_time:.3f}秒")
             
             # 测试可用性检查性能
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             is_available = await platform.is_available()
-            check_time = time.time() - start_time
+            check_time = (time.perf_counter_ns() - start_time) / 1e9
             print(f"   ✅ 可用性检查时间: {check_time:.3f}秒")
             
             # 测试客户端创建性能
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             client = await platform._get_xhs_client()
-            client_time = time.time() - start_time
+            client_time = (time.perf_counter_ns() - start_time) / 1e9
             print(f"   ✅ 客户端创建时间: {client_time:.3f}秒")
             
             # 性能基准检查
@@ -322,41 +388,70 @@ class IntegrationTestSuite:
             return False
     
     async def generate_test_report(self):
-        """生成测试报告"""
-        print("\n" + "=" * 70)
-        print("📊 集成测试报告")
-        print("=" * 70)
-        
+        """生成测试报告，先汇总所有行再一次性写出"""
         total_tests = len(self.test_results)
         passed_tests = sum(1 for result in self.test_results.values() if result)
         success_rate = (passed_tests / total_tests) * 100 if total_tests > 0 else 0
         
-        print(f"总测试数量: {total_tests}")
-        print(f"通过测试数: {passed_tests}")
-        print(f"失败测试数: {len(self.failed_tests)}")
-        print(f"成功率: {success_rate:.1f}%")
+        lines = [
+            "\n" + "=" * 70,
+            "📊 集成测试报告",
+            "=" * 70,
+            f"总测试数量: {total_tests}",
+            f"通过测试数: {passed_tests}",
+            f"失败测试数: {len(self.failed_tests)}",
+            f"成功率: {success_rate:.1f}%",
+        ]
         
         if self.failed_tests:
-            print(f"\n❌ 失败的测试:")
-            for test in self.failed_tests:
-                print(f"   - {test}")
+            lines.append(f"\n❌ 失败的测试:")
+            lines.extend(f"   - {test}" for test in self.failed_tests)
+        
+        if self.test_exceptions:
+            import traceback
+            lines.append(f"\n🔍 异常堆栈:")
+            for test_name, error in self.test_exceptions.items():
+                lines.append(f"\n[{test_name}]")
+                lines.append("".join(traceback.format_exception(type(error), error, error.__traceback__)).rstrip("\n"))
         
         if success_rate >= 90:
-            print(f"\n🎉 Step 5 完成！集成测试通过")
-            print(f"   主要验证:")
-            print(f"   - ✅ 配置管理系统完整可靠")
-            print(f"   - ✅ 模块导入机制正常工作")
-            print(f"   - ✅ 平台初始化流程无误")
-            print(f"   - ✅ 错误处理机制健全")
-            print(f"   - ✅ API接口兼容性良好")
-            print(f"   - ✅ 性能表现符合预期")
+            lines.extend([
+                f"\n🎉 Step 5 完成！集成测试通过",
+                f"   主要验证:",
+                f"   - ✅ 配置管理系统完整可靠",
+                f"   - ✅ 模块导入机制正常工作",
+                f"   - ✅ 平台初始化流程无误",
+                f"   - ✅ 错误处理机制健全",
+                f"   - ✅ API接口兼容性良好",
+                f"   - ✅ 性能表现符合预期",
+            ])
         elif success_rate >= 75:
-            print(f"\n⚠️  Step 5 基本通过，但存在问题需要关注")
+            lines.append(f"\n⚠️  Step 5 基本通过，但存在问题需要关注")
         else:
-            print(f"\n❌ Step 5 失败，需要修复关键问题")
+            lines.append(f"\n❌ Step 5 失败，需要修复关键问题")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         return success_rate >= 75
 
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method_name",
+    [method_name for _, method_name in INTEGRATION_CHECKS],
+    ids=[method_name for _, method_name in INTEGRATION_CHECKS]
+)
+async def test_integration_check(method_name):
+    """
+    以pytest用例运行单项集成检查
+    
+    显式指定本文件时可被pytest收集，每项检查是独立用例，可用 -n 并行、--lf 只重跑失败项
+    """
+    test_suite = IntegrationTestSuite()
+    assert await getattr(test_suite, method_name)(), f"{method_name} 未通过"
+
+
 async def main():
     """主函数"""
     test_suite = IntegrationTestSuite()
@@ -2,14 +2,24 @@
 爬虫模块测试
 """
 import pytest
+import asyncio
+import os
+import sys
+import time
+import types
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 from typing import List
 
-from src.crawler.models import Platform, RawContent, ContentType, CrawlTask, CrawlResult
+from src.crawler.models import Platform, RawContent, ContentType, CrawlTask, CrawlResult, parse_count_string
 from src.crawler.platform_factory import PlatformFactory
 from src.crawler.crawler_manager import CrawlerManager
+from src.crawler import data_service
 from src.crawler.data_service import CrawlDataService
+from src.crawler import base_platform
+from src.crawler.base_platform import acquire_mediacrawler_workdir, release_mediacrawler_workdir
+from src.crawler.platforms.tieba_platform import TiebaPlatform
+from src.crawler.platforms.zhihu_platform import ZhihuPlatform
 
 
 class TestCrawlerModels:
@@ -58,6 +68,23 @@ class TestCrawlerModels:
         assert content.like_count == 15000
         assert content.comment_count == 500
     
+    @pytest.mark.parametrize("value, expected", [
+        ("1.2万", 12000),
+        ("3亿", 300000000),
+        ("5千", 5000),
+        ("10万+", 100000),
+        ("1,234", 1234),
+        (" 42 ", 42),
+        ("", 0),
+        ("万", 0),
+        ("abc", 0),
+        ("abc万", 0),
+        ("1.5", 0),
+    ])
+    def test_parse_count_string(self, value, expected):
+        """测试数量字符串解析"""
+        assert parse_count_string(value) == expected
+    
     def test_crawl_task_creation(self):
         """测试爬取任务创建"""
         task = CrawlTask(
@@ -146,6 +173,199 @@ class TestPlatformFactory:
             await PlatformFactory.create_platform(Platform.XHS)
 
 
+class TestMediaCrawlerWorkdirLock:
+    """MediaCrawler工作目录锁测试"""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_lock(self, monkeypatch):
+        """每个测试使用绑定当前事件循环的新锁"""
+        monkeypatch.setattr(base_platform, "_workdir_lock", asyncio.Lock())
+        monkeypatch.setattr(base_platform, "_workdir_owner", None)
+        monkeypatch.setattr(base_platform, "_workdir_depth", 0)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_crawls_never_overlap(self, tmp_path):
+        """测试并发爬取的切换目录区间互不重叠"""
+        active = 0
+        max_active = 0
+        
+        async def crawl(name):
+            nonlocal active, max_active
+            workdir = tmp_path / name
+            workdir.mkdir()
+            original_cwd = await acquire_mediacrawler_workdir()
+            try:
+                active += 1
+                max_active = max(max_active, active)
+                os.chdir(workdir)
+                # 同一任务内重入不会死锁
+                nested_cwd = await acquire_mediacrawler_workdir()
+                release_mediacrawler_workdir(nested_cwd)
+                await asyncio.sleep(0.01)
+                assert os.getcwd() == str(workdir)
+                active -= 1
+            finally:
+                release_mediacrawler_workdir(original_cwd)
+        
+        cwd = os.getcwd()
+        await asyncio.gather(*(crawl(f"crawl_{i}") for i in range(3)))
+        
+        assert max_active == 1
+        assert os.getcwd() == cwd
+    
+    @pytest.mark.asyncio
+    async def test_child_task_waits_for_lock(self):
+        """测试锁内创建的子任务不会继承父任务的持有状态"""
+        original_cwd = await acquire_mediacrawler_workdir()
+        try:
+            async def child():
+                child_cwd = await acquire_mediacrawler_workdir()
+                release_mediacrawler_workdir(child_cwd)
+            
+            child_task = asyncio.create_task(child())
+            await asyncio.sleep(0.01)
+            assert not child_task.done()
+        finally:
+            release_mediacrawler_workdir(original_cwd)
+        
+        await asyncio.wait_for(child_task, timeout=1)
+        assert not base_platform._workdir_lock.locked()
+    
+    @pytest.fixture
+    def tieba_platforms(self, tmp_path, monkeypatch):
+        """两个使用假MediaCrawler模块的贴吧平台实例，记录搜索请求的并发数"""
+        stats = types.SimpleNamespace(active=0, max_active=0)
+        
+        class FakeTiebaClient:
+            def __init__(self):
+                self.headers = {}
+            
+            async def get_notes_by_keyword(self, keyword, **kwargs):
+                assert not base_platform._workdir_lock.locked()
+                stats.active += 1
+                stats.max_active = max(stats.max_active, stats.active)
+                await asyncio.sleep(0.01)
+                stats.active -= 1
+                return []
+        
+        # 用假的MediaCrawler模块替换真实依赖
+        client_module = types.ModuleType("media_platform.tieba.client")
+        client_module.BaiduTieBaClient = FakeTiebaClient
+        field_module = types.ModuleType("media_platform.tieba.field")
+        field_module.SearchSortType = types.SimpleNamespace(TIME_DESC="time_desc")
+        field_module.SearchNoteType = types.SimpleNamespace(FIXED_THREAD="fixed_thread")
+        config_module = types.ModuleType("config")
+        config_module.COOKIES = ""
+        monkeypatch.setitem(sys.modules, "media_platform.tieba.client", client_module)
+        monkeypatch.setitem(sys.modules, "media_platform.tieba.field", field_module)
+        monkeypatch.setitem(sys.modules, "config", config_module)
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        monkeypatch.setenv("MEDIACRAWLER_PATH", str(tmp_path))
+        
+        platforms = []
+        for name in ("first", "second"):
+            workdir = tmp_path / name
+            workdir.mkdir()
+            platforms.append(TiebaPlatform({'mediacrawler_path': str(workdir)}))
+        return platforms, stats
+    
+    @pytest.mark.asyncio
+    async def test_search_requests_run_outside_lock(self, tieba_platforms):
+        """测试搜索请求在释放工作目录锁后进行，多个平台的网络请求可以并发"""
+        platforms, stats = tieba_platforms
+        
+        cwd = os.getcwd()
+        results = await asyncio.gather(*(
+            platform._search_with_complete_mediacrawler(['Web3', 'TGE'], max_count=10)
+            for platform in platforms
+        ))
+        
+        assert results == [[], []]
+        assert stats.max_active == 2
+        assert os.getcwd() == cwd
+        assert not base_platform._workdir_lock.locked()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_platform_crawls_overlap(self, tieba_platforms):
+        """测试按搜索接口的方式并发执行多个平台的完整爬取时，网络请求阶段相互重叠"""
+        platforms, stats = tieba_platforms
+        
+        cwd = os.getcwd()
+        results = await asyncio.gather(*(platform.crawl(['Web3'], max_count=10) for platform in platforms))
+        
+        assert results == [[], []]
+        assert stats.max_active == 2
+        assert os.getcwd() == cwd
+        assert not base_platform._workdir_lock.locked()
+
+
+class TestZhihuPlatform:
+    """知乎平台数据转换测试"""
+    
+    @pytest.fixture
+    def zhihu_platform(self):
+        """测试用知乎平台实例"""
+        return ZhihuPlatform()
+    
+    @pytest.mark.skipif(not hasattr(time, 'tzset'), reason="需要time.tzset切换本地时区")
+    def test_timestamps_across_dst(self, zhihu_platform, monkeypatch):
+        """测试时间戳按各自所处时段的本地时区偏移转换"""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            items = [
+                {'id': 'winter', 'title': '冬令时', 'created_time': 1704110400},    # 2024-01-01 12:00 UTC
+                {'id': 'summer', 'title': '夏令时', 'created_time': '1719835200'},  # 2024-07-01 12:00 UTC
+                {'id': 'fraction', 'title': '小数秒', 'created_time': 1719835200.5},
+            ]
+            
+            contents = [zhihu_platform._convert_to_raw_content(item, 'Web3') for item in items]
+            
+            assert [content.publish_time for content in contents] == [
+                datetime(2024, 1, 1, 7, 0),
+                datetime(2024, 7, 1, 8, 0),
+                datetime(2024, 7, 1, 8, 0, 0, 500000),
+            ]
+            assert zhihu_platform._convert_timestamp(None) is None
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+    
+    def test_source_keywords_subclasses(self, zhihu_platform):
+        """测试str/list子类的关键词同样转换为列表"""
+        class KeywordList(list):
+            pass
+        
+        class Keyword(str):
+            pass
+        
+        item = {'id': 'k1', 'title': '关键词'}
+        
+        assert zhihu_platform._convert_to_raw_content(item, KeywordList(['Web3', 'TGE'])).source_keywords == ['Web3', 'TGE']
+        assert zhihu_platform._convert_to_raw_content(item, Keyword('Web3')).source_keywords == ['Web3']
+        assert zhihu_platform._convert_to_raw_content(item, None).source_keywords == []
+    
+    @pytest.mark.asyncio
+    async def test_near_duplicate_index_per_crawl(self, zhihu_platform):
+        """测试近似重复检测只在单次爬取内生效"""
+        text = '这是一篇关于Web3项目TGE时间和代币经济模型的详细分析文章，内容足够长用于相似度计算。' * 3
+        items = [
+            {'id': 'a1', 'title': '原文', 'content': text, 'content_type': 'answer'},
+            {'id': 'a2', 'title': '转载', 'content': text + '转载', 'content_type': 'answer'},
+        ]
+        integration = AsyncMock()
+        integration.search_content = AsyncMock(return_value=items)
+        
+        with patch.object(zhihu_platform, '_get_mediacrawler_integration', AsyncMock(return_value=integration)), \
+                patch.object(zhihu_platform, 'filter_content', AsyncMock(side_effect=lambda contents: contents)):
+            first = await zhihu_platform.crawl(['Web3'], max_count=10)
+            second = await zhihu_platform.crawl(['Web3'], max_count=10)
+        
+        # 同一次爬取内的转载被跳过，后续爬取不受之前爬取结果影响
+        assert [content.content_id for content in first] == ['a1']
+        assert [content.content_id for content in second] == ['a1']
+
+
 class TestCrawlerManager:
     """爬虫管理器测试"""
     
@@ -233,24 +453,52 @@ class TestCrawlDataService:
         keyword_matches = service._get_keyword_matches(f"{content.title} {content.content}")
         assert len(keyword_matches) > 0  # 应该匹配到一些关键词
     
-    def test_classify_project_category(self):
-        """测试项目分类"""
+    @pytest.mark.asyncio
+    async def test_process_and_store_batch(self, monkeypatch):
+        """测试爬取结果整批写入，只提交一次，未新增的记录计为重复"""
+        session = AsyncMock()
+        create_many = AsyncMock(return_value=2)
+        monkeypatch.setattr(data_service, "get_db_session", AsyncMock(return_value=session))
+        monkeypatch.setattr(data_service.TGEProjectCRUD, "create_many", create_many)
+        monkeypatch.setattr(data_service.CrawlerLogCRUD, "create_log", AsyncMock())
         service = CrawlDataService()
         
-        # 测试DeFi分类
-        defi_data = {'cleaned_text': '这是一个DeFi去中心化金融项目'}
-        category = service._classify_project_category(defi_data)
-        assert category == 'DeFi'
+        contents = [
+            RawContent(
+                platform=Platform.XHS,
+                content_id=f"c{i}",
+                content_type=ContentType.TEXT,
+                title=f"{name}项目TGE公告",
+                content=f"{name}项目将于2025年1月15日进行代币发行",
+                raw_content=name,
+                author_id="author_test",
+                author_name="测试作者",
+                publish_time=datetime.utcnow(),
+                crawl_time=datetime.utcnow(),
+                source_url=f"https://test.com/{i}"
+            )
+            for i, name in enumerate(["ABC", "XYZ", "ABC", "QQQ"])
+        ]
+        result = CrawlResult(
+            task_id="task_batch",
+            platform=Platform.XHS,
+            contents=contents,
+            total_count=len(contents),
+            success_count=0,
+            execution_time=1.0,
+            keywords_used=["TGE"]
+        )
         
-        # 测试GameFi分类
-        gamefi_data = {'cleaned_text': '链游GameFi项目'}
-        category = service._classify_project_category(gamefi_data)
-        assert category == 'GameFi'
+        stats = await service.process_and_store_crawl_result(result)
         
-        # 测试其他分类
-        other_data = {'cleaned_text': '普通项目介绍'}
-        category = service._classify_project_category(other_data)
-        assert category == 'Other'
+        create_many.assert_awaited_once()
+        projects_data = create_many.await_args.args[1]
+        assert [data['source_url'] for data in projects_data] == [content.source_url for content in contents]
+        assert projects_data[0]['content_hash'] == projects_data[2]['content_hash']
+        assert stats['total_processed'] == 4
+        assert stats['successfully_saved'] == 2
+        assert stats['duplicates_skipped'] == 2
+        assert stats['errors'] == 0
 
 
 class MockXHSPlatform:
@@ -150,6 +150,111 @@ class TestTGEProjectCRUD:
         assert len(unprocessed) == 1
         assert unprocessed[0].project_name == test_tge_project_data["project_name"]
         assert unprocessed[0].is_processed is False
+    
+    @pytest.mark.asyncio
+    async def test_search_cache_invalidated_on_write(self, test_db, test_tge_project_data):
+        """测试写入后搜索结果缓存失效"""
+        items, total = await TGEProjectCRUD.search(test_db, "Test Token")
+        assert total == 0
+        
+        project = await TGEProjectCRUD.create(test_db, test_tge_project_data)
+        items, total = await TGEProjectCRUD.search(test_db, "Test Token")
+        assert total == 1
+        assert items[0].id == project.id
+    
+    @pytest.mark.asyncio
+    async def test_create_many_multiple_batches(self, test_db):
+        """测试批量创建超过单批INSERT行数的记录"""
+        from src.database.crud import BULK_INSERT_BATCH_SIZE
+        
+        count = BULK_INSERT_BATCH_SIZE * 2 + 7
+        projects_data = [
+            {
+                "project_name": f"Bulk Project {i}",
+                "content_hash": f"bulk_hash_{i}",
+                "raw_content": f"批量项目{i}",
+                "source_platform": "xhs"
+            }
+            for i in range(count)
+        ]
+        
+        inserted = await TGEProjectCRUD.create_many(test_db, projects_data)
+        
+        assert inserted == count
+        assert await TGEProjectCRUD.count_all(test_db) == count
+        assert await TGEProjectCRUD.get_by_content_hash(test_db, f"bulk_hash_{count - 1}") is not None
+    
+    @pytest.mark.asyncio
+    async def test_create_many_skips_duplicates(self, test_db, test_tge_project_data):
+        """测试批量创建时跳过库中已存在及批内重复的content_hash"""
+        await TGEProjectCRUD.create(test_db, test_tge_project_data)
+        
+        projects_data = [
+            dict(test_tge_project_data, project_name="Existing Hash"),
+            {"project_name": "New A", "content_hash": "new_hash_a", "raw_content": "A", "source_platform": "xhs"},
+            {"project_name": "New A Again", "content_hash": "new_hash_a", "raw_content": "A2", "source_platform": "xhs"},
+            {"project_name": "New B", "content_hash": "new_hash_b", "raw_content": "B", "source_platform": "xhs"},
+        ]
+        
+        inserted = await TGEProjectCRUD.create_many(test_db, projects_data)
+        
+        assert inserted == 2
+        assert await TGEProjectCRUD.count_all(test_db) == 3
+        project_a = await TGEProjectCRUD.get_by_content_hash(test_db, "new_hash_a")
+        assert project_a.project_name == "New A"
+        existing = await TGEProjectCRUD.get_by_content_hash(test_db, test_tge_project_data["content_hash"])
+        assert existing.project_name == test_tge_project_data["project_name"]
+    
+    @pytest.mark.asyncio
+    async def test_create_many_empty(self, test_db):
+        """测试空列表不执行写入"""
+        assert await TGEProjectCRUD.create_many(test_db, []) == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_paginated_with_total(self, test_db):
+        """测试分页查询在同一次查询中返回当前页和总数"""
+        await TGEProjectCRUD.create_many(test_db, [
+            {
+                "project_name": f"Page Project {i}",
+                "content_hash": f"page_hash_{i}",
+                "raw_content": f"分页项目{i}",
+                "source_platform": "xhs" if i < 4 else "weibo"
+            }
+            for i in range(5)
+        ])
+        
+        items, total = await TGEProjectCRUD.get_paginated(
+            test_db, page=1, size=2, sort_by="project_name", sort_order="asc"
+        )
+        assert total == 5
+        assert [item.project_name for item in items] == ["Page Project 0", "Page Project 1"]
+        
+        items, total = await TGEProjectCRUD.get_paginated(
+            test_db, page=3, size=2, sort_by="project_name", sort_order="asc"
+        )
+        assert total == 5
+        assert [item.project_name for item in items] == ["Page Project 4"]
+        
+        items, total = await TGEProjectCRUD.get_paginated(
+            test_db, page=1, size=10, filters={"source_platform": "xhs"}
+        )
+        assert total == 4
+        assert len(items) == 4
+    
+    @pytest.mark.asyncio
+    async def test_get_paginated_out_of_range(self, test_db, test_tge_project_data):
+        """测试页码超出范围时返回空列表和实际总数"""
+        await TGEProjectCRUD.create(test_db, test_tge_project_data)
+        
+        items, total = await TGEProjectCRUD.get_paginated(test_db, page=5, size=10)
+        assert items == []
+        assert total == 1
+        
+        items, total = await TGEProjectCRUD.get_paginated(
+            test_db, page=1, size=10, filters={"source_platform": "douyin"}
+        )
+        assert items == []
+        assert total == 0
 
 
 class TestCrawlerLogCRUD:
@@ -0,0 +1,244 @@
+"""
+工具模块测试
+"""
+import random
+import string
+
+import pytest
+
+from src.utils import deduplication
+from src.utils.deduplication import BloomFilter, DeduplicationService, MinHashLSH, _shingles
+from src.utils.text_processing import TextProcessor
+
+
+class FakeClock:
+    """可手动推进的时钟，替换去重模块中的time"""
+    
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+    
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """去重模块使用的可控时钟"""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(deduplication, "time", fake_clock)
+    return fake_clock
+
+
+def _hashes(*contents):
+    return [DeduplicationService.generate_content_hash(content) for content in contents]
+
+
+class TestDeduplicationService:
+    """去重服务测试"""
+    
+    def test_hash_ttl_expiry(self, clock):
+        """测试hash条目过期后同样内容视为新内容"""
+        service = DeduplicationService(bloom_bits_log2=10, hash_ttl_seconds=60)
+        content_hash, = _hashes("TGE公告")
+        
+        assert service.is_duplicate_by_hash(content_hash) is False
+        clock.now += 59
+        assert service.is_duplicate_by_hash(content_hash) is True
+        
+        # 重复命中会刷新出现时间
+        clock.now += 59
+        assert service.is_duplicate_by_hash(content_hash) is True
+        
+        clock.now += 60
+        assert service.is_duplicate_by_hash(content_hash) is False
+    
+    def test_lru_eviction(self, clock):
+        """测试超出容量时淘汰最久未见的hash"""
+        service = DeduplicationService(bloom_bits_log2=10, max_hashes=2)
+        first, second, third = _hashes("first", "second", "third")
+        
+        assert service.is_duplicate_by_hash(first) is False
+        assert service.is_duplicate_by_hash(second) is False
+        # 再次命中first，second成为最久未见的条目
+        assert service.is_duplicate_by_hash(first) is True
+        assert service.is_duplicate_by_hash(third) is False
+        
+        assert service.is_duplicate_by_hash(first) is True
+        assert service.is_duplicate_by_hash(third) is True
+        assert service.is_duplicate_by_hash(second) is False
+    
+    def test_bitmap_collisions_stay_exact(self, clock):
+        """测试位图冲突时由精确hash表排除误判"""
+        service = DeduplicationService(bloom_bits_log2=3)
+        content_hashes = _hashes(*(f"content {i}" for i in range(64)))
+        
+        assert not any(service.is_duplicate_by_hash(content_hash) for content_hash in content_hashes)
+        assert all(service.is_duplicate_by_hash(content_hash) for content_hash in content_hashes)
+    
+    def test_batch_matches_single(self, clock):
+        """测试批量检查与逐条检查结果一致"""
+        content_hashes = _hashes("a", "b", "a", "c", "b", "b", "d") + ["not-hex", "not-hex"]
+        
+        single_service = DeduplicationService(bloom_bits_log2=4, max_hashes=3)
+        batch_service = DeduplicationService(bloom_bits_log2=4, max_hashes=3)
+        expected = [single_service.is_duplicate_by_hash(content_hash) for content_hash in content_hashes]
+        
+        assert batch_service.is_duplicate_by_hash_many(content_hashes) == expected
+        assert expected == [False, False, True, False, True, True, False, False, True]
+    
+    def test_content_many_matches_single(self, clock, monkeypatch):
+        """测试批量内容检查与逐条内容检查结果一致"""
+        contents = ["TGE公告", "空投活动".encode('utf-8'), "TGE公告", "新项目", "空投活动"]
+        
+        monkeypatch.setattr(deduplication, "deduplication_service", DeduplicationService(bloom_bits_log2=10))
+        expected = [deduplication.is_duplicate_content(content) for content in contents]
+        
+        monkeypatch.setattr(deduplication, "deduplication_service", DeduplicationService(bloom_bits_log2=10))
+        assert deduplication.is_duplicate_content_many(contents) == expected
+        assert expected == [False, False, True, False, True]
+    
+    def test_cleanup_old_entries(self, clock):
+        """测试清理过期记录后旧内容不再视为重复，新内容仍被识别"""
+        service = DeduplicationService(bloom_bits_log2=10)
+        old_hash, new_hash = _hashes("old", "new")
+        
+        service.is_duplicate_by_hash(old_hash)
+        assert service.is_duplicate_by_project_time("OldProject") is False
+        clock.now += 8 * 86400
+        service.is_duplicate_by_hash(new_hash)
+        
+        service.cleanup_old_entries(days=7)
+        
+        assert service.is_duplicate_by_hash(new_hash) is True
+        assert service.is_duplicate_by_hash(old_hash) is False
+        assert service.is_duplicate_by_project_time("OldProject") is False
+
+
+def _jaccard(text1: str, text2: str, size: int = 5) -> float:
+    shingles1, shingles2 = _shingles(text1, size), _shingles(text2, size)
+    return len(shingles1 & shingles2) / len(shingles1 | shingles2)
+
+
+def _mutated_pairs(changed_chars: int, count: int = 20, length: int = 300):
+    """生成 (原文, 替换了若干字符的变体) 文本对，字符替换越多相似度越低"""
+    rng = random.Random(changed_chars)
+    for _ in range(count):
+        text = ''.join(rng.choice(string.ascii_lowercase) for _ in range(length))
+        chars = list(text)
+        for index in rng.sample(range(length), changed_chars):
+            chars[index] = rng.choice(string.ascii_uppercase)
+        yield text, ''.join(chars)
+
+
+class TestBloomFilter:
+    """布隆过滤器测试"""
+    
+    def test_no_false_negatives(self):
+        """测试已添加的元素一定命中"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"id-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        
+        assert all(item in bloom for item in items)
+    
+    def test_false_positive_rate_within_bound(self):
+        """测试容量内的误判率不超过设定值的两倍"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"id-{i}")
+        
+        false_positives = sum(f"other-{i}" in bloom for i in range(20000))
+        assert false_positives / 20000 <= 0.02
+
+
+class TestMinHashLSH:
+    """MinHash LSH测试"""
+    
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.8])
+    def test_optimal_bands(self, threshold):
+        """测试分段方式覆盖全部签名且阈值接近目标相似度"""
+        bands, rows = MinHashLSH._optimal_bands(threshold, 128)
+        
+        assert bands * rows == 128
+        assert abs((1 / bands) ** (1 / rows) - threshold) < 0.1
+    
+    def test_similar_texts_are_candidates(self):
+        """测试相似度明显高于阈值的文本被检出"""
+        for text, variant in _mutated_pairs(changed_chars=3):
+            assert _jaccard(text, variant) >= 0.9
+            lsh = MinHashLSH(threshold=0.7)
+            lsh.insert("original", lsh.signature(text))
+            assert lsh.query(lsh.signature(variant)) == {"original"}
+    
+    def test_dissimilar_texts_are_not_candidates(self):
+        """测试相似度明显低于阈值的文本不被检出"""
+        for text, variant in _mutated_pairs(changed_chars=60):
+            assert _jaccard(text, variant) <= 0.3
+            lsh = MinHashLSH(threshold=0.7)
+            lsh.insert("original", lsh.signature(text))
+            assert lsh.query(lsh.signature(variant)) == set()
+    
+    def test_empty_text_signature(self):
+        """测试空文本生成固定签名，不会抛出异常"""
+        lsh = MinHashLSH(threshold=0.7, num_perm=16)
+        
+        assert lsh.signature("") == tuple([MinHashLSH._MAX_HASH] * 16)
+
+
+class TestTGEInfoExtraction:
+    """TGE信息提取测试"""
+    
+    @pytest.fixture
+    def processor(self):
+        return TextProcessor()
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("项目将于2025年1月15日TGE", "2025年1月15日"),   # date0
+        ("3月5日开始TGE", "3月5日"),                      # date1
+        ("TGE on 2025-02-01", "2025-02-01"),             # date2
+        ("TGE时间 2025/3/4", "2025/3/4"),                 # date3
+        ("1月2日预热，正式TGE在2025年3月4日", "2025年3月4日"),  # 后出现的高优先级模式优先
+        ("暂无时间", None),
+    ])
+    def test_tge_date(self, processor, text, expected):
+        """测试TGE日期各模式及优先级"""
+        assert processor.extract_tge_info(text)['tge_date'] == expected
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("关注 $ABC 的空投", "ABC"),                   # symbol0
+        ("XYZ代币即将上线", "XYZ"),                     # symbol1
+        ("FOO Token launch", "FOO"),                   # symbol2
+        ("ABCDE Token 和 $QQ", "QQ"),                   # 后出现的高优先级模式优先
+        ("没有代币符号", None),
+    ])
+    def test_token_symbol(self, processor, text, expected):
+        """测试代币符号各模式及优先级"""
+        assert processor.extract_tge_info(text)['token_symbol'] == expected
+    
+    @pytest.mark.parametrize("text, expected", [
+        # “总供应量…”“发行…”模式已移除，不再额外产生不带单位后缀的重复数量
+        ("$ABC总供应量1亿枚", ["1亿枚"]),
+        ("XYZ代币发行10万个", ["10万个"]),
+        ("分3期释放2.5万枚", ["3", "2.5万枚"]),
+    ])
+    def test_amounts(self, processor, text, expected):
+        """测试数量提取"""
+        assert processor.extract_tge_info(text)['amounts'] == expected
+    
+    def test_combined_fields(self, processor):
+        """测试一次提取全部字段"""
+        info = processor.extract_tge_info("ABC项目将于2025年1月15日TGE，$ABC总供应量1亿枚")
+        
+        assert info == {
+            'tge_date': '2025年1月15日',
+            'token_symbol': 'ABC',
+            'amounts': ['2025', '1', '15', '1亿枚'],
+            'project_name': 'ABC'
+        }
+    
+    def test_empty_text(self, processor):
+        """测试空文本"""
+        assert processor.extract_tge_info("") == {
+            'tge_date': None, 'token_symbol': None, 'amounts': [], 'project_name': None
+        }
@@ -59,7 +59,7 @@ async def test_mediacrawler_integration():
             return False
         
         # 清理资源
-        integration.cleanup()
+        await integration.cleanup()
         print("✅ 资源清理完成")
         
         return True
@@ -112,7 +112,7 @@ async def test_zhihu_platform():
             return False
         
         # 清理资源
-        platform.cleanup()
+        await platform.aclose()
         print("✅ 平台资源清理完成")
         
         return True
@@ -176,7 +176,7 @@ async def test_data_format_compatibility():
         print("✅ 数据格式兼容性测试通过")
         
         # 清理资源
-        platform.cleanup()
+        await platform.aclose()
         
         return True
         
@@ -211,7 +211,7 @@ async def test_error_handling():
             print("⚠️ 无效ID意外返回了结果")
         
         # 清理资源
-        platform.cleanup()
+        await platform.aclose()
         
         return True
         
@@ -283,7 +283,7 @@ class ZhihuMediaCrawlerIntegrationTester:
         
         # 清理资源
         try:
-            await self.platform.cleanup()
+            await self.platform.aclose()
             logger.info("测试资源清理完成")
         except Exception as e:
             logger.warning(f"清理资源时出错: {e}")